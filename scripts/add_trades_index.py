@@ -30,7 +30,7 @@ def main():
         cursor.execute("""
             CREATE INDEX IF NOT EXISTS idx_trades_status_created 
             ON trades(status, created_at DESC) 
-            WHERE status = 'OPEN'
+            WHERE status = 1  -- TradeStatus.OPEN
         """)
         
         # Also create index on paper_trading for filtering
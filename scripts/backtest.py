@@ -33,9 +33,11 @@ async def run_backtest(start_date: datetime, end_date: datetime, initial_capital
     settings = get_settings()
     model_config = ModelConfig.from_file()
 
-    async with PolymarketDataSource(settings.polymarket_api_url) as polymarket:
+    async with (
+        PolymarketDataSource(settings.polymarket_api_url) as polymarket,
+        DataAggregator(polymarket=polymarket) as data_aggregator,
+    ):
         # Initialize components
-        data_aggregator = DataAggregator(polymarket=polymarket)
         feature_pipeline = FeaturePipeline()
 
         # Load models (would load from disk in production)
@@ -37,10 +37,11 @@ async def check_available_data():
             print(f"Checking {label}...", end=" ", flush=True)
             
             try:
-                markets = await pm.fetch_resolved_markets(start_date, end_date, limit=10000)
+                # Only outcome counts are needed here - use the bulk DataFrame parser
+                markets = await pm.fetch_resolved_markets_frame(start_date, end_date, limit=10000)
                 
-                yes_count = sum(1 for m in markets if m.outcome == "YES")
-                no_count = sum(1 for m in markets if m.outcome == "NO")
+                yes_count = int((markets["outcome"] == "YES").sum())
+                no_count = int((markets["outcome"] == "NO").sum())
                 
                 results.append({
                     "label": label,
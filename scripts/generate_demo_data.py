@@ -12,6 +12,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from src.database.connection import get_db
+from src.database.portfolio_views import refresh_portfolio_daily
 from src.database.models import Signal, Trade, PortfolioSnapshot, Prediction
 from sqlalchemy import select, func, desc
 from src.utils.logging import configure_logging, get_logger
@@ -147,6 +148,8 @@ async def main():
     await generate_demo_signals()
     await generate_demo_trades()
     await generate_demo_portfolio()
+    # The debounced refresh would not outlive asyncio.run(); refresh now
+    await refresh_portfolio_daily()
     
     logger.info("Demo data generation complete!")
 
@@ -17,8 +17,9 @@ from src.features.pipeline import FeaturePipeline
 from src.models.ensemble import EnsembleModel, EnsemblePrediction
 from src.models.xgboost_model import XGBoostProbabilityModel
 from src.models.lightgbm_model import LightGBMProbabilityModel
-from src.database.connection import AsyncSessionLocal, get_db
-from src.database.models import Market as DBMarket, Prediction, Signal, Trade, PortfolioSnapshot
+from src.database.connection import AsyncSessionLocal, bulk_insert, get_db
+from src.database.portfolio_views import refresh_portfolio_daily
+from src.database.models import Market as DBMarket, FeatureSnapshot, Prediction, Signal, Trade, PortfolioSnapshot
 from src.trading.signal_generator import SignalGenerator
 from src.utils.logging import configure_logging, get_logger
 from src.utils.async_utils import batch_process
@@ -71,42 +72,31 @@ async def load_models():
     return ensemble
 
 
-async def save_market_to_db(market, db):
-    """Save or update market in database."""
-    from sqlalchemy import select
-    
-    # Check if market exists
-    result = await db.execute(select(DBMarket).where(DBMarket.market_id == market.id))
-    db_market = result.scalar_one_or_none()
-    
-    if not db_market:
+async def save_markets_to_db(markets, db):
+    """Insert or update markets in one multi-row upsert on market_id."""
+    rows = {}
+    for market in markets:
         # Convert timezone-aware datetime to naive for database
-        resolution_date = None
-        if market.resolution_date:
-            if market.resolution_date.tzinfo is not None:
-                resolution_date = market.resolution_date.replace(tzinfo=None)
-            else:
-                resolution_date = market.resolution_date
-        
-        db_market = DBMarket(
-            market_id=market.id,
-            condition_id=market.condition_id,
-            question=market.question,
-            category=market.category,
-            resolution_date=resolution_date,
-            outcome=market.outcome,
-        )
-        db.add(db_market)
-        try:
-            await db.commit()
-            await db.refresh(db_market)
-            logger.debug("Market saved to database", market_id=market.id)
-        except Exception as e:
-            await db.rollback()
-            logger.error("Failed to save market", market_id=market.id, error=str(e))
-            raise
+        resolution_date = market.resolution_date.replace(tzinfo=None) if market.resolution_date else None
+        rows[market.id] = {
+            "market_id": market.id,
+            "condition_id": market.condition_id,
+            "question": market.question,
+            "category": market.category,
+            "resolution_date": resolution_date,
+            "outcome": market.outcome,
+        }
     
-    return db_market
+    # Existing markets refresh their metadata; outcome is left to resolution handling
+    await bulk_insert(
+        db,
+        DBMarket,
+        list(rows.values()),
+        conflict_cols=["market_id"],
+        update_cols=["question", "category", "resolution_date"],
+    )
+    await db.commit()
+    logger.debug("Markets saved to database", count=len(rows))
 
 
 async def save_prediction_to_db(market, prediction: EnsemblePrediction, model_predictions: dict, db, signal_generator=None, auto_create_trades=False):
@@ -236,8 +226,7 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
     
     # Initialize components
     settings = get_settings()
-    async with PolymarketDataSource() as polymarket:
-        data_aggregator = DataAggregator(polymarket=polymarket)
+    async with PolymarketDataSource() as polymarket, DataAggregator(polymarket=polymarket) as data_aggregator:
         feature_pipeline = FeaturePipeline()
         
         # Get active markets
@@ -253,6 +242,15 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
             logger.error("Database not configured - cannot generate predictions")
             return
         
+        # Save all markets first (one upsert) so predictions/snapshots satisfy their FK
+        async with AsyncSessionLocal() as db:
+            try:
+                await save_markets_to_db(markets, db)
+            except Exception as e:
+                await db.rollback()
+                logger.error("Failed to save markets", count=len(markets), error=str(e))
+                return
+        
         # Process markets in batches to improve performance and avoid timeouts
         # Use smaller batches to prevent database session exhaustion
         batch_size = min(5, limit)  # Process 5 markets at a time
@@ -260,15 +258,14 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
         signals_created = 0
         trades_created = 0
         cache_hits = 0
+        # Feature snapshots are written in one batch after all markets are processed
+        feature_rows = []
         
         async def process_single_market(market):
             """Process a single market - extracted for parallel processing."""
             # Create new database session for each market to avoid session exhaustion
             async with AsyncSessionLocal() as db:
                 try:
-                    # Save market to database first
-                    await save_market_to_db(market, db)
-                    
                     # Check cache first
                     current_price = float(market.yes_price)
                     resolution_date = market.resolution_date
@@ -304,6 +301,11 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
                     
                     # Generate features
                     features = await feature_pipeline.generate_features(market, data)
+                    feature_rows.append({
+                        "market_id": market.id,
+                        "snapshot_time": features.timestamp.replace(tzinfo=None),
+                        "features": {name: float(value) for name, value in features.features.items()},
+                    })
                     
                     # Get feature names
                     feature_names = feature_pipeline.get_feature_names()
@@ -371,6 +373,22 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
             signals_created += signal_count
             trades_created += trade_count
         
+        # Persist feature snapshots (markets were saved above, so the FK holds)
+        if feature_rows:
+            async with AsyncSessionLocal() as db:
+                try:
+                    await bulk_insert(
+                        db,
+                        FeatureSnapshot,
+                        feature_rows,
+                        conflict_cols=["market_id", "snapshot_time"],
+                    )
+                    await db.commit()
+                    logger.info("Feature snapshots saved", count=len(feature_rows))
+                except Exception as e:
+                    await db.rollback()
+                    logger.warning("Failed to save feature snapshots", error=str(e))
+        
         # Update portfolio snapshot if we created trades (single session for this)
         if trades_created > 0:
             async with AsyncSessionLocal() as db:
@@ -378,6 +396,8 @@ async def generate_predictions(limit: int = 10, auto_generate_signals: bool = Tr
                     await update_portfolio_snapshot(db)
                 except Exception as e:
                     logger.warning("Failed to update portfolio snapshot", error=str(e))
+            # Don't rely on the debounced refresh: this process may exit first
+            await refresh_portfolio_daily()
         
         # Get cache stats
         cache_stats = cache.get_cache_stats()
@@ -249,7 +249,8 @@ async def verify_whale_data(db_url):
         
         # Get top 5 whales
         top_whales = await conn.fetch("""
-            SELECT rank, wallet_address, total_volume, win_rate, total_profit
+            SELECT rank, '0x' || encode(wallet_address, 'hex') AS wallet_address,
+                   total_volume, win_rate, total_profit
             FROM whale_wallets
             WHERE is_active = true
             ORDER BY rank ASC
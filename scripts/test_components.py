@@ -55,8 +55,7 @@ async def test_data_sources():
 
     # Test Data Aggregator
     print("\n3. Testing Data Aggregator...")
-    async with PolymarketDataSource() as polymarket:
-        aggregator = DataAggregator(polymarket=polymarket)
+    async with PolymarketDataSource() as polymarket, DataAggregator(polymarket=polymarket) as aggregator:
         markets = await polymarket.fetch_active_markets(limit=1)
         if markets:
             market = markets[0]
@@ -101,11 +100,10 @@ async def test_feature_pipeline():
     print("   ✅ Feature pipeline initialized")
 
     # Get a market and data
-    async with PolymarketDataSource() as polymarket:
+    async with PolymarketDataSource() as polymarket, DataAggregator(polymarket=polymarket) as aggregator:
         markets = await polymarket.fetch_active_markets(limit=1)
         if markets:
             market = markets[0]
-            aggregator = DataAggregator(polymarket=polymarket)
             data = await aggregator.fetch_all_for_market(market)
 
             print(f"\nGenerating features for: {market.question[:50]}...")
@@ -221,6 +219,34 @@ async def test_trading_modules():
     print(f"   Total value: ${portfolio.total_value:.2f}")
 
 
+async def test_trade_price_expressions():
+    """Test that SQL trade price expressions hold typical prices."""
+    print("\n" + "=" * 60)
+    print("TESTING TRADE PRICE EXPRESSIONS")
+    print("=" * 60)
+
+    import operator
+    from decimal import Decimal
+
+    from sqlalchemy.dialects import postgresql
+    from sqlalchemy.sql.elements import Cast
+
+    from src.database.models import PRICE_SCALE, Trade, _to_price_units
+
+    for name in ("entry_price", "exit_price"):
+        expr = getattr(Trade, name).__clause_element__()
+        sql = str((getattr(Trade, name) > 0.5).compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        ))
+        # Units must be divided before the NUMERIC(p, s) cast, or any price >= 0.01 overflows
+        assert isinstance(expr, Cast), f"{name}: expected an outer CAST, got {sql}"
+        precision, scale = expr.type.precision, expr.type.scale
+        price = Decimal(_to_price_units("0.5")) / PRICE_SCALE
+        assert len(str(int(price))) <= precision - scale, f"{name}: 0.5 does not fit NUMERIC({precision}, {scale})"
+        assert expr.clause.operator is operator.truediv, f"{name}: micro-units cast before dividing: {sql}"
+        print(f"   ✅ {name}: {sql}")
+
+
 async def test_risk_management():
     """Test risk management modules."""
     print("\n" + "=" * 60)
@@ -282,6 +308,7 @@ async def main():
         await test_feature_pipeline()
         await test_ml_models()
         await test_trading_modules()
+        await test_trade_price_expressions()
         await test_risk_management()
 
         print("\n" + "=" * 60)
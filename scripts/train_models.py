@@ -65,8 +65,7 @@ async def main():
     # Initialize components
     settings = get_settings()
     # Use CLOB API URL (not the old API URL)
-    async with PolymarketDataSource() as polymarket:
-        data_aggregator = DataAggregator(polymarket=polymarket)
+    async with PolymarketDataSource() as polymarket, DataAggregator(polymarket=polymarket) as data_aggregator:
         feature_pipeline = FeaturePipeline()
 
         # Create trainer
@@ -1,5 +1,6 @@
 """FastAPI application for trading bot API."""
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 from datetime import datetime, timezone
@@ -31,6 +32,16 @@ try:
 except ImportError:
     ai_analysis_endpoints = None
 
+try:
+    from ..database.analytics_cache import run_analytics_sweeper
+except ImportError:
+    run_analytics_sweeper = None
+
+try:
+    from ..data.sources.rss_news import close_shared_session as close_rss_session
+except ImportError:
+    close_rss_session = None
+
 logger = get_logger(__name__)
 settings = get_settings()
 
@@ -45,10 +56,15 @@ async def lifespan(app: FastAPI):
         logger.info("Database initialized successfully")
     except Exception as e:
         logger.warning("Database initialization failed (this is OK if DB is not set up yet)", error=str(e))
+    sweeper = asyncio.create_task(run_analytics_sweeper()) if run_analytics_sweeper else None
     logger.info("API server starting...")
     yield
     # Shutdown
     logger.info("API server shutting down...")
+    if sweeper:
+        sweeper.cancel()
+    if close_rss_session:
+        await close_rss_session()
 
 
 app = FastAPI(
@@ -424,9 +440,10 @@ async def get_markets(
     limit: int = Query(default=100, ge=1, le=1000),
     offset: int = Query(default=0, ge=0),
     outcome: Optional[str] = Query(default=None),
+    search: Optional[str] = Query(default=None, max_length=200),
     db: AsyncSession = Depends(get_db),
 ):
-    """Get list of markets with prices from latest predictions."""
+    """Get list of markets with prices from latest predictions, optionally matching search keywords."""
     try:
         from sqlalchemy.orm import joinedload
         
@@ -443,6 +460,8 @@ async def get_markets(
         
         if outcome:
             query = query.where(Market.outcome == outcome.upper())
+        if search:
+            query = query.where(Market.search_tsv.match(search, postgresql_regconfig="english"))
         
         query = query.order_by(desc(Market.created_at)).limit(limit).offset(offset)
         
@@ -469,9 +488,10 @@ async def get_markets(
                 .subquery()
             )
             
-            # Join to get the actual prediction rows
+            # Join to get the latest price; both reads are index-only on
+            # idx_predictions_market_time_cover
             predictions_query = (
-                select(Prediction)
+                select(Prediction.market_id, Prediction.market_price)
                 .join(
                     latest_pred_times,
                     (Prediction.market_id == latest_pred_times.c.market_id) &
@@ -480,7 +500,7 @@ async def get_markets(
             )
             
             pred_result = await db.execute(predictions_query)
-            predictions_dict = {p.market_id: p for p in pred_result.scalars().all()}
+            predictions_dict = {p.market_id: p for p in pred_result.all()}
         else:
             predictions_dict = {}
         
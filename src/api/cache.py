@@ -9,6 +9,7 @@ Falls back to in-memory cache if Redis is unavailable.
 import json
 import time
 import hashlib
+from dataclasses import asdict, is_dataclass
 from datetime import datetime, date
 from decimal import Decimal
 from functools import wraps
@@ -35,6 +36,9 @@ class CacheJSONEncoder(json.JSONEncoder):
             return obj.isoformat()
         if isinstance(obj, Decimal):
             return float(obj)
+        if is_dataclass(obj) and not isinstance(obj, type):
+            # Slotted dataclasses (e.g. Market) have no __dict__
+            return asdict(obj)
         if hasattr(obj, '__dict__'):
             return obj.__dict__
         # Try to convert to string as last resort
@@ -91,6 +95,9 @@ def make_json_serializable(obj: Any) -> Any:
     if isinstance(obj, (list, tuple)):
         return [make_json_serializable(item) for item in obj]
     
+    if is_dataclass(obj) and not isinstance(obj, type):
+        return make_json_serializable(asdict(obj))
+    
     if hasattr(obj, '__dict__'):
         return make_json_serializable(obj.__dict__)
     
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, desc
 
+from ...database.analytics_cache import get_cached_analytics, set_cached_analytics
 from ...database.connection import get_db
 from ...database.models import Market, Prediction, Signal, Trade, PortfolioSnapshot
 from ...utils.logging import get_logger
@@ -14,6 +15,21 @@ logger = get_logger(__name__)
 
 router = APIRouter(prefix="/ai", tags=["ai-analysis"])
 
+# Page explanations are re-read on every page view but only drift slowly
+_EXPLAIN_TTL = 300
+
+
+async def _cached_explanation(db: AsyncSession, key: str) -> Optional[dict]:
+    """Get a cached explanation payload (memory, Redis, then analytics_cache)."""
+    return await get_cached_analytics(db, f"ai_explain:{key}")
+
+
+async def _cache_explanation(db: AsyncSession, key: str, payload: dict) -> dict:
+    """Cache an explanation payload for _EXPLAIN_TTL seconds and return it."""
+    await set_cached_analytics(db, f"ai_explain:{key}", payload, _EXPLAIN_TTL)
+    await db.commit()
+    return payload
+
 
 @router.get("/explain/predictions")
 async def explain_predictions(
@@ -30,6 +46,10 @@ async def explain_predictions(
     - How to use the information
     """
     try:
+        cached = await _cached_explanation(db, f"predictions:{min(limit, 5)}")
+        if cached is not None:
+            return cached
+
         # Get sample predictions for context
         result = await db.execute(
             select(Prediction)
@@ -50,7 +70,7 @@ async def explain_predictions(
         # Generate explanation (cost-effective: use simple template, not expensive API)
         explanation = _generate_predictions_explanation(predictions, total_predictions, avg_edge)
         
-        return {
+        return await _cache_explanation(db, f"predictions:{min(limit, 5)}", {
             "page": "Predictions",
             "explanation": explanation,
             "summary": {
@@ -58,7 +78,7 @@ async def explain_predictions(
                 "average_edge": float(avg_edge) if avg_edge else 0.0,
                 "sample_count": len(predictions),
             },
-        }
+        })
     except Exception as e:
         logger.error("Failed to generate predictions explanation", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate explanation: {str(e)}")
@@ -71,6 +91,10 @@ async def explain_signals(
 ):
     """Explain the signals page."""
     try:
+        cached = await _cached_explanation(db, f"signals:{min(limit, 5)}")
+        if cached is not None:
+            return cached
+
         result = await db.execute(
             select(Signal)
             .order_by(desc(Signal.created_at))
@@ -89,7 +113,7 @@ async def explain_signals(
         
         explanation = _generate_signals_explanation(signals, total_signals, strong_signals)
         
-        return {
+        return await _cache_explanation(db, f"signals:{min(limit, 5)}", {
             "page": "Signals",
             "explanation": explanation,
             "summary": {
@@ -97,7 +121,7 @@ async def explain_signals(
                 "strong_signals": strong_signals,
                 "sample_count": len(signals),
             },
-        }
+        })
     except Exception as e:
         logger.error("Failed to generate signals explanation", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate explanation: {str(e)}")
@@ -110,6 +134,10 @@ async def explain_trades(
 ):
     """Explain the trades page."""
     try:
+        cached = await _cached_explanation(db, f"trades:{min(limit, 5)}")
+        if cached is not None:
+            return cached
+
         result = await db.execute(
             select(Trade)
             .order_by(desc(Trade.entry_time))
@@ -127,7 +155,7 @@ async def explain_trades(
         
         explanation = _generate_trades_explanation(trades, total_trades, open_trades)
         
-        return {
+        return await _cache_explanation(db, f"trades:{min(limit, 5)}", {
             "page": "Trades",
             "explanation": explanation,
             "summary": {
@@ -135,7 +163,7 @@ async def explain_trades(
                 "open_trades": open_trades,
                 "sample_count": len(trades),
             },
-        }
+        })
     except Exception as e:
         logger.error("Failed to generate trades explanation", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate explanation: {str(e)}")
@@ -145,6 +173,10 @@ async def explain_trades(
 async def explain_portfolio(db: AsyncSession = Depends(get_db)):
     """Explain the portfolio page."""
     try:
+        cached = await _cached_explanation(db, "portfolio")
+        if cached is not None:
+            return cached
+
         result = await db.execute(
             select(PortfolioSnapshot)
             .order_by(desc(PortfolioSnapshot.snapshot_time))
@@ -154,14 +186,14 @@ async def explain_portfolio(db: AsyncSession = Depends(get_db)):
         
         explanation = _generate_portfolio_explanation(portfolio)
         
-        return {
+        return await _cache_explanation(db, "portfolio", {
             "page": "Portfolio",
             "explanation": explanation,
             "summary": {
                 "has_portfolio": portfolio is not None,
                 "total_value": float(portfolio.total_value) if portfolio else 0.0,
             },
-        }
+        })
     except Exception as e:
         logger.error("Failed to generate portfolio explanation", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate explanation: {str(e)}")
@@ -174,6 +206,10 @@ async def explain_markets(
 ):
     """Explain the markets page."""
     try:
+        cached = await _cached_explanation(db, f"markets:{min(limit, 5)}")
+        if cached is not None:
+            return cached
+
         result = await db.execute(
             select(Market)
             .order_by(desc(Market.created_at))
@@ -186,14 +222,14 @@ async def explain_markets(
         
         explanation = _generate_markets_explanation(markets, total_markets)
         
-        return {
+        return await _cache_explanation(db, f"markets:{min(limit, 5)}", {
             "page": "Markets",
             "explanation": explanation,
             "summary": {
                 "total_markets": total_markets,
                 "sample_count": len(markets),
             },
-        }
+        })
     except Exception as e:
         logger.error("Failed to generate markets explanation", error=str(e))
         raise HTTPException(status_code=500, detail=f"Failed to generate explanation: {str(e)}")
@@ -76,12 +76,14 @@ class MarketResponse(BaseModel):
 async def get_upcoming_events(
     days: int = Query(default=30, ge=1, le=365),
     event_types: Optional[str] = Query(default=None),
+    search: Optional[str] = Query(default=None, max_length=200),
     db: AsyncSession = Depends(get_db)
 ) -> List[EventResponse]:
     """
     Get upcoming economic events.
     
-    Returns events within the specified number of days.
+    Returns events within the specified number of days, optionally only those
+    whose name or description matches the search keywords.
     """
     try:
         calendar = EconomicCalendar(db)
@@ -90,7 +92,7 @@ async def get_upcoming_events(
         if event_types:
             types_list = [t.strip() for t in event_types.split(',')]
         
-        events = await calendar.get_upcoming_events(days=days, event_types=types_list)
+        events = await calendar.get_upcoming_events(days=days, event_types=types_list, search=search)
         
         return [EventResponse(
             id=e['id'],
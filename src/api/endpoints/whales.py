@@ -151,13 +151,17 @@ async def get_whale_alerts(
     Returns alerts for large whale trades.
     """
     try:
-        from ...database.models import WhaleAlert, WhaleWallet, WhaleTrade
+        from ...database.models import WhaleAlert
         from sqlalchemy import select
+        from sqlalchemy.orm import contains_eager
         
-        query = select(WhaleAlert, WhaleWallet, WhaleTrade).join(
-            WhaleWallet, WhaleAlert.whale_id == WhaleWallet.id
+        # Fill alert.whale / alert.trade from the joins instead of their selectin loads
+        query = select(WhaleAlert).join(
+            WhaleAlert.whale
         ).join(
-            WhaleTrade, WhaleAlert.trade_id == WhaleTrade.id
+            WhaleAlert.trade
+        ).options(
+            contains_eager(WhaleAlert.whale), contains_eager(WhaleAlert.trade)
         ).where(
             WhaleAlert.user_id == user_id
         )
@@ -168,10 +172,10 @@ async def get_whale_alerts(
         query = query.order_by(WhaleAlert.created_at.desc()).limit(limit)
         
         result = await db.execute(query)
-        rows = result.all()
         
         alerts = []
-        for alert, whale, trade in rows:
+        for alert in result.scalars().all():
+            whale, trade = alert.whale, alert.trade
             alerts.append({
                 "id": alert.id,
                 "whale_rank": whale.rank,
@@ -34,6 +34,16 @@ class Settings(BaseSettings):
     postgres_db: str = Field(default="polymarket_trader")
     postgres_user: str = Field(default="postgres")
     postgres_password: str = Field(default="")
+    # Connection pool (per process)
+    db_pool_size: int = Field(default=20)
+    db_max_overflow: int = Field(default=30)
+    db_pool_recycle: int = Field(default=1800)  # seconds
+    db_pool_timeout: int = Field(default=30)  # seconds to wait for a free connection
+    db_statement_timeout_ms: int = Field(default=30000)
+    # asyncpg prepared-statement caches (per connection). Set DB_PGBOUNCER_TRANSACTION_MODE
+    # when connecting through pgbouncer in transaction mode, which cannot use them.
+    db_statement_cache_size: int = Field(default=2048)
+    db_pgbouncer_transaction_mode: bool = Field(default=False)
     
     @field_validator('postgres_port', mode='before')
     @classmethod
@@ -71,6 +81,7 @@ class Settings(BaseSettings):
     twitter_api_secret: Optional[str] = None
     twitter_access_token: Optional[str] = None
     twitter_access_token_secret: Optional[str] = None
+    twitter_bearer_token: Optional[str] = None
     reddit_client_id: Optional[str] = None
     reddit_client_secret: Optional[str] = None
     reddit_user_agent: str = Field(default="polymarket-ai-trader/0.1.0")
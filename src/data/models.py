@@ -7,9 +7,12 @@ from typing import Dict, List, Optional
 import numpy as np
 
 
-@dataclass
+@dataclass(slots=True)
 class Market:
-    """Polymarket market data."""
+    """Polymarket market data.
+
+    Slotted: market lists can hold thousands of instances per poll.
+    """
 
     id: str
     condition_id: str
@@ -25,9 +28,12 @@ class Market:
     resolved_at: Optional[datetime] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class NewsArticle:
-    """News article data."""
+    """News article data.
+
+    Slotted: RSS fetches build articles directly, one per feed item.
+    """
 
     title: str
     description: str
@@ -39,9 +45,12 @@ class NewsArticle:
     confidence: Optional[float] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SocialPost:
-    """Social media post (Twitter/Reddit)."""
+    """Social media post (Twitter/Reddit).
+
+    Slotted: fetches build one instance per matching post.
+    """
 
     id: str
     platform: str  # "twitter" or "reddit"
@@ -78,7 +87,7 @@ class WhaleTrade:
     is_smart_money: bool = False  # Based on historical accuracy
 
 
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Current market state."""
 
@@ -0,0 +1,78 @@
+"""Small on-disk TTL cache for slow, rarely-changing API pulls."""
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import orjson
+
+from ...utils.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class FileCache:
+    """
+    JSON file cache keyed by an arbitrary string, with per-entry TTL by file age.
+
+    Values must be orjson-serializable. Cache errors never propagate: a failed
+    read is a miss and a failed write is logged and ignored.
+    """
+
+    def __init__(self, directory: Path, ttl: float = 86400):
+        """
+        Initialize file cache.
+
+        Args:
+            directory: Directory to store cache files in (created on first write)
+            ttl: Default time-to-live in seconds
+        """
+        self.directory = Path(directory)
+        self.ttl = ttl
+
+    def _path(self, key: str) -> Path:
+        """Map a cache key to its file path."""
+        digest = hashlib.md5(key.encode()).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    def get(self, key: str, ttl: Optional[float] = None) -> Optional[Any]:
+        """
+        Get a cached value if present and not expired.
+
+        Args:
+            key: Cache key
+            ttl: Override the default TTL for this lookup
+
+        Returns:
+            Cached value or None on miss/expiry
+        """
+        path = self._path(key)
+        try:
+            age = time.time() - path.stat().st_mtime
+            if age > (self.ttl if ttl is None else ttl):
+                return None
+            return orjson.loads(path.read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug("File cache read failed", key=key, error=str(e))
+            return None
+
+    def set(self, key: str, value: Any) -> None:
+        """
+        Store a value, replacing any existing entry atomically.
+
+        Args:
+            key: Cache key
+            value: orjson-serializable value
+        """
+        path = self._path(key)
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_bytes(orjson.dumps(value))
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.debug("File cache write failed", key=key, error=str(e))
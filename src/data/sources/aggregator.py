@@ -45,6 +45,7 @@ class DataAggregator:
             use_rss: Use RSS feeds instead of NewsAPI (default: True for free option)
         """
         self.polymarket = polymarket or PolymarketDataSource()
+        self._owns_polymarket = polymarket is None
         self.use_rss = use_rss
         if use_rss:
             self.rss_news = rss_news or RSSNewsDataSource()
@@ -53,7 +54,33 @@ class DataAggregator:
             self.news = news or NewsDataSource()
             self.rss_news = None
         self.twitter = twitter or TwitterDataSource()
+        self._owns_twitter = twitter is None
         self.reddit = reddit or RedditDataSource()
+        self._owns_reddit = reddit is None
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    async def close(self):
+        """Close the HTTP sessions of the sources this aggregator created (injected ones are the caller's)."""
+        owned = [
+            source
+            for source, owns in (
+                (self.reddit, self._owns_reddit),
+                (self.twitter, self._owns_twitter),
+                (self.polymarket, self._owns_polymarket),
+            )
+            if owns
+        ]
+        results = await asyncio.gather(*(source.close() for source in owned), return_exceptions=True)
+        for source, result in zip(owned, results):
+            if isinstance(result, Exception):
+                logger.warning("Failed to close data source", source=type(source).__name__, error=str(result))
 
     def extract_keywords(self, text: str) -> List[str]:
         """
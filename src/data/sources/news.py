@@ -8,6 +8,7 @@ from newsapi import NewsApiClient
 
 from ..models import NewsArticle
 from ...config.settings import get_settings
+from ...utils.datetime_utils import parse_iso_datetime
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
@@ -148,7 +149,7 @@ class NewsDataSource(DataSource):
         if not date_str:
             return datetime.utcnow()
         try:
-            return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
+            return parse_iso_datetime(date_str)
+        except (ValueError, TypeError):
             return datetime.utcnow()
 
@@ -1,23 +1,275 @@
 """Polymarket data source using py-clob-client and Gamma API."""
 
+from dataclasses import replace
 from datetime import datetime, timezone, timedelta
-from typing import List, Optional, Dict
-import aiohttp
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, AsyncIterator, Awaitable, Callable, List, Optional, Dict, Set
 import asyncio
+import httpx
+import orjson
+import time
 
 from py_clob_client.client import ClobClient
 from py_clob_client.constants import POLYGON
 
 from ..models import Market, MarketData
+from ._cache import FileCache
 from ...config.settings import get_settings
-from ...utils.logging import get_logger
+from ...utils.logging import get_logger, is_debug_enabled
+from ...utils.datetime_utils import parse_iso_datetime
 from ...utils.retry import retry
 
+try:
+    import h2  # noqa: F401 - enables httpx HTTP/2 support
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+try:
+    import simdjson
+    SIMDJSON_AVAILABLE = True
+except ImportError:
+    SIMDJSON_AVAILABLE = False
+
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = get_logger(__name__)
 
+# Volume field variants, in the same priority order as _parse_market
+_VOLUME_FIELDS = ("volume24hr", "volume24h", "volume_24h", "volume24H", "volumeUSD", "volume_usd", "volume")
+_LIQUIDITY_FIELDS = ("liquidity", "totalLiquidity", "total_liquidity")
+
+# How long a fetched /markets listing (and its ID index) is reused
+_MARKETS_CACHE_TTL = 30.0
+
+# Resolved markets change rarely; training pulls are cached on disk for a day
+_RESOLVED_CACHE_TTL = 86400.0
+
+
+class _AsyncByteReader:
+    """Async file-like adapter over an httpx byte stream, as expected by ijson's *_async readers."""
+
+    def __init__(self, chunks: AsyncIterator[bytes]):
+        self._chunks = chunks.__aiter__()
+
+    async def read(self, size: int = -1) -> bytes:
+        if size == 0:
+            # ijson probes the stream type with read(0); don't consume a chunk
+            return b""
+        # ijson treats b"" as EOF, so skip any empty chunks the transport yields
+        async for chunk in self._chunks:
+            if chunk:
+                return chunk
+        return b""
+
+
+class MidpointBatcher:
+    """
+    DataLoader-style coalescing of midpoint lookups.
+
+    Calls to load() made within a short window are collected (duplicates
+    share one request) and dispatched together through a batch fetch
+    function; each caller then gets its own result.
+    """
+
+    def __init__(self, fetch_batch: Callable[[List[str]], Awaitable[dict]], window: float = 0.005):
+        """
+        Initialize batcher.
+
+        Args:
+            fetch_batch: Coroutine function mapping a list of token IDs to {token_id: midpoint}
+            window: Seconds to collect requests before dispatching a batch
+        """
+        self._fetch_batch = fetch_batch
+        self._window = window
+        self._pending: Dict[str, List[asyncio.Future]] = {}
+        self._flush_task: Optional[asyncio.Task] = None
+        self._inflight: Set[asyncio.Task] = set()
+
+    async def load(self, token_id: str) -> Optional[float]:
+        """
+        Get the midpoint for a token, batched with other concurrent loads.
+
+        Args:
+            token_id: Token / market ID
+
+        Returns:
+            Midpoint or None if unavailable
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.setdefault(token_id, []).append(future)
+        if self._flush_task is None:
+            self._flush_task = loop.create_task(self._flush())
+            # Keep a reference until the batch completes
+            self._inflight.add(self._flush_task)
+            self._flush_task.add_done_callback(self._inflight.discard)
+        return await future
+
+    async def _flush(self) -> None:
+        """Wait out the collection window, then dispatch and resolve one batch."""
+        await asyncio.sleep(self._window)
+        pending, self._pending = self._pending, {}
+        self._flush_task = None
+
+        try:
+            results = await self._fetch_batch(list(pending))
+        except Exception as e:
+            for futures in pending.values():
+                for future in futures:
+                    if not future.done():
+                        future.set_exception(e)
+            return
+
+        for token_id, futures in pending.items():
+            midpoint = results.get(token_id)
+            for future in futures:
+                if not future.done():
+                    future.set_result(midpoint)
+
+
+_BINARY_UPPER = ("YES", "NO")
+
+
+def _resolve_binary_tokens(tokens: tuple, closed: bool) -> tuple:
+    """
+    Outcome and prices for a two-token market (the common case), unrolled.
+
+    Tokens labelled NO/YES (in that order) are swapped; any other pair is read
+    as (YES, NO) by position. The outcome is set only for closed markets with
+    a winner: by label when either raw label is exactly YES/NO, else by position.
+
+    Args:
+        tokens: Pair of (outcome, price, winner)
+        closed: Whether the market is closed
+
+    Returns:
+        Tuple of (outcome, yes_price, no_price)
+    """
+    (outcome0, price0, winner0), (outcome1, price1, winner1) = tokens
+    upper0 = outcome0.upper()
+    upper1 = outcome1.upper()
+
+    outcome = None
+    if closed and (winner0 or winner1):
+        if outcome0 in _BINARY_UPPER or outcome1 in _BINARY_UPPER:
+            outcome = "YES" if (upper0 if winner0 else upper1) == "YES" else "NO"
+        else:
+            outcome = "YES" if winner0 else "NO"
+
+    if upper0 == "NO" and upper1 == "YES":
+        return outcome, float(price1), float(price0)
+    return outcome, float(price0), float(price1)
+
+
+def _resolve_generic_tokens(tokens: tuple) -> tuple:
+    """
+    Prices for markets without exactly two tokens.
+
+    Only binary markets resolve to YES/NO, so the outcome is always None.
+
+    Args:
+        tokens: Tuple of (outcome, price, winner) per token
+
+    Returns:
+        Tuple of (None, yes_price, no_price)
+    """
+    if len(tokens) == 1:
+        # Single token - assume it's YES
+        yes_price = float(tokens[0][1])
+        return None, yes_price, 1.0 - yes_price
+
+    yes_price = None
+    no_price = None
+    for token_outcome, price, _ in tokens:
+        label = token_outcome.upper()
+        if label == "YES":
+            if yes_price is None:
+                yes_price = price
+        elif label == "NO":
+            if no_price is None:
+                no_price = price
+    if yes_price is None or no_price is None:
+        return None, 0.0, 0.0
+    return None, float(yes_price), float(no_price)
+
+
+@lru_cache(maxsize=4096)
+def _build_market(
+    condition_id: str,
+    question: str,
+    category: Optional[str],
+    closed: bool,
+    end_date_iso: Optional[str],
+    tokens: tuple,
+    volume_24h,
+    liquidity,
+) -> Market:
+    """
+    Build a Market from the hashable projection made by PolymarketDataSource._parse_market.
+
+    The arguments cover every input the parse depends on, so entries never go
+    stale; the LRU bound keeps memory flat across polls. Callers must copy the
+    result before mutating it.
+
+    Args:
+        tokens: Tuple of (outcome, price, winner) per token
+
+    Returns:
+        Market object (shared, do not mutate)
+    """
+    # Specialize on token count: binary markets are the common case
+    if len(tokens) == 2:
+        outcome, yes_price, no_price = _resolve_binary_tokens(tokens, closed)
+    else:
+        outcome, yes_price, no_price = _resolve_generic_tokens(tokens)
+
+    # Parse dates (offset-less values, e.g. date-only, are UTC as in _parse_markets_bulk)
+    resolution_date = None
+    if end_date_iso:
+        try:
+            resolution_date = parse_iso_datetime(end_date_iso)
+        except (ValueError, TypeError):
+            pass
+        else:
+            if resolution_date.tzinfo is None:
+                resolution_date = resolution_date.replace(tzinfo=timezone.utc)
+
+    # For resolved markets, use end_date_iso as resolved_at if closed
+    resolved_at = None
+    if closed and resolution_date:
+        resolved_at = resolution_date
+
+    return Market(
+        id=condition_id,
+        condition_id=condition_id,
+        question=question,
+        category=category,
+        resolution_date=resolution_date,
+        outcome=outcome,
+        yes_price=yes_price,
+        no_price=no_price,
+        volume_24h=float(volume_24h),
+        liquidity=float(liquidity),
+        created_at=None,  # Not available in get_markets() response
+        resolved_at=resolved_at,
+    )
+
 
 class PolymarketDataSource:
-    """Fetch market data from Polymarket using py-clob-client."""
+    """
+    Fetch market data from Polymarket.
+
+    Public CLOB reads (markets, midpoints, order books) go through a shared
+    pooled httpx client; py-clob-client is kept for signed endpoints.
+    """
 
     def __init__(
         self,
@@ -38,29 +290,75 @@ class PolymarketDataSource:
         self.gamma_api_url = "https://gamma-api.polymarket.com"  # Gamma API for volume data
         self.private_key = private_key or settings.polymarket_private_key
         self.chain_id = chain_id
+        self._gamma_client: Optional[httpx.AsyncClient] = None
+        self._http: Optional[httpx.AsyncClient] = None
+
+        # Markets listing cache: list plus condition_id/question_id/id -> row index
+        self._markets_cache: Optional[List[dict]] = None
+        self._markets_index: Dict[str, dict] = {}
+        self._markets_loaded_at = 0.0
+        self._markets_lock = asyncio.Lock()
+
+        # Coalesces concurrent single-market midpoint lookups into batches
+        self._midpoints = MidpointBatcher(self._get_midpoints_batch)
+
+        # Reusable SIMD JSON parser for filtered listing pulls (optional accelerator)
+        self._json_parser = simdjson.Parser() if SIMDJSON_AVAILABLE else None
 
-        # Initialize ClobClient
+        # On-disk cache of raw resolved-market rows for training pulls
+        self._file_cache = FileCache(settings.data_dir / "cache" / "polymarket", ttl=_RESOLVED_CACHE_TTL)
+
+        # ClobClient construction (and credential derivation) makes blocking network
+        # calls, so it is deferred to _ensure_client() and run off the event loop
+        self.client: Optional[ClobClient] = None
+        self._client_lock = asyncio.Lock()
+
+    def _create_client(self) -> ClobClient:
+        """
+        Build the py-clob-client instance (blocking; run via _ensure_client).
+
+        Returns:
+            Authenticated ClobClient if a private key is configured, else read-only
+        """
         # For read-only operations, we don't need private key
         if self.private_key:
             try:
-                self.client = ClobClient(
+                client = ClobClient(
                     self.api_url,
                     key=self.private_key,
                     chain_id=self.chain_id,
                 )
                 # Set API credentials if needed for authenticated endpoints
                 try:
-                    self.client.set_api_creds(self.client.create_or_derive_api_creds())
+                    client.set_api_creds(client.create_or_derive_api_creds())
                 except Exception as e:
                     logger.debug("Could not set API credentials", error=str(e))
                     # Continue with read-only access
+                return client
             except Exception as e:
                 logger.warning("Failed to initialize authenticated client, using read-only", error=str(e))
-                self.client = ClobClient(self.api_url)
-        else:
-            # Read-only client (no authentication needed for fetching markets)
-            self.client = ClobClient(self.api_url)
-            logger.info("Initialized read-only ClobClient", api_url=self.api_url)
+                return ClobClient(self.api_url)
+
+        # Read-only client (no authentication needed for fetching markets)
+        client = ClobClient(self.api_url)
+        logger.info("Initialized read-only ClobClient", api_url=self.api_url)
+        return client
+
+    async def _ensure_client(self) -> ClobClient:
+        """
+        Get the py-clob-client instance, creating it in a worker thread on first use.
+
+        Public reads go through the httpx client and never need this; it is
+        for signed (order) endpoints.
+
+        Returns:
+            ClobClient instance
+        """
+        if self.client is None:
+            async with self._client_lock:
+                if self.client is None:
+                    self.client = await asyncio.to_thread(self._create_client)
+        return self.client
 
     async def __aenter__(self):
         """Async context manager entry."""
@@ -68,7 +366,180 @@ class PolymarketDataSource:
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        pass
+        await self.close()
+
+    def _get_gamma_client(self) -> httpx.AsyncClient:
+        """Get or create the shared Gamma API client (HTTP/2 multiplexed when available)."""
+        if self._gamma_client is None or self._gamma_client.is_closed:
+            self._gamma_client = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+            )
+        return self._gamma_client
+
+    def _get_http(self) -> httpx.AsyncClient:
+        """
+        Get or create the shared CLOB REST client.
+
+        Connections are kept alive and, with h2 installed, multiplexed over
+        HTTP/2, so only the first request pays the TCP+TLS handshake. The SSL
+        context (CA bundle) is built once per client and reused across requests.
+        """
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=HTTP2_AVAILABLE,
+                base_url=self.api_url,
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100),
+            )
+        return self._http
+
+    async def close(self):
+        """Clean up resources"""
+        if self._gamma_client is not None and not self._gamma_client.is_closed:
+            await self._gamma_client.aclose()
+        self._gamma_client = None
+        if self._http is not None and not self._http.is_closed:
+            await self._http.aclose()
+        self._http = None
+
+    async def _clob_get(self, path: str, params: Optional[dict] = None, timeout: float = 30) -> Optional[Any]:
+        """
+        GET a public (unauthenticated) CLOB REST endpoint.
+
+        Args:
+            path: Endpoint path, e.g. "/markets"
+            params: Query parameters
+            timeout: Total request timeout in seconds
+
+        Returns:
+            Decoded JSON body, or None if the resource does not exist (404)
+
+        Raises:
+            httpx.HTTPStatusError: For other non-2xx responses
+        """
+        response = await self._get_http().get(path, params=params, timeout=timeout)
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return orjson.loads(response.content)
+
+    async def _fetch_clob_markets(self) -> Optional[List[dict]]:
+        """
+        Fetch the CLOB markets listing (async equivalent of ClobClient.get_markets()).
+
+        Returns:
+            List of market dicts, or None if the response format is unexpected
+        """
+        markets_data = await self._clob_get("/markets")
+
+        if isinstance(markets_data, dict) and "data" in markets_data:
+            return markets_data["data"]
+        if isinstance(markets_data, list):
+            return markets_data
+        logger.warning("Unexpected CLOB markets data format", data_type=type(markets_data))
+        return None
+
+    async def _stream_clob_markets(self, predicate: Callable[[dict], bool]) -> Optional[List[dict]]:
+        """
+        Stream the CLOB markets listing, keeping only rows that match predicate.
+
+        Used by the resolved-market pulls, which keep a small subset and do
+        not need the shared listing cache. When pysimdjson is installed the
+        body is parsed with SIMD into lazy proxies and only matching rows are
+        converted to dicts. Otherwise rows are decoded one at a time with ijson
+        and rejected rows are dropped immediately, so neither the raw body nor
+        the full listing is held in memory. Without either, falls back to a
+        buffered fetch filtered afterwards.
+
+        Args:
+            predicate: Row filter applied as each market is decoded
+
+        Returns:
+            List of matching market dicts, or None if the listing is unavailable
+        """
+        if self._json_parser is not None:
+            response = await self._get_http().get("/markets", timeout=30)
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+
+            # predicate only touches a few fields, so skipped rows are never materialized.
+            # The proxies must not outlive this call: the parser reuses its buffer on the next parse.
+            doc = self._json_parser.parse(response.content)
+            rows = doc.get("data") if isinstance(doc, simdjson.Object) else doc
+            if not isinstance(rows, simdjson.Array):
+                logger.warning("Unexpected CLOB markets data format", data_type=type(rows))
+                return None
+            return [row.as_dict() for row in rows if predicate(row)]
+
+        if not IJSON_AVAILABLE:
+            markets_list = await self._fetch_clob_markets()
+            if markets_list is None:
+                return None
+            return [item for item in markets_list if predicate(item)]
+
+        async with self._get_http().stream("GET", "/markets", timeout=30) as response:
+            if response.status_code == 404:
+                return None
+            response.raise_for_status()
+
+            rows = []
+            reader = _AsyncByteReader(response.aiter_bytes())
+            async for item in ijson.items_async(reader, "data.item", use_float=True):
+                if predicate(item):
+                    rows.append(item)
+            return rows
+
+    def _markets_cache_fresh(self) -> bool:
+        """Whether the cached markets listing is within its TTL"""
+        return (
+            self._markets_cache is not None
+            and time.monotonic() - self._markets_loaded_at < _MARKETS_CACHE_TTL
+        )
+
+    async def _load_markets(self) -> tuple[Optional[List[dict]], Dict[str, dict]]:
+        """
+        Get the CLOB markets listing and its ID index, fetching at most once per TTL.
+
+        The index maps condition_id, question_id and id to the market row so
+        lookups by any of them are a single dict probe.
+
+        Returns:
+            Tuple of (markets list or None if the response was unexpected, index)
+        """
+        async with self._markets_lock:
+            if self._markets_cache_fresh():
+                return self._markets_cache, self._markets_index
+
+            markets_list = await self._fetch_clob_markets()
+            if markets_list is None:
+                return None, {}
+
+            index: Dict[str, dict] = {}
+            for market_data in markets_list:
+                for key in (market_data.get("condition_id"), market_data.get("question_id"), market_data.get("id")):
+                    if key and key not in index:
+                        index[key] = market_data
+
+            self._markets_cache = markets_list
+            self._markets_index = index
+            self._markets_loaded_at = time.monotonic()
+            return markets_list, index
+
+    async def _get_order_book(self, token_id: str) -> Optional[dict]:
+        """
+        Fetch the order book for a token (async equivalent of ClobClient.get_order_book()).
+
+        Args:
+            token_id: Token ID
+
+        Returns:
+            Order book dict with "bids"/"asks", or None if not found
+        """
+        orderbook = await self._clob_get("/book", params={"token_id": token_id})
+        return orderbook if isinstance(orderbook, dict) else None
     
     async def _get_midpoints_batch(
         self, 
@@ -78,7 +549,8 @@ class PolymarketDataSource:
         """
         Fetch midpoints for multiple tokens with batching and error handling.
         
-        Uses aiohttp for async concurrent requests instead of individual py-clob-client calls.
+        Uses the shared CLOB client for async concurrent requests instead of
+        individual py-clob-client calls.
         
         Args:
             token_ids: List of token IDs to fetch
@@ -91,37 +563,31 @@ class PolymarketDataSource:
             return {}
         
         results = {}
+        client = self._get_http()
         
         # Process in batches to avoid overwhelming API
         for i in range(0, len(token_ids), batch_size):
             batch = token_ids[i:i + batch_size]
             
-            # Fetch batch concurrently using aiohttp
+            # Fetch batch concurrently over the pooled connection(s)
             async def fetch_single_midpoint(token_id: str) -> tuple:
                 """Fetch single midpoint with error handling"""
                 try:
-                    async with aiohttp.ClientSession() as session:
-                        url = f"{self.api_url}/midpoint"
-                        params = {"token_id": token_id}
-                        async with session.get(
-                            url,
-                            params=params,
-                            timeout=aiohttp.ClientTimeout(total=5),
-                        ) as response:
-                            if response.status == 404:
-                                # This is normal - not all markets have midpoint data
-                                return (token_id, None)
-                            
-                            if response.status == 200:
-                                data = await response.json()
-                                midpoint = data.get('mid') or data.get('midpoint')
-                                if midpoint is not None:
-                                    return (token_id, float(midpoint))
-                            
-                            # Other status codes - log but don't fail
-                            return (token_id, None)
-                            
-                except asyncio.TimeoutError:
+                    response = await client.get("/midpoint", params={"token_id": token_id}, timeout=5)
+                    if response.status_code == 404:
+                        # This is normal - not all markets have midpoint data
+                        return (token_id, None)
+                    
+                    if response.status_code == 200:
+                        data = orjson.loads(response.content)
+                        midpoint = data.get('mid') or data.get('midpoint')
+                        if midpoint is not None:
+                            return (token_id, float(midpoint))
+                    
+                    # Other status codes - log but don't fail
+                    return (token_id, None)
+                    
+                except httpx.TimeoutException:
                     logger.debug("Midpoint request timeout (expected)", token_id=token_id[:20])
                     return (token_id, None)
                 except Exception as e:
@@ -175,37 +641,32 @@ class PolymarketDataSource:
                 )
                 return []
             
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.gamma_api_url}/markets"
-                params = {
-                    "limit": limit,
-                    "active": "true",
-                    "closed": "false",
-                    "order": "volume24hr",
-                    "ascending": "false",
-                }
-                logger.debug("Fetching from Gamma API", url=url, params=params)
-                async with session.get(
-                    url,
-                    params=params,
-                    timeout=aiohttp.ClientTimeout(total=30),
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        # Gamma API might return list directly or wrapped
-                        if isinstance(data, list):
-                            logger.debug("Gamma API returned list", count=len(data))
-                            return data
-                        elif isinstance(data, dict) and "data" in data:
-                            logger.debug("Gamma API returned dict with data", count=len(data.get("data", [])))
-                            return data["data"]
-                        else:
-                            logger.warning("Unexpected Gamma API response format", data_type=type(data), keys=list(data.keys()) if isinstance(data, dict) else None)
-                            return []
-                    else:
-                        error_text = await response.text()
-                        logger.warning("Gamma API request failed", status=response.status, error=error_text[:200])
-                        return []
+            client = self._get_gamma_client()
+            url = f"{self.gamma_api_url}/markets"
+            params = {
+                "limit": limit,
+                "active": "true",
+                "closed": "false",
+                "order": "volume24hr",
+                "ascending": "false",
+            }
+            logger.debug("Fetching from Gamma API", url=url, params=params)
+            response = await client.get(url, params=params)
+            if response.status_code == 200:
+                data = orjson.loads(response.content)
+                # Gamma API might return list directly or wrapped
+                if isinstance(data, list):
+                    logger.debug("Gamma API returned list", count=len(data))
+                    return data
+                elif isinstance(data, dict) and "data" in data:
+                    logger.debug("Gamma API returned dict with data", count=len(data.get("data", [])))
+                    return data["data"]
+                else:
+                    logger.warning("Unexpected Gamma API response format", data_type=type(data), keys=list(data.keys()) if isinstance(data, dict) else None)
+                    return []
+            else:
+                logger.warning("Gamma API request failed", status=response.status_code, error=response.text[:200])
+                return []
         except RateLimitExceeded as e:
             logger.warning("Gamma API rate limit exceeded, continuing without volume data", error=str(e))
             return []
@@ -224,37 +685,32 @@ class PolymarketDataSource:
         Returns:
             Market object or None if not found
         """
+        # Coerce once at the boundary; IDs in API payloads are already strings
+        market_id = str(market_id)
+
         try:
-            # Try to get full market details using get_market()
+            # Cheapest: a fresh cached listing already knows this market
+            if self._markets_cache_fresh():
+                market_data = self._markets_index.get(market_id)
+                if market_data:
+                    return self._parse_market(market_data)
+
+            # Try to get full market details from /markets/{id}
             try:
-                market_data = self.client.get_market(market_id)
+                market_data = await self._clob_get(f"/markets/{market_id}")
                 if market_data:
                     return self._parse_market(market_data)
             except Exception as e:
-                logger.debug("get_market() failed, trying get_markets()", market_id=market_id, error=str(e))
+                logger.debug("Market lookup failed, searching markets listing", market_id=market_id, error=str(e))
 
-            # Fallback: search through all markets
-            markets_data = self.client.get_markets()
-            
-            if isinstance(markets_data, dict) and "data" in markets_data:
-                markets_list = markets_data["data"]
-            elif isinstance(markets_data, list):
-                markets_list = markets_data
-            else:
-                logger.warning("Unexpected markets data format", data_type=type(markets_data))
+            # Fallback: look up the market by ID or condition ID in the indexed listing
+            markets_list, markets_index = await self._load_markets()
+            if markets_list is None:
                 return None
 
-            # Find market by ID or condition ID
-            for market_data in markets_list:
-                condition_id = str(market_data.get("condition_id", ""))
-                question_id = str(market_data.get("question_id", ""))
-                
-                if (
-                    condition_id == market_id
-                    or question_id == market_id
-                    or str(market_data.get("id", "")) == market_id
-                ):
-                    return self._parse_market(market_data)
+            market_data = markets_index.get(market_id)
+            if market_data:
+                return self._parse_market(market_data)
 
             logger.debug("Market not found", market_id=market_id)
             return None
@@ -274,8 +730,12 @@ class PolymarketDataSource:
         Returns:
             List of active markets
         """
+        # Evaluate once: debug payloads below are only built when they will be emitted
+        debug_enabled = is_debug_enabled()
+
         try:
             # 1. Try to fetch markets from Gamma API for volume and other metadata
+            gamma_markets_data = []
             gamma_markets_map = {}
             try:
                 gamma_markets_data = await self._fetch_gamma_markets(limit=limit * 2)  # Fetch more to increase match chances
@@ -286,22 +746,16 @@ class PolymarketDataSource:
                 logger.warning("Gamma API fetch failed, continuing without volume data", error=str(e))
 
             # 2. Fetch markets from CLOB API for real-time prices and order book
-            markets_data = self.client.get_markets()
-
-            if isinstance(markets_data, dict) and "data" in markets_data:
-                clob_markets_list = markets_data["data"]
-            elif isinstance(markets_data, list):
-                clob_markets_list = markets_data
-            else:
-                logger.warning("Unexpected CLOB markets data format", data_type=type(markets_data))
+            clob_markets_list, _ = await self._load_markets()
+            if clob_markets_list is None:
                 return []
 
             logger.info("Fetched CLOB markets", count=len(clob_markets_list))
             
             # Log sample markets from both APIs for debugging
-            if clob_markets_list and len(clob_markets_list) > 0:
+            if debug_enabled and clob_markets_list:
                 sample_clob = clob_markets_list[0]
-                logger.info("Sample CLOB market structure", 
+                logger.debug("Sample CLOB market structure",
                            condition_id_snake=sample_clob.get('condition_id', 'N/A')[:20] if sample_clob.get('condition_id') else None,
                            condition_id_camel=sample_clob.get('conditionId', 'N/A')[:20] if sample_clob.get('conditionId') else None,
                            id_field=sample_clob.get('id', 'N/A')[:20] if sample_clob.get('id') else None,
@@ -312,7 +766,7 @@ class PolymarketDataSource:
                            archived=sample_clob.get('archived'),
                            all_keys=list(sample_clob.keys()))
             
-            if gamma_markets_data and len(gamma_markets_data) > 0:
+            if debug_enabled and gamma_markets_data:
                 sample_gamma = gamma_markets_data[0]
                 logger.debug("Sample Gamma market",
                            id=sample_gamma.get('id', 'N/A')[:20],
@@ -324,7 +778,10 @@ class PolymarketDataSource:
             parse_failed = 0
             outcome_filtered = 0
             no_market_id = 0
-            
+            gamma_match_count = 0
+            now = datetime.now(timezone.utc)
+            stale_cutoff = now - timedelta(days=30)
+
             for item in clob_markets_list:
                 # CLOB API may use 'condition_id' (snake_case) or 'conditionId' (camelCase)
                 # Also check for 'id' or 'question_id'
@@ -348,22 +805,13 @@ class PolymarketDataSource:
                                      sample_item=dict(list(item.items())[:5]))
                     continue
 
-                # Merge volume data from Gamma API if available (try both id and conditionId)
-                gamma_market_item = gamma_markets_map.get(market_id) or gamma_markets_map.get(condition_id)
-                if gamma_market_item:
-                    # Merge volume data from Gamma API into the CLOB market item
-                    item['volume24hr'] = gamma_market_item.get('volume24hr', 0.0)
-                    item['liquidity'] = gamma_market_item.get('liquidity', 0.0)
-                    item['volume'] = gamma_market_item.get('volume', 0.0)  # Total volume
-                    logger.debug("Merged volume data from Gamma API", market_id=market_id[:20], volume24hr=item.get('volume24hr', 0.0))
-
-                # Filter for valid markets
+                # Filter for valid markets - cheapest checks first, before merging or parsing
                 # 1. Filter out archived markets (completely removed from platform)
                 is_archived = item.get("archived", False)
                 if is_archived:
                     strict_filtered += 1
-                    if strict_filtered <= 5:  # Log first few to debug
-                        logger.debug("Market filtered - archived", 
+                    if debug_enabled and strict_filtered <= 5:  # Log first few to debug
+                        logger.debug("Market filtered - archived",
                                    market_id=market_id[:20],
                                    archived=is_archived)
                     continue
@@ -373,36 +821,46 @@ class PolymarketDataSource:
                 if end_date_str:
                     try:
                         # Parse ISO date string
-                        if end_date_str.endswith('Z'):
-                            end_date_str = end_date_str.replace('Z', '+00:00')
-                        end_date = datetime.fromisoformat(end_date_str)
+                        end_date = parse_iso_datetime(end_date_str)
                         # Use UTC if timezone-naive
                         if end_date.tzinfo is None:
                             end_date = end_date.replace(tzinfo=timezone.utc)
                         # RELAXED: Only filter markets that ended >30 days ago (not just 1 day)
                         # This allows recently resolved markets to be shown
-                        now = datetime.now(timezone.utc)
-                        if end_date < (now - timedelta(days=30)):
+                        if end_date < stale_cutoff:
                             strict_filtered += 1
-                            if strict_filtered <= 5:
-                                logger.debug("Market filtered - ended long ago", 
+                            if debug_enabled and strict_filtered <= 5:
+                                logger.debug("Market filtered - ended long ago",
                                            market_id=market_id[:20],
                                            end_date=end_date_str,
                                            days_ago=(now - end_date).days)
                             continue
                     except (ValueError, TypeError) as e:
                         # If date parsing fails, log but don't filter (might be valid market)
-                        logger.debug("Could not parse end_date", market_id=market_id[:20], end_date=end_date_str, error=str(e))
-                
-                # 3. Parse market object
+                        if debug_enabled:
+                            logger.debug("Could not parse end_date", market_id=market_id[:20], end_date=end_date_str, error=str(e))
+
+                # 3. Merge volume data from Gamma API if available (try both id and conditionId)
+                gamma_market_item = gamma_markets_map.get(market_id) or gamma_markets_map.get(condition_id)
+                if gamma_market_item:
+                    # Merge volume data from Gamma API into the CLOB market item
+                    item['volume24hr'] = gamma_market_item.get('volume24hr', 0.0)
+                    item['liquidity'] = gamma_market_item.get('liquidity', 0.0)
+                    item['volume'] = gamma_market_item.get('volume', 0.0)  # Total volume
+                    if debug_enabled:
+                        logger.debug("Merged volume data from Gamma API", market_id=market_id[:20], volume24hr=item['volume24hr'])
+
+                # 4. Parse market object
                 market = self._parse_market(item)
                 if not market:
                     parse_failed += 1
-                    if parse_failed <= 3:
+                    if debug_enabled and parse_failed <= 3:
                         logger.debug("Market parse failed", market_id=market_id[:20], item_keys=list(item.keys())[:10])
                     continue
-                    
-                # 4. RELAXED: Don't filter out resolved markets - they still have valuable data
+                if gamma_market_item:
+                    gamma_match_count += 1
+
+                # 5. RELAXED: Don't filter out resolved markets - they still have valuable data
                 # Only filter if explicitly requested (for training data, we want resolved markets)
                 # For active trading, resolved markets can still be shown for historical analysis
                 # REMOVED: if market.outcome: continue
@@ -412,6 +870,9 @@ class PolymarketDataSource:
                 if len(markets) >= limit:
                     break
 
+            # Live midpoints for the markets we are returning, fetched as one concurrent batch
+            await self.enrich_midpoints(markets)
+
             logger.info("Filter results", 
                        total_clob=len(clob_markets_list),
                        no_market_id=no_market_id,
@@ -430,28 +891,29 @@ class PolymarketDataSource:
                              no_market_id=no_market_id)
                 
                 # Log first few markets that were filtered to understand why
-                sample_count = 0
-                for item in clob_markets_list[:10]:
-                    market_id = (
-                        item.get('condition_id') or 
-                        item.get('conditionId') or 
-                        item.get('id') or 
-                        item.get('question_id') or
-                        item.get('questionId')
-                    )
-                    if market_id:
-                        logger.debug("Sample filtered market",
-                                   market_id=market_id[:20],
-                                   question=item.get('question', item.get('title', 'N/A'))[:50],
-                                   closed=item.get('closed'),
-                                   archived=item.get('archived'),
-                                   accepting_orders=item.get('accepting_orders'),
-                                   active=item.get('active'))
-                        sample_count += 1
-                        if sample_count >= 5:
-                            break
-
-            logger.info("Fetched active markets", count=len(markets), limit=limit, gamma_matches=len([m for m in markets if m.volume_24h > 0]))
+                if debug_enabled:
+                    sample_count = 0
+                    for item in clob_markets_list[:10]:
+                        market_id = (
+                            item.get('condition_id') or 
+                            item.get('conditionId') or 
+                            item.get('id') or 
+                            item.get('question_id') or
+                            item.get('questionId')
+                        )
+                        if market_id:
+                            logger.debug("Sample filtered market",
+                                       market_id=market_id[:20],
+                                       question=item.get('question', item.get('title', 'N/A'))[:50],
+                                       closed=item.get('closed'),
+                                       archived=item.get('archived'),
+                                       accepting_orders=item.get('accepting_orders'),
+                                       active=item.get('active'))
+                            sample_count += 1
+                            if sample_count >= 5:
+                                break
+
+            logger.info("Fetched active markets", count=len(markets), limit=limit, gamma_matches=gamma_match_count)
             return markets
 
         except Exception as e:
@@ -465,6 +927,9 @@ class PolymarketDataSource:
         """
         Fetch resolved markets for training data.
 
+        The selected raw rows are cached on disk for a day per
+        (start_date, end_date, limit), so repeated training runs skip the API pull.
+
         Args:
             start_date: Start date filter
             end_date: End date filter
@@ -473,36 +938,38 @@ class PolymarketDataSource:
         Returns:
             List of resolved markets
         """
-        try:
-            # Use get_markets() for full market details
-            markets_data = self.client.get_markets()
+        cache_key = f"resolved:{start_date}:{end_date}:{limit}"
+        cached_rows = self._file_cache.get(cache_key)
+        if cached_rows is not None:
+            resolved_markets = [market for market in map(self._parse_market, cached_rows) if market]
+            logger.info("Fetched resolved markets from disk cache", count=len(resolved_markets), limit=limit)
+            return resolved_markets
 
-            if isinstance(markets_data, dict) and "data" in markets_data:
-                markets_list = markets_data["data"]
-            elif isinstance(markets_data, list):
-                markets_list = markets_data
-            else:
-                logger.warning("Unexpected markets data format", data_type=type(markets_data))
+        try:
+            # Stream the markets listing, keeping closed/resolved rows only;
+            # rows without a winner are dropped before the full parse
+            markets_list = await self._stream_clob_markets(
+                lambda item: bool(item.get("closed")) and not item.get("archived") and self._has_resolved_outcome(item)
+            )
+            if markets_list is None:
                 return []
 
+            # Date window is applied column-wise before any Market is built
+            if start_date or end_date:
+                markets_list = self._select_resolved_window(markets_list, start_date, end_date)
+
             resolved_markets = []
+            resolved_rows = []
             for item in markets_list:
-                # Filter for closed/resolved markets
-                if item.get("closed") and not item.get("archived"):
-                    market = self._parse_market(item)
-                    if market and market.outcome:
-                        # Apply date filters if provided
-                        if start_date and market.resolved_at:
-                            if market.resolved_at < start_date:
-                                continue
-                        if end_date and market.resolved_at:
-                            if market.resolved_at > end_date:
-                                continue
-
-                        resolved_markets.append(market)
-                        if len(resolved_markets) >= limit:
-                            break
+                market = self._parse_market(item)
+                if market and market.outcome:
+                    resolved_markets.append(market)
+                    resolved_rows.append(item)
+                    if len(resolved_markets) >= limit:
+                        break
 
+            if resolved_rows:
+                self._file_cache.set(cache_key, resolved_rows)
             logger.info("Fetched resolved markets", count=len(resolved_markets), limit=limit)
             return resolved_markets
 
@@ -516,6 +983,105 @@ class PolymarketDataSource:
             )
             return []
 
+    @staticmethod
+    def _select_resolved_window(
+        items: List[dict], start_date: Optional[datetime], end_date: Optional[datetime]
+    ) -> List[dict]:
+        """
+        Keep closed market rows whose resolution date falls within [start_date, end_date].
+
+        Struct-of-arrays filter: end dates are parsed as one column and masked
+        with vectorized comparisons, so rows outside the window are dropped
+        before any Market is built. Rows without a parseable end date are kept,
+        as the per-market filter did. Naive bounds are treated as UTC.
+
+        Args:
+            items: Closed market dicts from get_markets()
+            start_date: Earliest resolution date, or None
+            end_date: Latest resolution date, or None
+
+        Returns:
+            Rows inside the window, in their original order
+        """
+        import numpy as np
+        import pandas as pd
+
+        if not items:
+            return items
+
+        resolved_at = pd.to_datetime(
+            pd.Series([item.get("end_date_iso") for item in items], dtype=object),
+            utc=True, format="ISO8601", errors="coerce",
+        )
+        def as_utc(bound: datetime) -> "pd.Timestamp":
+            timestamp = pd.Timestamp(bound)
+            return timestamp.tz_localize("UTC") if timestamp.tzinfo is None else timestamp
+
+        # NaT compares False, so rows without a date are never masked out
+        keep = np.ones(len(items), dtype=bool)
+        if start_date:
+            keep &= ~(resolved_at < as_utc(start_date)).to_numpy()
+        if end_date:
+            keep &= ~(resolved_at > as_utc(end_date)).to_numpy()
+        return [items[i] for i in np.flatnonzero(keep)]
+
+    async def fetch_resolved_markets_frame(
+        self, start_date: Optional[datetime] = None, end_date: Optional[datetime] = None, limit: int = 1000
+    ) -> "pd.DataFrame":
+        """
+        Fetch resolved markets as a DataFrame for bulk consumers (training data checks, analysis).
+
+        Same filtering as fetch_resolved_markets, but parsed column-wise with
+        _parse_markets_bulk instead of building one Market per row.
+
+        Args:
+            start_date: Start date filter
+            end_date: End date filter
+            limit: Maximum number of markets to return
+
+        Returns:
+            DataFrame with one row per resolved market (empty on failure)
+        """
+        try:
+            markets_list = await self._stream_clob_markets(
+                lambda item: bool(item.get("closed")) and not item.get("archived")
+            ) or []
+
+            # Same window rule as fetch_resolved_markets (naive bounds are UTC)
+            if start_date or end_date:
+                markets_list = self._select_resolved_window(markets_list, start_date, end_date)
+
+            frame = self._parse_markets_bulk(markets_list)
+            frame = frame[frame["outcome"].notna()]
+            frame = frame.head(limit).reset_index(drop=True)
+
+            logger.info("Fetched resolved markets frame", count=len(frame), limit=limit)
+            return frame
+
+        except Exception as e:
+            logger.error("Failed to fetch resolved markets frame", error=str(e))
+            return self._parse_markets_bulk([])
+
+    async def enrich_midpoints(self, markets: List[Market]) -> None:
+        """
+        Overlay live midpoint prices on parsed markets, in place.
+
+        Midpoints are fetched concurrently in one batch instead of one blocking
+        call per market. Markets without midpoint data keep their token prices.
+
+        Args:
+            markets: Markets to update
+        """
+        if not markets:
+            return
+
+        midpoints = await self._get_midpoints_batch([market.condition_id for market in markets])
+        for market in markets:
+            midpoint = midpoints.get(market.condition_id)
+            if midpoint is not None and midpoint > 0:
+                market.yes_price = midpoint
+                market.no_price = 1.0 - midpoint
+
     async def fetch_market_data(self, market_id: str) -> Optional[MarketData]:
         """
         Fetch complete market data including orderbook.
@@ -531,64 +1097,48 @@ class PolymarketDataSource:
             return None
 
         try:
-            # OPTIMIZED: Try to get midpoint price using async HTTP (non-blocking, handle 404 gracefully)
+            # OPTIMIZED: Midpoint and orderbook are independent - fetch them concurrently
             # Many markets don't have midpoint data, so 404 is expected and not an error
             # Use async HTTP instead of synchronous py-clob-client for better performance
-            try:
-                midpoints = await self._get_midpoints_batch([market_id], batch_size=1)
-                midpoint = midpoints.get(market_id)
-                if midpoint is not None and midpoint > 0:
-                    bid_price = float(midpoint)
-                    ask_price = float(midpoint)
-                    spread = 0.0
-                    # Update market prices with midpoint
-                    market.yes_price = bid_price
-                    market.no_price = 1.0 - bid_price
-                else:
-                    # Fallback to synchronous client if async fails (backwards compatibility)
-                    try:
-                        midpoint = self.client.get_midpoint(market_id)
-                        if midpoint is not None and midpoint > 0:
-                            bid_price = float(midpoint)
-                            ask_price = float(midpoint)
-                            spread = 0.0
-                            market.yes_price = bid_price
-                            market.no_price = 1.0 - bid_price
-                        else:
-                            bid_price = market.yes_price
-                            ask_price = market.yes_price
-                            spread = None
-                    except Exception:
-                        bid_price = market.yes_price
-                        ask_price = market.yes_price
-                        spread = None
-            except Exception as midpoint_error:
+            midpoint, orderbook = await asyncio.gather(
+                self._midpoints.load(market_id),
+                self._get_order_book(market_id),
+                return_exceptions=True,
+            )
+
+            if isinstance(midpoint, Exception):
                 # 404 or other errors are expected - many markets don't have midpoint data
                 # Don't log as error, just use market prices as fallback
-                logger.debug("Midpoint not available (expected for many markets)", 
-                           market_id=market_id[:20], 
-                           error=str(midpoint_error)[:50])
+                logger.debug("Midpoint not available (expected for many markets)",
+                           market_id=market_id[:20],
+                           error=str(midpoint)[:50])
+                midpoint = None
+
+            if midpoint is not None and midpoint > 0:
+                bid_price = float(midpoint)
+                ask_price = float(midpoint)
+                spread = 0.0
+                # Update market prices with midpoint
+                market.yes_price = bid_price
+                market.no_price = 1.0 - bid_price
+            else:
                 bid_price = market.yes_price
                 ask_price = market.yes_price
                 spread = None
 
-            # Try to get orderbook for depth information
-            try:
-                orderbook = self.client.get_order_book(market_id)
-                if orderbook and isinstance(orderbook, dict):
-                    bids = orderbook.get("bids", [])
-                    asks = orderbook.get("asks", [])
-                    
-                    if bids and len(bids) > 0:
-                        bid_price = float(bids[0].get("price", bid_price))
-                    if asks and len(asks) > 0:
-                        ask_price = float(asks[0].get("price", ask_price))
-                    
-                    spread = abs(ask_price - bid_price) if bid_price and ask_price else None
-                    orderbook_depth = len(bids) + len(asks)
-                else:
-                    orderbook_depth = None
-            except Exception:
+            # Orderbook gives depth information (errors are non-fatal)
+            if isinstance(orderbook, dict):
+                bids = orderbook.get("bids", [])
+                asks = orderbook.get("asks", [])
+
+                if bids:
+                    bid_price = float(bids[0].get("price", bid_price))
+                if asks:
+                    ask_price = float(asks[0].get("price", ask_price))
+
+                spread = abs(ask_price - bid_price) if bid_price and ask_price else None
+                orderbook_depth = len(bids) + len(asks)
+            else:
                 orderbook_depth = None
 
         except Exception as e:
@@ -608,9 +1158,132 @@ class PolymarketDataSource:
             orderbook_depth=orderbook_depth,
         )
 
+    def _parse_markets_bulk(self, items: List[dict]) -> "pd.DataFrame":
+        """
+        Parse many raw markets at once into a DataFrame.
+
+        Column-wise equivalent of _parse_market for bulk consumers: numeric and
+        date columns are converted with vectorized pandas operations and token
+        prices/outcomes are resolved from a flattened tokens table. Unlike
+        _parse_market, no per-market midpoint lookup is made, so prices are
+        the token prices.
+
+        Args:
+            items: Market dicts from get_markets()
+
+        Returns:
+            DataFrame with the Market fields as columns, one row per market
+        """
+        import numpy as np
+        import pandas as pd
+
+        columns = [
+            "id", "condition_id", "question", "category", "resolution_date", "outcome",
+            "yes_price", "no_price", "volume_24h", "liquidity", "created_at", "resolved_at",
+        ]
+        items = [item for item in items if item.get("condition_id")]
+        if not items:
+            return pd.DataFrame(columns=columns)
+
+        raw = pd.DataFrame.from_records(items)
+        raw["condition_id"] = raw["condition_id"].astype(str)
+        frame = pd.DataFrame({"id": raw["condition_id"], "condition_id": raw["condition_id"]})
+
+        def column(name: str) -> "pd.Series":
+            return raw[name] if name in raw.columns else pd.Series(np.nan, index=raw.index, dtype=object)
+
+        # Question falls back to title, then a truncated description
+        question = column("question").where(column("question").notna(), column("title"))
+        description = column("description").fillna("").astype(str).str[:100]
+        question = question.where(question.notna() & (question != ""), description)
+        frame["question"] = question.where(question != "", "Unknown Market")
+        frame["category"] = column("category")
+
+        # First non-zero value across the volume / liquidity field variants
+        def first_numeric(names: tuple) -> "pd.Series":
+            values = pd.DataFrame({name: pd.to_numeric(column(name), errors="coerce") for name in names})
+            return values.mask(values == 0).bfill(axis=1).iloc[:, 0].fillna(0.0).astype(float)
+
+        frame["volume_24h"] = first_numeric(_VOLUME_FIELDS)
+        frame["liquidity"] = first_numeric(_LIQUIDITY_FIELDS)
+
+        frame["resolution_date"] = pd.to_datetime(column("end_date_iso"), utc=True, format="ISO8601", errors="coerce")
+        closed = column("closed").fillna(False).astype(bool)
+        frame["resolved_at"] = frame["resolution_date"].where(closed)
+        frame["created_at"] = None
+
+        # Flatten tokens into one row per token, keyed back to the market row
+        with_tokens = [(row, item["tokens"]) for row, item in enumerate(items) if item.get("tokens")]
+        yes_price = pd.Series(0.0, index=frame.index)
+        no_price = pd.Series(0.0, index=frame.index)
+        outcome = pd.Series(None, index=frame.index, dtype=object)
+        if with_tokens:
+            tokens = pd.json_normalize(
+                [{"row": row, "tokens": market_tokens} for row, market_tokens in with_tokens],
+                record_path="tokens",
+                meta=["row"],
+            )
+            tokens["row"] = tokens["row"].astype(int)
+            tokens["price"] = pd.to_numeric(tokens.get("price"), errors="coerce").fillna(0.0)
+            raw_label = tokens["outcome"].fillna("").astype(str) if "outcome" in tokens else pd.Series("", index=tokens.index)
+            label = raw_label.str.upper()
+            tokens["position"] = tokens.groupby("row").cumcount()
+            by_row = tokens.groupby("row")
+
+            count = by_row.size().reindex(frame.index, fill_value=0)
+            first = tokens[tokens["position"] == 0].set_index("row")["price"].reindex(frame.index)
+            second = tokens[tokens["position"] == 1].set_index("row")["price"].reindex(frame.index)
+            yes = tokens[label == "YES"].groupby("row")["price"].first().reindex(frame.index)
+            no = tokens[label == "NO"].groupby("row")["price"].first().reindex(frame.index)
+
+            labelled = yes.notna() & no.notna()
+            binary = ~labelled & (count == 2)
+            single = ~labelled & (count == 1)
+            yes_price = yes.where(labelled, first.where(binary | single, 0.0))
+            no_price = no.where(labelled, second.where(binary, (1.0 - first).where(single, 0.0)))
+
+            # Outcome: binary closed markets with a winner token
+            has_exact = raw_label.isin(["YES", "NO"]).groupby(tokens["row"]).any().reindex(frame.index, fill_value=False)
+            winner_mask = tokens["winner"].eq(True) if "winner" in tokens else pd.Series(False, index=tokens.index)
+            winners = tokens[winner_mask].groupby("row").first().reindex(frame.index)
+            winner_label = label[winner_mask].groupby(tokens["row"][winner_mask]).first().reindex(frame.index)
+            resolved = closed & (count == 2) & winners["position"].notna()
+            is_yes = np.where(has_exact, winner_label == "YES", winners["position"] == 0)
+            outcome = pd.Series(np.where(is_yes, "YES", "NO"), index=frame.index).where(resolved)
+
+        frame["yes_price"] = yes_price.astype(float)
+        frame["no_price"] = no_price.astype(float)
+        frame["outcome"] = outcome
+        return frame[columns]
+
+    @staticmethod
+    def _has_resolved_outcome(data: dict) -> bool:
+        """
+        Cheap pre-check for whether _parse_market would assign an outcome.
+
+        Mirrors the outcome rule in _parse_market (binary market with a winner token)
+        without building a Market object.
+
+        Args:
+            data: Raw market dict from get_markets()
+
+        Returns:
+            True if the market has a winning token
+        """
+        tokens = data.get("tokens") or []
+        if len(tokens) != 2:
+            return False
+        for token in tokens:
+            if token.get("winner") is True:
+                return True
+        return False
+
     def _parse_market(self, data: dict) -> Optional[Market]:
         """
-        Parse market data from py-clob-client response.
+        Parse market data from a CLOB markets response.
+
+        Pure CPU - makes no network calls. Use enrich_midpoints() to overlay
+        live midpoint prices on the parsed markets.
 
         Args:
             data: Market data from get_markets() or get_market()
@@ -625,7 +1298,7 @@ class PolymarketDataSource:
                 return None
             
             # Debug: Log available keys if volume is missing (only first time to avoid spam)
-            if "volume_24h" not in data and "volume24h" not in data and "volume" not in data:
+            if is_debug_enabled() and "volume_24h" not in data and "volume24h" not in data and "volume" not in data:
                 logger.debug(
                     "Volume fields not found in market data",
                     market_id=data.get("condition_id", "unknown")[:20],
@@ -633,107 +1306,39 @@ class PolymarketDataSource:
                     all_keys_sample=list(data.keys())[:10],
                 )
 
-            # Parse outcome from tokens (winner field)
-            outcome = None
-            if data.get("closed"):
-                tokens = data.get("tokens", [])
-                winner_token = next((t for t in tokens if t.get("winner") is True), None)
-                if winner_token:
-                    # Map token outcome to YES/NO if it's a binary market
-                    # For now, we'll use the token outcome as-is
-                    token_outcome = winner_token.get("outcome", "")
-                    # Simple heuristic: if it's a binary market, try to determine YES/NO
-                    # This may need adjustment based on actual market structure
-                    if len(tokens) == 2:
-                        # Binary market - check if we can determine YES/NO
-                        outcomes = [t.get("outcome", "") for t in tokens]
-                        if "YES" in outcomes or "NO" in outcomes:
-                            outcome = "YES" if winner_token.get("outcome", "").upper() == "YES" else "NO"
-                        else:
-                            # Non-standard binary market - use first token as YES equivalent
-                            outcome = "YES" if winner_token == tokens[0] else "NO"
-
-            # Parse prices from tokens
-            yes_price = 0.0
-            no_price = 0.0
-            tokens = data.get("tokens", [])
-            
-            if tokens:
-                # Try to find YES/NO tokens
-                yes_token = next((t for t in tokens if t.get("outcome", "").upper() == "YES"), None)
-                no_token = next((t for t in tokens if t.get("outcome", "").upper() == "NO"), None)
-                
-                if yes_token and no_token:
-                    yes_price = float(yes_token.get("price", 0.0))
-                    no_price = float(no_token.get("price", 0.0))
-                elif len(tokens) == 2:
-                    # Binary market with non-standard outcomes - use first as YES
-                    yes_price = float(tokens[0].get("price", 0.0))
-                    no_price = float(tokens[1].get("price", 0.0)) if len(tokens) > 1 else (1.0 - yes_price)
-                elif len(tokens) == 1:
-                    # Single token - assume it's YES
-                    yes_price = float(tokens[0].get("price", 0.0))
-                    no_price = 1.0 - yes_price
-
-            # OPTIMIZED: Try to get midpoint price (non-blocking, handle 404 gracefully)
-            # Many markets don't have midpoint data, so 404 is expected and not an error
-            try:
-                midpoint = self.client.get_midpoint(condition_id)
-                if midpoint is not None and midpoint > 0:
-                    yes_price = float(midpoint)
-                    no_price = 1.0 - yes_price
-            except Exception as midpoint_error:
-                # 404 or other errors are expected - many markets don't have midpoint data
-                # Don't log as error, just use token prices or defaults
-                logger.debug("Midpoint not available (expected)", 
-                           condition_id=condition_id[:20] if condition_id else None,
-                           error=str(midpoint_error)[:50] if midpoint_error else None)
-                pass  # Midpoint not available, use token prices or defaults
-
-            # Parse dates
-            resolution_date = None
-            if data.get("end_date_iso"):
-                try:
-                    resolution_date = datetime.fromisoformat(data["end_date_iso"].replace("Z", "+00:00"))
-                except (ValueError, AttributeError):
-                    pass
-
-            # For resolved markets, use end_date_iso as resolved_at if closed
-            resolved_at = None
-            if data.get("closed") and resolution_date:
-                resolved_at = resolution_date
-
             # Get question/title
-            question = data.get("question", data.get("title", ""))
+            # Only look up title when question is absent (same result, one probe on the common path)
+            question = data["question"] if "question" in data else data.get("title", "")
             if not question:
                 # Try to construct from description or other fields
                 question = data.get("description", "")[:100] if data.get("description") else "Unknown Market"
 
-            return Market(
-                id=condition_id,
-                condition_id=condition_id,
-                question=question,
-                category=data.get("category"),
-                resolution_date=resolution_date,
-                outcome=outcome,
-                yes_price=yes_price,
-                no_price=no_price,
+            # Project the dict onto hashable inputs and reuse the memoized parse
+            market = _build_market(
+                condition_id,
+                question,
+                data.get("category"),
+                bool(data.get("closed")),
+                data.get("end_date_iso"),
+                tuple([
+                    (token.get("outcome") or "", token.get("price", 0.0), token.get("winner") is True)
+                    for token in data.get("tokens") or ()
+                ]),
                 # Use volume24hr from Gamma API (correct field name per Polymarket docs)
                 # Fallback to other variations if needed
-                volume_24h=float(
-                    data.get("volume24hr")  # Correct field name from Gamma API
-                    or data.get("volume24h")
-                    or data.get("volume_24h")
-                    or data.get("volume24H")
-                    or data.get("volumeUSD")
-                    or data.get("volume_usd")
-                    or data.get("volume")
-                    or 0.0
-                ),
-                liquidity=float(data.get("liquidity") or data.get("totalLiquidity") or data.get("total_liquidity") or 0.0),
-                created_at=None,  # Not available in get_markets() response
-                resolved_at=resolved_at,
+                data.get("volume24hr")  # Correct field name from Gamma API
+                or data.get("volume24h")
+                or data.get("volume_24h")
+                or data.get("volume24H")
+                or data.get("volumeUSD")
+                or data.get("volume_usd")
+                or data.get("volume")
+                or 0.0,
+                data.get("liquidity") or data.get("totalLiquidity") or data.get("total_liquidity") or 0.0,
             )
+            # Copy: the memoized instance is shared and callers update prices in place
+            # Prices are token prices; live midpoints are applied by enrich_midpoints()
+            return replace(market)
         except Exception as e:
             logger.error("Failed to parse market data", error=str(e), data_keys=list(data.keys()) if isinstance(data, dict) else "not_dict")
             return None
@@ -1,9 +1,12 @@
 """Reddit API data source."""
 
+import asyncio
+import heapq
 from datetime import datetime, timedelta
 from typing import List, Optional
 
-import praw
+import asyncpraw
+import numpy as np
 
 from ..models import SocialPost, SocialSentiment
 from ...config.settings import get_settings
@@ -11,6 +14,29 @@ from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Maximum stored text length per post
+_MAX_TEXT_LENGTH = 1000
+
+
+def _clip_text(title: str, body: str, limit: int = _MAX_TEXT_LENGTH) -> str:
+    """
+    Join title and body with a space, truncated to limit characters.
+
+    Equivalent to f"{title} {body}"[:limit], but slices before concatenating
+    so long self-text is never copied in full.
+
+    Args:
+        title: Post title
+        body: Post self-text (may be empty)
+        limit: Maximum length of the result
+
+    Returns:
+        Clipped text
+    """
+    if len(title) >= limit:
+        return title[:limit]
+    return title + " " + body[:limit - len(title) - 1]
+
 
 class RedditDataSource:
     """Reddit API integration for social sentiment."""
@@ -37,16 +63,85 @@ class RedditDataSource:
         self.user_agent = user_agent or settings.reddit_user_agent
         self.subreddits = subreddits or ["politics", "worldnews", "cryptocurrency", "sports"]
 
-        self.client = None
-        if self.client_id and self.client_secret:
+        # asyncpraw opens an aiohttp session, so the client is created lazily inside the event loop
+        self.client: Optional[asyncpraw.Reddit] = None
+        self.enabled = bool(self.client_id and self.client_secret)
+        if not self.enabled:
+            logger.warning("Reddit API credentials not provided, Reddit fetching will be disabled")
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
+
+    def _get_client(self) -> Optional[asyncpraw.Reddit]:
+        """Get or create the asyncpraw client (None if disabled or initialization failed)"""
+        if self.client is None and self.enabled:
             try:
-                self.client = praw.Reddit(
+                self.client = asyncpraw.Reddit(
                     client_id=self.client_id, client_secret=self.client_secret, user_agent=self.user_agent
                 )
             except Exception as e:
                 logger.warning("Failed to initialize Reddit client", error=str(e))
-        else:
-            logger.warning("Reddit API credentials not provided, Reddit fetching will be disabled")
+                self.enabled = False
+        return self.client
+
+    async def close(self):
+        """Clean up resources"""
+        if self.client is not None:
+            await self.client.close()
+            self.client = None
+
+    async def _search_subreddit(
+        self, client: asyncpraw.Reddit, subreddit_name: str, query: str, max_posts: int, min_score: int
+    ) -> List[SocialPost]:
+        """
+        Search one subreddit.
+
+        Args:
+            client: asyncpraw client
+            subreddit_name: Subreddit to search
+            query: Search query
+            max_posts: Maximum posts to fetch
+            min_score: Minimum upvote score
+
+        Returns:
+            List of SocialPost objects
+        """
+        rows = []
+        subreddit = await client.subreddit(subreddit_name)
+
+        # Collect raw fields first (score filter before any conversion), build posts in bulk
+        async for submission in subreddit.search(query, limit=min(max_posts, 100), sort="hot"):
+            score = submission.score
+            if score < min_score:
+                continue
+            rows.append((
+                submission.id,
+                submission.title,
+                submission.selftext,
+                submission.author,
+                submission.created_utc,
+                score + submission.num_comments,
+            ))
+
+        # Bind hot callables locally for the build loop
+        from_ts = datetime.fromtimestamp
+        social_post = SocialPost
+        return [
+            social_post(
+                id=str(post_id),
+                platform="reddit",
+                text=_clip_text(title, selftext or ""),  # Limit text length
+                author=str(author) if author else "unknown",
+                created_at=from_ts(created_utc),
+                engagement=engagement,
+            )
+            for post_id, title, selftext, author, created_utc, engagement in rows
+        ]
 
     async def fetch_posts(
         self, query: str, subreddits: Optional[List[str]] = None, max_posts: int = 50, min_score: int = 5
@@ -63,7 +158,8 @@ class RedditDataSource:
         Returns:
             List of SocialPost objects
         """
-        if not self.client:
+        client = self._get_client()
+        if client is None:
             return []
 
         if subreddits is None:
@@ -71,28 +167,22 @@ class RedditDataSource:
 
         posts = []
         try:
-            for subreddit_name in subreddits:
-                try:
-                    subreddit = self.client.subreddit(subreddit_name)
-                    search_results = subreddit.search(query, limit=min(max_posts, 100), sort="hot")
-
-                    for submission in search_results:
-                        if submission.score < min_score:
-                            continue
-
-                        post = SocialPost(
-                            id=str(submission.id),
-                            platform="reddit",
-                            text=f"{submission.title} {submission.selftext}"[:1000],  # Limit text length
-                            author=str(submission.author) if submission.author else "unknown",
-                            created_at=datetime.fromtimestamp(submission.created_utc),
-                            engagement=submission.score + submission.num_comments,
-                        )
-                        posts.append(post)
-
-                except Exception as e:
-                    logger.warning("Failed to fetch from subreddit", subreddit=subreddit_name, error=str(e))
+            # Search subreddits concurrently over asyncpraw's shared session
+            semaphore = asyncio.Semaphore(8)
+
+            async def search_one(subreddit_name: str) -> List[SocialPost]:
+                async with semaphore:
+                    return await self._search_subreddit(client, subreddit_name, query, max_posts, min_score)
+
+            results = await asyncio.gather(
+                *[search_one(subreddit_name) for subreddit_name in subreddits], return_exceptions=True
+            )
+
+            for subreddit_name, result in zip(subreddits, results):
+                if isinstance(result, Exception):
+                    logger.warning("Failed to fetch from subreddit", subreddit=subreddit_name, error=str(result))
                     continue
+                posts.extend(result)
 
             logger.info("Fetched Reddit posts", query=query, count=len(posts))
             return posts
@@ -120,10 +210,12 @@ class RedditDataSource:
         if not posts:
             return None
 
-        # Calculate sentiment metrics
-        sentiment_scores = [p.sentiment_score for p in posts if p.sentiment_score is not None]
+        # Calculate sentiment metrics in one pass into a float array
+        sentiment_scores = np.fromiter(
+            (p.sentiment_score for p in posts if p.sentiment_score is not None), dtype=np.float64
+        )
 
-        if not sentiment_scores:
+        if not sentiment_scores.size:
             return SocialSentiment(
                 platform="reddit",
                 average_sentiment=0.0,
@@ -133,14 +225,17 @@ class RedditDataSource:
                 top_posts=posts[:10],
             )
 
-        import numpy as np
+        # Population std from the already-computed mean (np.std would recompute it)
+        mean = sentiment_scores.mean()
+        std = np.sqrt(np.square(sentiment_scores - mean).mean())
 
         return SocialSentiment(
             platform="reddit",
-            average_sentiment=float(np.mean(sentiment_scores)),
-            sentiment_std=float(np.std(sentiment_scores)),
+            average_sentiment=float(mean),
+            sentiment_std=float(std),
             volume=len(posts),
             velocity=0.0,
-            top_posts=sorted(posts, key=lambda x: x.engagement, reverse=True)[:10],
+            # Same order as sorted(..., reverse=True)[:10] without sorting every post
+            top_posts=heapq.nlargest(10, posts, key=lambda x: x.engagement),
         )
 
@@ -1,19 +1,120 @@
 """RSS-based news data source (free alternative to NewsAPI)."""
 
 import asyncio
+import re
+from dataclasses import asdict
 from datetime import datetime, timedelta, timezone
-from typing import Dict, List, Optional
-from urllib.parse import quote, urlencode
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
+from typing import AsyncIterator, Callable, Dict, List, Optional, Set
+from urllib.parse import quote_plus
 import xml.etree.ElementTree as ET
 
 import aiohttp
 
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+try:
+    import aiodns  # noqa: F401 - enables aiohttp's c-ares AsyncResolver
+    AIODNS_AVAILABLE = True
+except ImportError:
+    AIODNS_AVAILABLE = False
+
+try:
+    from lxml import etree as LET
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
 from ..models import NewsArticle
 from ...config.settings import get_settings
 from ...utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Keyword extraction: words of 4+ ASCII letters/digits, minus stopwords
+_TOKEN_RE = re.compile(r"[a-z0-9]{4,}")
+_STOPWORDS = frozenset({"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"})
+
+# Google News search URL with the fixed locale params pre-encoded; only q varies
+_GOOGLE_BASE = "https://news.google.com/rss/search?hl=en&gl=US&ceid=US%3Aen&q="
+
+# Child elements read from each RSS <item>
+_RSS_ITEM_FIELDS = ("title", "link", "pubDate", "description", "source")
+
+# Process-wide RSS session (keep-alive, DNS cache), bound to the loop it was created on
+_shared_session: Optional[aiohttp.ClientSession] = None
+_shared_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _get_shared_session() -> aiohttp.ClientSession:
+    """
+    Get the shared RSS ClientSession, creating it on first use.
+
+    All RSSNewsDataSource instances reuse one pooled connector, so feeds
+    keep their TLS connections and DNS entries between fetches. A new
+    session is made if the previous one was closed or belongs to another
+    event loop. Must be called from within a running loop.
+
+    Returns:
+        Shared aiohttp ClientSession
+    """
+    global _shared_session, _shared_session_loop
+    loop = asyncio.get_running_loop()
+    if _shared_session is None or _shared_session.closed or _shared_session_loop is not loop:
+        # Non-blocking c-ares DNS when aiodns is installed (aiohttp[speedups]); Brotli
+        # decoding from the same extra is picked up by aiohttp's default Accept-Encoding
+        connector = aiohttp.TCPConnector(
+            limit=100,
+            limit_per_host=20,
+            resolver=aiohttp.AsyncResolver() if AIODNS_AVAILABLE else None,
+            use_dns_cache=True,
+            ttl_dns_cache=300,
+            enable_cleanup_closed=True,
+        )
+        _shared_session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=10),
+        )
+        _shared_session_loop = loop
+    return _shared_session
+
+
+async def close_shared_session() -> None:
+    """Close the shared RSS session (call once on application shutdown)."""
+    global _shared_session, _shared_session_loop
+    if _shared_session is not None and not _shared_session.closed:
+        await _shared_session.close()
+    _shared_session = None
+    _shared_session_loop = None
+
+
+@lru_cache(maxsize=4096)
+def _parse_rfc822_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse an RFC 822 pubDate into an aware datetime, memoized per raw string.
+
+    Items in the same feed (and repeated polls of it) share timestamps, so
+    cached hits skip the email.utils parse entirely.
+
+    Args:
+        date_str: Raw pubDate text
+
+    Returns:
+        Aware datetime (naive values are taken as UTC), or None if unparseable
+    """
+    try:
+        dt = parsedate_to_datetime(date_str)
+    except (ValueError, TypeError):
+        return None
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt
+
 
 class RSSNewsDataSource:
     """RSS-based news source using Google News and other RSS feeds."""
@@ -29,19 +130,21 @@ class RSSNewsDataSource:
 
     async def __aenter__(self):
         """Async context manager entry."""
-        self.session = aiohttp.ClientSession()
+        self.session = _get_shared_session()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Async context manager exit."""
-        if self.session:
-            await self.session.close()
+        # The session is shared across instances; close_shared_session() closes it on shutdown
+        self.session = None
 
     async def fetch(
         self, query: str, from_date: Optional[datetime] = None, to_date: Optional[datetime] = None, **kwargs
     ) -> List[Dict]:
         """
-        Fetch news articles from RSS feeds.
+        Fetch news articles from RSS feeds as dictionaries.
+
+        Compatibility wrapper around fetch_articles() for dict consumers.
 
         Args:
             query: Search query
@@ -52,30 +155,12 @@ class RSSNewsDataSource:
         Returns:
             List of news articles as dictionaries
         """
-        if not self.session:
-            self.session = aiohttp.ClientSession()
-
-        max_articles = kwargs.get("max_articles", 50)
-        articles = []
-
-        try:
-            # Try Google News RSS first (best for search queries)
-            google_articles = await self._fetch_google_news(query, max_articles)
-            articles.extend(google_articles)
-
-            # If we need more, try other sources
-            if len(articles) < max_articles:
-                reuters_articles = await self._fetch_reuters(query, max_articles - len(articles))
-                articles.extend(reuters_articles)
-
-            logger.info("Fetched news articles from RSS", query=query, count=len(articles))
-            return articles[:max_articles]
-
-        except Exception as e:
-            logger.error("Failed to fetch RSS news", query=query, error=str(e))
-            return []
+        articles = await self.fetch_articles(
+            query, from_date=from_date, to_date=to_date, max_articles=kwargs.get("max_articles", 50)
+        )
+        return [asdict(article) for article in articles]
 
-    async def _fetch_google_news(self, query: str, max_articles: int = 50) -> List[Dict]:
+    async def _fetch_google_news(self, query: str, max_articles: int = 50) -> List[NewsArticle]:
         """Fetch articles from Google News RSS."""
         from ...utils.rate_limiter import get_rate_limiter, RateLimitExceeded
         
@@ -86,41 +171,28 @@ class RSSNewsDataSource:
                 logger.warning("RSS rate limit exceeded, skipping", remaining=limiter.get_remaining('newsapi'))
                 return []
             # Google News RSS format
-            params = {
-                "q": query,
-                "hl": "en",
-                "gl": "US",
-                "ceid": "US:en",
-            }
-            url = f"{self.sources['google_news']}?{urlencode(params)}"
-
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            url = _GOOGLE_BASE + quote_plus(query)
+
+            async with self.session.get(url) as response:
                 if response.status != 200:
                     logger.warning("Google News RSS returned non-200 status", status=response.status)
                     return []
 
-                text = await response.text()
-                root = ET.fromstring(text)
-
                 articles = []
-                for item in root.findall(".//item")[:max_articles]:
-                    title = item.find("title")
-                    link = item.find("link")
-                    pub_date = item.find("pubDate")
-                    description = item.find("description")
-                    source = item.find("source")
-
-                    if title is not None and link is not None:
+                async for item in self._iter_rss_items(response):
+                    if item["title"] is not None and item["link"] is not None:
                         articles.append(
-                            {
-                                "title": title.text or "",
-                                "description": description.text if description is not None else "",
-                                "content": description.text if description is not None else "",
-                                "source": source.text if source is not None else "Google News",
-                                "url": link.text or "",
-                                "published_at": self._parse_rss_date(pub_date.text if pub_date is not None else None),
-                            }
+                            NewsArticle(
+                                title=item["title"],
+                                description=item["description"] or "",
+                                content=item["description"] or "",
+                                source=item["source"] or "Google News",
+                                url=item["link"],
+                                published_at=self._parse_rss_date(item["pubDate"]),
+                            )
                         )
+                        if len(articles) >= max_articles:
+                            break
 
                 return articles
 
@@ -128,52 +200,48 @@ class RSSNewsDataSource:
             logger.warning("Failed to fetch Google News RSS", error=str(e))
             return []
 
-    async def _fetch_reuters(self, query: str, max_articles: int = 50) -> List[Dict]:
+    async def _fetch_reuters(self, query: str, max_articles: int = 50) -> List[NewsArticle]:
         """Fetch articles from Reuters RSS (general feed, not searchable)."""
         try:
             # Reuters doesn't support search in RSS, so we get general feed
             # and filter by keywords
             url = self.sources["reuters"]
 
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
+            query_keywords = {keyword for keyword in query.lower().split() if len(keyword) > 3}
+            if not query_keywords:
+                # Nothing could match, so skip the feed download
+                return []
+            contains_keyword = self._build_keyword_matcher(query_keywords)
+
+            async with self.session.get(url) as response:
                 if response.status != 200:
                     return []
 
-                text = await response.text()
-                root = ET.fromstring(text)
-
-                query_keywords = set(query.lower().split())
                 articles = []
 
-                for item in root.findall(".//item"):
-                    if len(articles) >= max_articles:
-                        break
-
-                    title = item.find("title")
-                    link = item.find("link")
-                    pub_date = item.find("pubDate")
-                    description = item.find("description")
-
-                    if title is None or link is None:
+                async for item in self._iter_rss_items(response):
+                    if item["title"] is None or item["link"] is None:
                         continue
 
                     # Simple keyword matching
-                    title_text = (title.text or "").lower()
-                    desc_text = (description.text if description is not None else "").lower()
+                    title_text = item["title"].lower()
+                    desc_text = (item["description"] or "").lower()
                     combined_text = title_text + " " + desc_text
 
                     # Check if any query keywords appear in title/description
-                    if any(keyword in combined_text for keyword in query_keywords if len(keyword) > 3):
+                    if contains_keyword(combined_text):
                         articles.append(
-                            {
-                                "title": title.text or "",
-                                "description": description.text if description is not None else "",
-                                "content": description.text if description is not None else "",
-                                "source": "Reuters",
-                                "url": link.text or "",
-                                "published_at": self._parse_rss_date(pub_date.text if pub_date is not None else None),
-                            }
+                            NewsArticle(
+                                title=item["title"],
+                                description=item["description"] or "",
+                                content=item["description"] or "",
+                                source="Reuters",
+                                url=item["link"],
+                                published_at=self._parse_rss_date(item["pubDate"]),
+                            )
                         )
+                        if len(articles) >= max_articles:
+                            break
 
                 return articles
 
@@ -181,52 +249,116 @@ class RSSNewsDataSource:
             logger.warning("Failed to fetch Reuters RSS", error=str(e))
             return []
 
-    def _parse_rss_date(self, date_str: Optional[str]) -> datetime:
-        """Parse RSS date string (RFC 822 format)."""
-        if not date_str:
-            return datetime.now(timezone.utc)
+    @staticmethod
+    def _build_keyword_matcher(keywords: Set[str]) -> Callable[[str], bool]:
+        """
+        Build a predicate testing whether text contains any of the keywords.
 
-        try:
-            # Try common RSS date formats
-            from email.utils import parsedate_to_datetime
+        Uses an Aho-Corasick automaton (one linear scan per text regardless of
+        keyword count) when pyahocorasick is installed, else a substring check
+        per keyword.
 
-            if date_str:
-                dt = parsedate_to_datetime(date_str)
-                if dt.tzinfo is None:
-                    dt = dt.replace(tzinfo=timezone.utc)
-                return dt
-        except (ValueError, TypeError):
-            pass
+        Args:
+            keywords: Non-empty set of lowercase keywords
+
+        Returns:
+            Function mapping lowercase text -> True if any keyword occurs in it
+        """
+        if not AHOCORASICK_AVAILABLE:
+            return lambda text: any(keyword in text for keyword in keywords)
+
+        automaton = ahocorasick.Automaton()
+        for keyword in keywords:
+            automaton.add_word(keyword, keyword)
+        automaton.make_automaton()
+        return lambda text: next(automaton.iter(text), None) is not None
+
+    async def _iter_rss_items(self, response: aiohttp.ClientResponse) -> AsyncIterator[Dict[str, Optional[str]]]:
+        """
+        Stream <item> entries out of an RSS response as it downloads.
+
+        The body is fed chunk by chunk to libxml2's pull parser (or the stdlib
+        ElementTree pull parser when lxml is not installed); each finished item
+        is read and then cleared, so memory stays flat and callers can stop
+        early without reading the rest. Each feed() runs on the default
+        executor so tokenizing a chunk doesn't hold up the event loop; the
+        parser is only touched by one thread at a time.
+
+        Args:
+            response: Open aiohttp response with an RSS body
+
+        Yields:
+            Dict of _RSS_ITEM_FIELDS -> element text (None if the element is missing)
+        """
+        if LXML_AVAILABLE:
+            parser = LET.XMLPullParser(events=("end",), tag="item")
+        else:
+            parser = ET.XMLPullParser(events=("end",))
+
+        loop = asyncio.get_running_loop()
+        async for chunk in response.content.iter_chunked(16384):
+            await loop.run_in_executor(None, parser.feed, chunk)
+            for _, elem in parser.read_events():
+                if elem.tag != "item":
+                    continue
+                yield {field: elem.findtext(field) for field in _RSS_ITEM_FIELDS}
+                elem.clear()
+                if LXML_AVAILABLE:
+                    # Also drop processed siblings (stdlib elements have no parent links)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+        parser.close()
 
+    def _parse_rss_date(self, date_str: Optional[str]) -> datetime:
+        """Parse RSS date string (RFC 822 format), falling back to now."""
+        if date_str:
+            dt = _parse_rfc822_date(date_str)
+            if dt is not None:
+                return dt
         return datetime.now(timezone.utc)
 
     async def fetch_articles(
-        self, query: str, from_date: Optional[datetime] = None, to_date: Optional[datetime] = None
+        self,
+        query: str,
+        from_date: Optional[datetime] = None,
+        to_date: Optional[datetime] = None,
+        max_articles: int = 50,
     ) -> List[NewsArticle]:
         """
-        Fetch news articles and return as NewsArticle objects.
+        Fetch news articles from RSS feeds as NewsArticle objects.
 
         Args:
             query: Search query
             from_date: Start date (for compatibility, not used in RSS)
             to_date: End date (for compatibility, not used in RSS)
+            max_articles: Maximum number of articles to return
 
         Returns:
             List of NewsArticle objects
         """
-        articles_data = await self.fetch(query, from_date=from_date, to_date=to_date)
-        return [self._parse_article(data) for data in articles_data]
-
-    def _parse_article(self, data: Dict) -> NewsArticle:
-        """Parse article data into NewsArticle object."""
-        return NewsArticle(
-            title=data.get("title", ""),
-            description=data.get("description", ""),
-            content=data.get("content", ""),
-            source=data.get("source", ""),
-            url=data.get("url", ""),
-            published_at=data.get("published_at", datetime.now(timezone.utc)),
-        )
+        self.session = _get_shared_session()
+        articles: List[NewsArticle] = []
+
+        try:
+            # Feeds are independent - fetch them concurrently. Google News results
+            # come first (best for search queries), Reuters fills the remainder
+            results = await asyncio.gather(
+                self._fetch_google_news(query, max_articles),
+                self._fetch_reuters(query, max_articles),
+                return_exceptions=True,
+            )
+            for source_articles in results:
+                if isinstance(source_articles, Exception):
+                    logger.warning("RSS source failed", query=query, error=str(source_articles))
+                    continue
+                articles.extend(source_articles)
+
+            logger.info("Fetched news articles from RSS", query=query, count=len(articles))
+            return articles[:max_articles]
+
+        except Exception as e:
+            logger.error("Failed to fetch RSS news", query=query, error=str(e))
+            return []
 
     def extract_keywords(self, text: str) -> List[str]:
         """
@@ -238,9 +370,8 @@ class RSSNewsDataSource:
         Returns:
             List of keywords
         """
-        stopwords = {"the", "a", "an", "and", "or", "but", "in", "on", "at", "to", "for", "of", "with", "by"}
-        words = text.lower().split()
-        keywords = [w for w in words if len(w) > 3 and w not in stopwords]
+        # Tokenize in the C regex engine; the pattern enforces the minimum length
+        keywords = [w for w in _TOKEN_RE.findall(text.lower()) if w not in _STOPWORDS]
         return keywords[:5]  # Limit to top 5 keywords
 
 
@@ -1,9 +1,11 @@
 """Twitter/X API data source."""
 
+import heapq
 from datetime import datetime
 from typing import List, Optional
 
-import tweepy
+import numpy as np
+from tweepy.asynchronous import AsyncClient
 
 from ..models import SocialPost, SocialSentiment
 from ...config.settings import get_settings
@@ -21,6 +23,7 @@ class TwitterDataSource:
         api_secret: Optional[str] = None,
         access_token: Optional[str] = None,
         access_token_secret: Optional[str] = None,
+        bearer_token: Optional[str] = None,
     ):
         """
         Initialize Twitter data source.
@@ -30,27 +33,53 @@ class TwitterDataSource:
             api_secret: Twitter API secret
             access_token: Access token
             access_token_secret: Access token secret
+            bearer_token: App-only bearer token (preferred for search)
         """
         settings = get_settings()
         self.api_key = api_key or settings.twitter_api_key
         self.api_secret = api_secret or settings.twitter_api_secret
         self.access_token = access_token or settings.twitter_access_token
         self.access_token_secret = access_token_secret or settings.twitter_access_token_secret
+        self.bearer_token = bearer_token or settings.twitter_bearer_token
 
-        self.client = None
-        if all([self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
-            try:
-                auth = tweepy.OAuthHandler(self.api_key, self.api_secret)
-                auth.set_access_token(self.access_token, self.access_token_secret)
-                self.client = tweepy.API(auth, wait_on_rate_limit=True)
-            except Exception as e:
-                logger.warning("Failed to initialize Twitter client", error=str(e))
-        else:
-            logger.warning("Twitter API credentials not provided, Twitter fetching will be disabled")
+        # Non-blocking v2 client. App-only (bearer token) auth is preferred for
+        # search; OAuth 1.0a user context is used when only user keys are set.
+        self.client: Optional[AsyncClient] = None
+        self._user_auth = False
+        try:
+            if self.bearer_token:
+                self.client = AsyncClient(bearer_token=self.bearer_token, wait_on_rate_limit=True)
+            elif all([self.api_key, self.api_secret, self.access_token, self.access_token_secret]):
+                self.client = AsyncClient(
+                    consumer_key=self.api_key,
+                    consumer_secret=self.api_secret,
+                    access_token=self.access_token,
+                    access_token_secret=self.access_token_secret,
+                    wait_on_rate_limit=True,
+                )
+                self._user_auth = True
+            else:
+                logger.warning("Twitter API credentials not provided, Twitter fetching will be disabled")
+        except Exception as e:
+            logger.warning("Failed to initialize Twitter client", error=str(e))
+
+    async def close(self):
+        """Close the client's HTTP session (DataAggregator.close() calls this for its own instance)."""
+        session = getattr(self.client, "session", None)
+        if session is not None and not session.closed:
+            await session.close()
+
+    async def __aenter__(self):
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Async context manager exit."""
+        await self.close()
 
     async def fetch_tweets(self, query: str, max_tweets: int = 100, min_followers: int = 100) -> List[SocialPost]:
         """
-        Fetch tweets matching query.
+        Fetch recent tweets matching query (Twitter API v2 recent search).
 
         Args:
             query: Search query
@@ -64,23 +93,38 @@ class TwitterDataSource:
             return []
 
         try:
-            tweets = self.client.search_tweets(q=query, count=min(max_tweets, 100), lang="en", tweet_mode="extended")
+            # v2 recent search accepts 10-100 results per request
+            response = await self.client.search_recent_tweets(
+                query=f"{query} lang:en",
+                max_results=max(10, min(max_tweets, 100)),
+                tweet_fields=["public_metrics", "lang", "created_at"],
+                expansions=["author_id"],
+                user_fields=["public_metrics"],
+                user_auth=self._user_auth,
+            )
+
+            # Authors come back once in includes; index them for O(1) lookup per tweet
+            users = {user.id: user for user in (response.includes or {}).get("users", [])}
 
             posts = []
-            for tweet in tweets:
+            for tweet in response.data or []:
+                user = users.get(tweet.author_id)
                 # Filter by follower count if available
-                if hasattr(tweet.user, "followers_count") and tweet.user.followers_count < min_followers:
+                if user is not None and user.public_metrics and user.public_metrics.get("followers_count", 0) < min_followers:
                     continue
 
+                metrics = tweet.public_metrics or {}
                 post = SocialPost(
                     id=str(tweet.id),
                     platform="twitter",
-                    text=tweet.full_text if hasattr(tweet, "full_text") else tweet.text,
-                    author=tweet.user.screen_name,
+                    text=tweet.text,
+                    author=user.username if user is not None else "unknown",
                     created_at=tweet.created_at.replace(tzinfo=None),
-                    engagement=tweet.favorite_count + tweet.retweet_count,
+                    engagement=metrics.get("like_count", 0) + metrics.get("retweet_count", 0),
                 )
                 posts.append(post)
+                if len(posts) >= max_tweets:
+                    break
 
             logger.info("Fetched tweets", query=query, count=len(posts))
             return posts
@@ -105,10 +149,13 @@ class TwitterDataSource:
         if not posts:
             return None
 
-        # Calculate sentiment metrics (sentiment scores should be set by sentiment analyzer)
-        sentiment_scores = [p.sentiment_score for p in posts if p.sentiment_score is not None]
+        # Calculate sentiment metrics in one pass into a float array
+        # (sentiment scores should be set by sentiment analyzer)
+        sentiment_scores = np.fromiter(
+            (p.sentiment_score for p in posts if p.sentiment_score is not None), dtype=np.float64
+        )
 
-        if not sentiment_scores:
+        if not sentiment_scores.size:
             return SocialSentiment(
                 platform="twitter",
                 average_sentiment=0.0,
@@ -118,14 +165,16 @@ class TwitterDataSource:
                 top_posts=posts[:10],
             )
 
-        import numpy as np
+        # Population std from the already-computed mean (np.std would recompute it)
+        mean = sentiment_scores.mean()
+        std = np.sqrt(np.square(sentiment_scores - mean).mean())
 
         return SocialSentiment(
             platform="twitter",
-            average_sentiment=float(np.mean(sentiment_scores)),
-            sentiment_std=float(np.std(sentiment_scores)),
+            average_sentiment=float(mean),
+            sentiment_std=float(std),
             volume=len(posts),
             velocity=0.0,  # Would calculate rate of change over time
-            top_posts=sorted(posts, key=lambda x: x.engagement, reverse=True)[:10],
+            # Same order as sorted(..., reverse=True)[:10] without sorting every post
+            top_posts=heapq.nlargest(10, posts, key=lambda x: x.engagement),
         )
-
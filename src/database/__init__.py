@@ -1,6 +1,7 @@
 """Database package."""
 
-from .connection import AsyncSessionLocal, Base, engine, get_db, init_db
+from .analytics_cache import get_cached_analytics, set_cached_analytics
+from .connection import AsyncSessionLocal, Base, bulk_insert, copy_rows, engine, get_db, init_db
 from .models import (
     Alert,
     AlertHistory,
@@ -13,6 +14,7 @@ from .models import (
     Signal,
     Trade,
 )
+from .portfolio_views import mv_portfolio_daily, refresh_portfolio_daily
 
 __all__ = [
     "AsyncSessionLocal",
@@ -20,6 +22,8 @@ __all__ = [
     "engine",
     "get_db",
     "init_db",
+    "bulk_insert",
+    "copy_rows",
     "Market",
     "FeatureSnapshot",
     "Prediction",
@@ -30,4 +34,8 @@ __all__ = [
     "Alert",
     "AlertHistory",
     "AnalyticsCache",
+    "get_cached_analytics",
+    "set_cached_analytics",
+    "mv_portfolio_daily",
+    "refresh_portfolio_daily",
 ]
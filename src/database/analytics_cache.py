@@ -0,0 +1,249 @@
+"""Tiered analytics cache: process memory, then Redis, then the AnalyticsCache table."""
+
+import asyncio
+import math
+import time
+from datetime import datetime, timedelta
+from typing import Any, Optional, Tuple
+
+import orjson
+from sqlalchemy import delete, event, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+try:
+    import cachetools
+    CACHETOOLS_AVAILABLE = True
+except ImportError:
+    CACHETOOLS_AVAILABLE = False
+
+try:
+    import redis.asyncio as aioredis
+    REDIS_AVAILABLE = True
+except ImportError:
+    REDIS_AVAILABLE = False
+
+from ..config.settings import get_settings
+from ..utils.datetime_utils import now_naive_utc
+from ..utils.logging import get_logger
+from .connection import bulk_insert, engine
+from .models import AnalyticsCache
+
+logger = get_logger(__name__)
+
+# cache_key -> (cache_data, expires_at); without cachetools this tier is skipped
+_ANALYTICS_LRU = cachetools.TTLCache(maxsize=10000, ttl=60) if CACHETOOLS_AVAILABLE else None
+
+_REDIS_PREFIX = "analytics:"
+# After a Redis error, go straight to Postgres for this long before retrying
+_REDIS_RETRY_AFTER = 60.0
+
+# Expired-row sweep: rows per DELETE (one short transaction each), and seconds between sweeps
+_SWEEP_BATCH = 1000
+_SWEEP_INTERVAL = 600.0
+
+_redis_client: Optional["aioredis.Redis"] = None
+_redis_down_until = 0.0
+
+
+def _get_redis() -> Optional["aioredis.Redis"]:
+    """Get the shared async Redis client, or None if unavailable/backing off."""
+    global _redis_client
+    if not REDIS_AVAILABLE or time.monotonic() < _redis_down_until:
+        return None
+    if _redis_client is None:
+        try:
+            _redis_client = aioredis.from_url(
+                get_settings().redis_url,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+        except Exception as e:
+            _redis_failed(e)
+            return None
+    return _redis_client
+
+
+def _redis_failed(error: Exception) -> None:
+    """Back off from Redis after an error."""
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + _REDIS_RETRY_AFTER
+    logger.warning("Analytics Redis cache unavailable, using Postgres", error=str(error))
+
+
+def _pack(data: Any, expires_at: datetime) -> bytes:
+    """Encode a Redis value with its expiry, so a hit needs no extra TTL call."""
+    return orjson.dumps([expires_at.isoformat(), data])
+
+
+def _unpack(raw: bytes) -> Tuple[Any, datetime]:
+    """Decode a Redis value into (data, expires_at)."""
+    expires_at, data = orjson.loads(raw)
+    return data, datetime.fromisoformat(expires_at)
+
+
+def _remember(key: str, data: Any, expires_at: datetime) -> None:
+    """Keep a value in process memory (never past expires_at)."""
+    if _ANALYTICS_LRU is not None:
+        _ANALYTICS_LRU[key] = (data, expires_at)
+
+
+async def get_cached_analytics(session: AsyncSession, key: str) -> Optional[Any]:
+    """
+    Get unexpired analytics data by cache key.
+
+    Checks process memory (up to 60s), then Redis, then the analytics_cache
+    table. A Postgres hit is copied into Redis for the row's remaining
+    lifetime, so the table only serves cold starts and Redis outages.
+
+    Args:
+        session: Database session
+        key: Cache key
+
+    Returns:
+        Cached data, or None if missing or expired
+    """
+    now = now_naive_utc()
+
+    if _ANALYTICS_LRU is not None:
+        entry = _ANALYTICS_LRU.get(key)
+        if entry is not None:
+            data, expires_at = entry
+            if expires_at > now:
+                return data
+            _ANALYTICS_LRU.pop(key, None)
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            raw = await client.get(_REDIS_PREFIX + key)
+            if raw is not None:
+                data, expires_at = _unpack(raw)
+                _remember(key, data, expires_at)
+                return data
+        except Exception as e:
+            _redis_failed(e)
+            client = None
+
+    result = await session.execute(
+        select(AnalyticsCache.cache_data, AnalyticsCache.expires_at).where(AnalyticsCache.cache_key == key)
+    )
+    row = result.one_or_none()
+    if row is None or row.expires_at <= now:
+        return None
+
+    _remember(key, row.cache_data, row.expires_at)
+    if client is not None:
+        try:
+            remaining = math.ceil((row.expires_at - now).total_seconds())
+            await client.set(_REDIS_PREFIX + key, _pack(row.cache_data, row.expires_at), ex=max(remaining, 1))
+        except Exception as e:
+            _redis_failed(e)
+    return row.cache_data
+
+
+async def set_cached_analytics(session: AsyncSession, key: str, data: Any, ttl: int) -> None:
+    """
+    Store analytics data for ttl seconds.
+
+    Writes to Redis; the analytics_cache table is only written (upserted) when
+    Redis is unavailable. Caller commits the session.
+
+    Args:
+        session: Database session
+        key: Cache key
+        data: orjson-serializable value
+        ttl: Time-to-live in seconds
+    """
+    expires_at = now_naive_utc() + timedelta(seconds=ttl)
+    _remember(key, data, expires_at)
+
+    client = _get_redis()
+    if client is not None:
+        try:
+            await client.set(_REDIS_PREFIX + key, _pack(data, expires_at), ex=ttl)
+            return
+        except Exception as e:
+            _redis_failed(e)
+
+    await bulk_insert(
+        session,
+        AnalyticsCache,
+        [{"cache_key": key, "cache_data": data, "expires_at": expires_at}],
+        conflict_cols=["cache_key"],
+        update_cols=["cache_data", "expires_at"],
+    )
+
+
+async def sweep_expired_analytics(batch: int = _SWEEP_BATCH) -> int:
+    """
+    Delete expired analytics_cache rows in bounded batches.
+
+    Each batch picks the oldest expired ids from idx_analytics_cache_expires_id
+    (index-only) and deletes them in its own transaction, so a large backlog
+    never holds one long transaction or leaves a big autovacuum tail.
+
+    Args:
+        batch: Rows per DELETE
+
+    Returns:
+        Number of rows deleted
+    """
+    if not engine:
+        return 0
+    now = now_naive_utc()
+    expired_ids = (
+        select(AnalyticsCache.id)
+        .where(AnalyticsCache.expires_at < now)
+        .order_by(AnalyticsCache.expires_at)
+        .limit(batch)
+        .scalar_subquery()
+    )
+    stmt = delete(AnalyticsCache).where(AnalyticsCache.id.in_(expired_ids))
+
+    total = 0
+    while True:
+        async with engine.begin() as conn:
+            result = await conn.execute(stmt)
+        total += result.rowcount
+        if result.rowcount < batch:
+            break
+    if total:
+        logger.debug("Swept expired analytics cache rows", count=total)
+    return total
+
+
+async def run_analytics_sweeper(interval: float = _SWEEP_INTERVAL) -> None:
+    """Sweep expired analytics_cache rows every interval seconds until cancelled."""
+    while True:
+        try:
+            await sweep_expired_analytics()
+        except Exception as e:
+            logger.warning("Analytics cache sweep failed", error=str(e))
+        await asyncio.sleep(interval)
+
+
+def _evict(mapper, connection, target: AnalyticsCache) -> None:
+    """Drop an ORM-written row's key from memory and Redis so the new row is read."""
+    if _ANALYTICS_LRU is not None:
+        _ANALYTICS_LRU.pop(target.cache_key, None)
+
+    client = _get_redis()
+    if client is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    loop.create_task(_evict_redis(client, target.cache_key))
+
+
+async def _evict_redis(client: "aioredis.Redis", key: str) -> None:
+    """Delete a key from Redis, backing off on errors."""
+    try:
+        await client.delete(_REDIS_PREFIX + key)
+    except Exception as e:
+        _redis_failed(e)
+
+
+for _event_name in ("after_insert", "after_update", "after_delete"):
+    event.listen(AnalyticsCache, _event_name, _evict)
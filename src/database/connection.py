@@ -1,5 +1,9 @@
 """Database connection and session management."""
 
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import inspect
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import declarative_base
 
@@ -14,19 +18,28 @@ settings = get_settings()
 engine = None
 AsyncSessionLocal = None
 
+# Prepared statements turn repeated parameterized queries into BIND-only round trips.
+# pgbouncer in transaction mode can hand a session a different server connection,
+# so both caches must be off there.
+statement_cache_size = 0 if settings.db_pgbouncer_transaction_mode else settings.db_statement_cache_size
+
 try:
     engine = create_async_engine(
         settings.database_url,
         echo=False,  # Set to True for SQL query logging
         pool_pre_ping=True,  # Verify connections before using
-        pool_size=20,  # Increased from 10 - base pool size for better performance
-        max_overflow=30,  # Increased from 20 - allow more connections during spikes
-        pool_recycle=1800,  # Recycle connections every 30 min (reduced from 1 hour for better connection health)
-        pool_timeout=30,  # Max wait time for connection
+        pool_size=settings.db_pool_size,  # Base pool size (DB_POOL_SIZE)
+        max_overflow=settings.db_max_overflow,  # Extra connections allowed during spikes
+        pool_recycle=settings.db_pool_recycle,  # Recycle connections periodically for connection health
+        pool_timeout=settings.db_pool_timeout,  # Max wait time for connection
+        pool_use_lifo=True,  # Reuse the most recent connection; idle extras age out via pool_recycle
         connect_args={
-            "command_timeout": 30,  # 30 second query timeout
+            "command_timeout": settings.db_statement_timeout_ms / 1000,  # Client-side query timeout
+            "statement_cache_size": statement_cache_size,  # asyncpg's own statement cache
+            "prepared_statement_cache_size": statement_cache_size,  # SQLAlchemy adapter's cache
             "server_settings": {
-                "statement_timeout": "30000",  # 30 second statement timeout
+                "statement_timeout": str(settings.db_statement_timeout_ms),  # Server-side statement timeout
+                "jit": "off",  # JIT compile cost outweighs the gain on short OLTP queries
             }
         },
     )
@@ -39,7 +52,14 @@ try:
         autocommit=False,
         autoflush=False,
     )
-    logger.info("Database engine created successfully")
+    logger.info(
+        "Database engine created successfully",
+        pool_size=settings.db_pool_size,
+        max_overflow=settings.db_max_overflow,
+        pool_recycle=settings.db_pool_recycle,
+        statement_timeout_ms=settings.db_statement_timeout_ms,
+        statement_cache_size=statement_cache_size,
+    )
 except Exception as e:
     logger.warning("Database not available (this is OK - API will work without DB)", error=str(e))
     engine = None
@@ -84,6 +104,89 @@ async def init_db():
         logger.warning("Database initialization failed (this is OK if DB is not set up)", error=str(e))
 
 
+# bulk_insert switches from multi-row INSERT to binary COPY at this many rows
+COPY_THRESHOLD = 100
+
+
+async def bulk_insert(
+    session: AsyncSession,
+    model: Any,
+    rows: Sequence[Dict[str, Any]],
+    conflict_cols: Optional[Sequence[str]] = None,
+    chunk: int = 1000,
+    update_cols: Optional[Sequence[str]] = None,
+) -> None:
+    """
+    Insert rows with multi-row INSERT ... VALUES statements, or COPY.
+
+    One statement per chunk instead of one per row. Without conflict_cols,
+    COPY_THRESHOLD or more rows go through copy_rows() instead (values are
+    bind-processed by their column types; client-side Column defaults are not
+    applied, so rows must carry every column without a server default).
+    Caller commits.
+
+    Args:
+        session: Database session
+        model: Mapped model class
+        rows: Column-name to value mappings (all with the same keys)
+        conflict_cols: Unique columns; rows conflicting on them are skipped,
+            or updated when update_cols is given
+        chunk: Rows per statement (asyncpg caps a statement at 32767 parameters)
+        update_cols: Columns overwritten from the new row on conflict (upsert).
+            Rows within one call must not share a conflict key.
+    """
+    if not conflict_cols and len(rows) >= COPY_THRESHOLD:
+        connection = await session.connection()
+        keys = list(rows[0])
+        columns = [inspect(model).columns[key] for key in keys]
+        processors = [column.type.bind_processor(connection.dialect) for column in columns]
+        records = [
+            tuple(process(row[key]) if process else row[key] for key, process in zip(keys, processors))
+            for row in rows
+        ]
+        await copy_rows(session, model, [column.name for column in columns], records)
+        return
+
+    for start in range(0, len(rows), chunk):
+        stmt = pg_insert(model).values(rows[start:start + chunk])
+        if conflict_cols and update_cols:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=list(conflict_cols),
+                set_={col: stmt.excluded[col] for col in update_cols},
+            )
+        elif conflict_cols:
+            stmt = stmt.on_conflict_do_nothing(index_elements=list(conflict_cols))
+        await session.execute(stmt)
+
+
+async def copy_rows(
+    session: AsyncSession,
+    model: Any,
+    columns: Sequence[str],
+    records: Sequence[Tuple[Any, ...]],
+) -> None:
+    """
+    Append rows with a binary COPY (asyncpg copy_records_to_table).
+
+    Runs inside the session's transaction; caller commits. Omitted columns get
+    their server defaults. No RETURNING and no ORM events, so use it for
+    append-only rows nothing needs back.
+
+    Args:
+        session: Database session
+        model: Mapped model class
+        columns: Column names, in record order
+        records: Row tuples matching columns
+    """
+    if not records:
+        return
+    connection = await session.connection()
+    raw = await connection.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        model.__tablename__, records=records, columns=list(columns)
+    )
+
+
 async def close_db():
     """Close database connections."""
     if engine:
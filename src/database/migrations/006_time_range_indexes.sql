@@ -0,0 +1,24 @@
+-- Time-range indexes migration
+-- Composite (key, time) indexes for the append-heavy tables, which are almost
+-- always queried per market (or per mode) over a time range. Idempotent: some of
+-- these already exist on databases created from schema.sql or 002.
+
+-- Trades: per-market history, newest first
+CREATE INDEX IF NOT EXISTS idx_trades_market_id_entry_time
+ON trades(market_id, entry_time DESC);
+
+-- Predictions: per-market history
+CREATE INDEX IF NOT EXISTS idx_predictions_market_time
+ON predictions(market_id, prediction_time);
+
+-- Feature snapshots: covered by the uq_feature_snapshot (market_id, snapshot_time) constraint
+
+-- Portfolio snapshots: latest paper-trading snapshots
+CREATE INDEX IF NOT EXISTS idx_portfolio_paper_snapshot
+ON portfolio_snapshots(paper_trading, snapshot_time DESC)
+WHERE paper_trading = true;
+
+-- Analyze tables to update query planner statistics
+ANALYZE trades;
+ANALYZE predictions;
+ANALYZE portfolio_snapshots;
@@ -0,0 +1,28 @@
+-- JSONB columns migration
+-- feature_snapshots.features and predictions.model_predictions as binary JSONB
+-- (no reparse on read, indexable subkeys). Databases created from schema.sql
+-- already use JSONB; the conversion only runs where the column is still json.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'feature_snapshots' AND column_name = 'features' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE feature_snapshots ALTER COLUMN features TYPE jsonb USING features::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'predictions' AND column_name = 'model_predictions' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE predictions ALTER COLUMN model_predictions TYPE jsonb USING model_predictions::jsonb;
+    END IF;
+END $$;
+
+-- GIN index for feature key / containment lookups (features ? 'x', features @> '{...}')
+CREATE INDEX IF NOT EXISTS idx_feature_snapshots_features_gin
+ON feature_snapshots USING gin (features);
+
+ANALYZE feature_snapshots;
+ANALYZE predictions;
@@ -0,0 +1,20 @@
+-- Float money columns migration
+-- Trade size/PnL and portfolio snapshot values are summed and charted far more
+-- often than they need exact decimal arithmetic; store them as DOUBLE PRECISION
+-- (hardware float8) instead of NUMERIC. Prices keep NUMERIC.
+
+ALTER TABLE trades
+    ALTER COLUMN size TYPE double precision USING size::double precision,
+    ALTER COLUMN pnl TYPE double precision USING pnl::double precision;
+
+ALTER TABLE portfolio_snapshots
+    ALTER COLUMN total_value TYPE double precision USING total_value::double precision,
+    ALTER COLUMN cash TYPE double precision USING cash::double precision,
+    ALTER COLUMN positions_value TYPE double precision USING positions_value::double precision,
+    ALTER COLUMN total_exposure TYPE double precision USING total_exposure::double precision,
+    ALTER COLUMN daily_pnl TYPE double precision USING daily_pnl::double precision,
+    ALTER COLUMN unrealized_pnl TYPE double precision USING unrealized_pnl::double precision,
+    ALTER COLUMN realized_pnl TYPE double precision USING realized_pnl::double precision;
+
+ANALYZE trades;
+ANALYZE portfolio_snapshots;
@@ -0,0 +1,37 @@
+-- BIGINT keys and BRIN time index migration
+-- 64-bit surrogate keys for the unbounded append-only tables (and the columns
+-- referencing them), so ids cannot overflow int4. Rewrites the tables and takes
+-- ACCESS EXCLUSIVE locks - run during a low-traffic window.
+
+ALTER TABLE feature_snapshots ALTER COLUMN id TYPE bigint;
+ALTER TABLE predictions ALTER COLUMN id TYPE bigint;
+ALTER TABLE signals
+    ALTER COLUMN id TYPE bigint,
+    ALTER COLUMN prediction_id TYPE bigint;
+ALTER TABLE trades
+    ALTER COLUMN id TYPE bigint,
+    ALTER COLUMN signal_id TYPE bigint;
+ALTER TABLE portfolio_snapshots ALTER COLUMN id TYPE bigint;
+ALTER TABLE alert_history ALTER COLUMN signal_id TYPE bigint;
+
+-- SERIAL sequences are created AS integer; widen them with their columns
+ALTER SEQUENCE IF EXISTS feature_snapshots_id_seq AS bigint;
+ALTER SEQUENCE IF EXISTS predictions_id_seq AS bigint;
+ALTER SEQUENCE IF EXISTS signals_id_seq AS bigint;
+ALTER SEQUENCE IF EXISTS trades_id_seq AS bigint;
+ALTER SEQUENCE IF EXISTS portfolio_snapshots_id_seq AS bigint;
+
+-- Feature snapshots: rows arrive in snapshot_time order and are never sorted by
+-- time alone (per-market lookups use uq_feature_snapshot), so a BRIN index serves
+-- time-range scans at a fraction of the B-tree's size.
+-- prediction_time / entry_time / portfolio snapshot_time keep their B-trees:
+-- the API sorts by them for "latest N" queries, which BRIN cannot serve.
+DROP INDEX IF EXISTS ix_feature_snapshots_snapshot_time;
+CREATE INDEX IF NOT EXISTS idx_feature_snapshots_snapshot_time_brin
+ON feature_snapshots USING brin (snapshot_time) WITH (pages_per_range = 32);
+
+ANALYZE feature_snapshots;
+ANALYZE predictions;
+ANALYZE signals;
+ANALYZE trades;
+ANALYZE portfolio_snapshots;
@@ -0,0 +1,29 @@
+-- Composite indexes migration
+-- Serve the filtered "newest first" reads on trades/signals/whale_trades from one
+-- index range scan instead of single-column scan + filter + sort.
+-- CONCURRENTLY avoids blocking writes while building; it cannot run inside a
+-- transaction block, so run this file without wrapping it in one (plain psql -f).
+-- Predictions are already covered by idx_predictions_market_time (006): a
+-- backward scan of (market_id, prediction_time) serves "latest prediction per market".
+
+-- Trades: /trades?market_id=&status= ordered by entry_time
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trades_market_status_time
+ON trades(market_id, status, entry_time DESC);
+
+-- Trades: open positions per mode (paper/live); only live rows are indexed
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_trades_paper_open
+ON trades(paper_trading, status)
+WHERE status = 'OPEN';
+
+-- Signals: per-market feed filtered by executed
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_signals_market_executed_time
+ON signals(market_id, executed, created_at DESC);
+
+-- Whale trades: per-whale history
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_whale_trades_whale_time
+ON whale_trades(whale_id, trade_time DESC);
+
+-- Analyze tables to update query planner statistics
+ANALYZE trades;
+ANALYZE signals;
+ANALYZE whale_trades;
@@ -0,0 +1,35 @@
+-- JSONB alerts/analytics migration
+-- alerts.alert_rule and analytics_cache.cache_data as binary JSONB. Tables created
+-- from add_alerts_and_paper_trading.sql already use JSONB; the conversion only runs
+-- where init_db() created them as json.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'alerts' AND column_name = 'alert_rule' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE alerts ALTER COLUMN alert_rule TYPE jsonb USING alert_rule::jsonb;
+    END IF;
+
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'analytics_cache' AND column_name = 'cache_data' AND data_type = 'json'
+    ) THEN
+        ALTER TABLE analytics_cache ALTER COLUMN cache_data TYPE jsonb USING cache_data::jsonb;
+    END IF;
+END $$;
+
+-- GIN index for rule key / containment lookups
+CREATE INDEX IF NOT EXISTS idx_alerts_rule_gin
+ON alerts USING gin (alert_rule);
+
+-- Rebuild the feature GIN index with jsonb_path_ops: ~30% smaller and faster for
+-- containment (features @> '{...}'), at the cost of key-existence (?) support
+DROP INDEX IF EXISTS idx_feature_snapshots_features_gin;
+CREATE INDEX IF NOT EXISTS idx_feature_snapshots_features_gin
+ON feature_snapshots USING gin (features jsonb_path_ops);
+
+ANALYZE alerts;
+ANALYZE analytics_cache;
+ANALYZE feature_snapshots;
@@ -0,0 +1,23 @@
+-- Portfolio daily materialized view migration
+-- One row per (day, mode) instead of every snapshot, so portfolio dashboards scan
+-- O(days) rows. Refreshed by src/database/portfolio_views.py after snapshot inserts.
+
+CREATE MATERIALIZED VIEW IF NOT EXISTS mv_portfolio_daily AS
+SELECT
+    date_trunc('day', snapshot_time) AS day,
+    paper_trading,
+    (array_agg(total_value ORDER BY snapshot_time ASC))[1] AS open_value,
+    (array_agg(total_value ORDER BY snapshot_time DESC))[1] AS close_value,
+    avg(total_value) AS avg_value,
+    min(total_value) AS min_value,
+    max(total_value) AS max_value,
+    (array_agg(realized_pnl ORDER BY snapshot_time DESC))[1] AS realized_pnl,
+    count(*) AS snapshot_count
+FROM portfolio_snapshots
+GROUP BY 1, 2;
+
+-- Unique index: required for REFRESH ... CONCURRENTLY, and serves per-mode day ranges
+CREATE UNIQUE INDEX IF NOT EXISTS idx_mv_portfolio_daily_paper_day
+ON mv_portfolio_daily(paper_trading, day);
+
+ANALYZE mv_portfolio_daily;
@@ -0,0 +1,19 @@
+-- Trade price units migration
+-- trades.entry_price / exit_price as BIGINT micro-units (price * 1e6, the same
+-- precision as the old NUMERIC(10, 6)): fixed 8-byte values and native integer
+-- decoding instead of variable-length numeric. The Trade model converts to and
+-- from Decimal. Rewrites the table - run during a low-traffic window.
+
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'trades' AND column_name = 'entry_price' AND data_type = 'numeric'
+    ) THEN
+        ALTER TABLE trades
+            ALTER COLUMN entry_price TYPE bigint USING round(entry_price * 1000000)::bigint,
+            ALTER COLUMN exit_price TYPE bigint USING round(exit_price * 1000000)::bigint;
+    END IF;
+END $$;
+
+ANALYZE trades;
@@ -0,0 +1,27 @@
+-- BRIN time indexes migration
+-- Replace B-trees on append-only timestamp columns with BRIN: rows arrive in time
+-- order, so block ranges map to time ranges and the index is a few pages instead
+-- of ~1 entry per row (less write amplification and WAL on ingest).
+-- portfolio_snapshots.snapshot_time keeps its B-tree: the API reads the latest N
+-- snapshots with no time filter, which BRIN cannot serve in order.
+
+-- Whale trades: recent-activity windows (trade_time >= cutoff)
+DROP INDEX IF EXISTS ix_whale_trades_trade_time;
+DROP INDEX IF EXISTS idx_whale_trades_trade_time;
+CREATE INDEX IF NOT EXISTS idx_whale_trades_trade_time_brin
+ON whale_trades USING brin (trade_time) WITH (pages_per_range = 32);
+
+-- Alert history: per-alert reads use the alert_id index
+DROP INDEX IF EXISTS ix_alert_history_sent_at;
+DROP INDEX IF EXISTS idx_alert_history_sent;
+CREATE INDEX IF NOT EXISTS idx_alert_history_sent_at_brin
+ON alert_history USING brin (sent_at) WITH (pages_per_range = 32);
+
+-- Event market impact
+DROP INDEX IF EXISTS ix_event_market_impact_measured_at;
+CREATE INDEX IF NOT EXISTS idx_event_market_impact_measured_at_brin
+ON event_market_impact USING brin (measured_at) WITH (pages_per_range = 32);
+
+ANALYZE whale_trades;
+ANALYZE alert_history;
+ANALYZE event_market_impact;
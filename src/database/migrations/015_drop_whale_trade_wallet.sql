@@ -0,0 +1,6 @@
+-- Drop whale_trades.wallet_address migration
+-- The wallet is already identified by whale_id (FK to whale_wallets, which keeps
+-- the address); the 42-char copy and its index cost ~50 bytes per trade row.
+
+DROP INDEX IF EXISTS ix_whale_trades_wallet_address;
+ALTER TABLE whale_trades DROP COLUMN IF EXISTS wallet_address;
@@ -0,0 +1,25 @@
+-- Partial alert indexes migration
+-- Alert flags are only ever queried for their selective value (enabled, unread,
+-- not yet sent), so index just those rows instead of the whole boolean column.
+
+-- Alerts: dispatch reads enabled alerts of one type
+DROP INDEX IF EXISTS ix_alerts_enabled;
+DROP INDEX IF EXISTS idx_alerts_enabled;
+CREATE INDEX IF NOT EXISTS idx_alerts_enabled_type_user
+ON alerts(alert_type, user_id)
+WHERE enabled = true;
+
+-- Whale alerts: unread feed per user, newest first
+DROP INDEX IF EXISTS ix_whale_alerts_is_read;
+CREATE INDEX IF NOT EXISTS idx_whale_alerts_unread
+ON whale_alerts(user_id, created_at DESC)
+WHERE is_read = false;
+
+-- Event alerts: pending notifications by due time
+CREATE INDEX IF NOT EXISTS idx_event_alerts_pending
+ON event_alerts(alert_time)
+WHERE notification_sent = false;
+
+ANALYZE alerts;
+ANALYZE whale_alerts;
+ANALYZE event_alerts;
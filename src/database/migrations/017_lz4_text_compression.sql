@@ -0,0 +1,11 @@
+-- LZ4 text compression migration (PostgreSQL 14+)
+-- Values of these text columns that get compressed use LZ4 instead of pglz: several
+-- times faster to decompress on every read. Applies to newly written values only;
+-- existing rows keep pglz until rewritten (e.g. VACUUM FULL). Matches
+-- Column(..., info=LZ4) in models.py for tables created by init_db().
+
+ALTER TABLE markets ALTER COLUMN question SET COMPRESSION lz4;
+ALTER TABLE whale_trades ALTER COLUMN market_question SET COMPRESSION lz4;
+ALTER TABLE alert_history ALTER COLUMN message SET COMPRESSION lz4;
+ALTER TABLE alerts ALTER COLUMN notification_target SET COMPRESSION lz4;
+ALTER TABLE economic_events ALTER COLUMN description SET COMPRESSION lz4;
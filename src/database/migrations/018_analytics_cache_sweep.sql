@@ -0,0 +1,14 @@
+-- Analytics cache sweep migration
+-- The expiry sweeper deletes expired rows by id in batches of 1000. Covering
+-- (expires_at) with INCLUDE (id) lets it pick each batch with an index-only
+-- scan instead of a range scan plus heap fetches. A partial
+-- "WHERE expires_at < now()" index is not possible (now() is not immutable).
+
+CREATE INDEX IF NOT EXISTS idx_analytics_cache_expires_id
+ON analytics_cache(expires_at) INCLUDE (id);
+
+-- Superseded by the covering index above
+DROP INDEX IF EXISTS idx_analytics_cache_expires;
+DROP INDEX IF EXISTS ix_analytics_cache_expires_at;
+
+ANALYZE analytics_cache;
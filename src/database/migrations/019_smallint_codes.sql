@@ -0,0 +1,51 @@
+-- SMALLINT code columns migration
+-- Short YES/NO, STRONG/MEDIUM/WEAK, OPEN/CLOSED/CANCELLED and BUY/SELL codes are
+-- stored as 2-byte integers (see the IntEnums in src/database/models.py), so
+-- index probes compare fixed-width values instead of varlena text. Unknown
+-- codes fail the cast here rather than being silently kept.
+
+-- Partial indexes whose predicate compares against a text literal must go first
+DROP INDEX IF EXISTS idx_trades_paper_open;
+DROP INDEX IF EXISTS idx_trades_status_created;
+
+-- Markets
+ALTER TABLE markets ALTER COLUMN outcome TYPE smallint USING (
+    CASE upper(outcome) WHEN 'YES' THEN 1 WHEN 'NO' THEN 2 END
+);
+
+-- Signals
+ALTER TABLE signals
+    ALTER COLUMN side TYPE smallint USING (
+        CASE upper(side) WHEN 'YES' THEN 1 WHEN 'NO' THEN 2 END
+    ),
+    ALTER COLUMN signal_strength TYPE smallint USING (
+        CASE upper(signal_strength) WHEN 'WEAK' THEN 1 WHEN 'MEDIUM' THEN 2 WHEN 'STRONG' THEN 3 END
+    );
+
+-- Trades
+ALTER TABLE trades
+    ALTER COLUMN side TYPE smallint USING (
+        CASE upper(side) WHEN 'YES' THEN 1 WHEN 'NO' THEN 2 END
+    ),
+    ALTER COLUMN status TYPE smallint USING (
+        CASE upper(status) WHEN 'OPEN' THEN 1 WHEN 'CLOSED' THEN 2 WHEN 'CANCELLED' THEN 3 END
+    );
+
+-- Whale trades
+ALTER TABLE whale_trades
+    ALTER COLUMN trade_type TYPE smallint USING (
+        CASE upper(trade_type) WHEN 'BUY' THEN 1 WHEN 'SELL' THEN 2 END
+    ),
+    ALTER COLUMN outcome TYPE smallint USING (
+        CASE upper(outcome) WHEN 'YES' THEN 1 WHEN 'NO' THEN 2 END
+    );
+
+-- Open positions by mode (was WHERE status = 'OPEN')
+CREATE INDEX IF NOT EXISTS idx_trades_paper_open
+ON trades(paper_trading, status)
+WHERE status = 1;
+
+ANALYZE markets;
+ANALYZE signals;
+ANALYZE trades;
+ANALYZE whale_trades;
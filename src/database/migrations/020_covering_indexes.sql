@@ -0,0 +1,23 @@
+-- Covering indexes migration
+-- Dashboard reads of predictions/signals only need a few small columns beyond the
+-- key, so INCLUDE them and let those queries run as index-only scans instead of
+-- fetching every matching heap page. Each replaces the narrower index it supersedes.
+-- CONCURRENTLY cannot run inside a transaction block: run with plain psql -f.
+
+-- Predictions: latest/ranged predictions per market with probability, price, edge, confidence
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_predictions_market_time_cover
+ON predictions(market_id, prediction_time DESC)
+INCLUDE (model_probability, market_price, edge, confidence);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_predictions_market_time;
+
+-- Signals: per-market feed with side, strength and size
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_signals_market_executed_time_cover
+ON signals(market_id, executed, created_at DESC)
+INCLUDE (side, signal_strength, suggested_size);
+
+DROP INDEX CONCURRENTLY IF EXISTS idx_signals_market_executed_time;
+
+-- Index-only scans need an up-to-date visibility map
+VACUUM (ANALYZE) predictions;
+VACUUM (ANALYZE) signals;
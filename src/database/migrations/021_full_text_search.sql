@@ -0,0 +1,25 @@
+-- Full-text search migration
+-- Keyword filters on market questions and economic events use a stored tsvector
+-- with a GIN index (search_tsv @@ plainto_tsquery('english', ...)) instead of an
+-- ILIKE '%...%' scan over every row. Generated columns need PostgreSQL 12+.
+
+-- Markets: question
+ALTER TABLE markets
+ADD COLUMN IF NOT EXISTS search_tsv tsvector
+GENERATED ALWAYS AS (to_tsvector('english', coalesce(question, ''))) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_markets_search_gin
+ON markets USING gin(search_tsv);
+
+-- Economic events: name and description
+ALTER TABLE economic_events
+ADD COLUMN IF NOT EXISTS search_tsv tsvector
+GENERATED ALWAYS AS (
+    to_tsvector('english', coalesce(event_name, '') || ' ' || coalesce(description, ''))
+) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_economic_events_search_gin
+ON economic_events USING gin(search_tsv);
+
+ANALYZE markets;
+ANALYZE economic_events;
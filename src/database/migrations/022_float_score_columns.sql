@@ -0,0 +1,32 @@
+-- Float score columns migration
+-- Model outputs, evaluation metrics and relevance/change scores are analytical
+-- values that are averaged, sorted and compared, never booked; store them as
+-- DOUBLE PRECISION (fixed 8 bytes, hardware arithmetic) instead of NUMERIC.
+-- Prices, volumes and profit totals keep NUMERIC (see 008 for trade/portfolio money).
+
+ALTER TABLE predictions
+    ALTER COLUMN model_probability TYPE double precision USING model_probability::double precision,
+    ALTER COLUMN edge TYPE double precision USING edge::double precision,
+    ALTER COLUMN confidence TYPE double precision USING confidence::double precision;
+
+ALTER TABLE model_performance
+    ALTER COLUMN accuracy TYPE double precision USING accuracy::double precision,
+    ALTER COLUMN brier_score TYPE double precision USING brier_score::double precision,
+    ALTER COLUMN log_loss TYPE double precision USING log_loss::double precision,
+    ALTER COLUMN auc_roc TYPE double precision USING auc_roc::double precision;
+
+ALTER TABLE whale_wallets
+    ALTER COLUMN win_rate TYPE double precision USING win_rate::double precision;
+
+ALTER TABLE market_events
+    ALTER COLUMN relevance_score TYPE double precision USING relevance_score::double precision;
+
+ALTER TABLE event_market_impact
+    ALTER COLUMN price_change_pct TYPE double precision USING price_change_pct::double precision,
+    ALTER COLUMN volume_change_pct TYPE double precision USING volume_change_pct::double precision;
+
+ANALYZE predictions;
+ANALYZE model_performance;
+ANALYZE whale_wallets;
+ANALYZE market_events;
+ANALYZE event_market_impact;
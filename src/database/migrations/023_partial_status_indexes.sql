@@ -0,0 +1,33 @@
+-- Partial status indexes migration
+-- Status/flag columns are only filtered on alone for their rare "live" value
+-- (open trades, unexecuted signals, upcoming events). Index just those rows and
+-- drop the full-column indexes, which mostly index closed history.
+
+-- Trades: open positions newest first (status 1 = OPEN, see 019_smallint_codes.sql)
+CREATE INDEX IF NOT EXISTS idx_trades_open_entry_time
+ON trades(entry_time DESC)
+WHERE status = 1;
+
+DROP INDEX IF EXISTS ix_trades_status;
+DROP INDEX IF EXISTS idx_trades_status;
+DROP INDEX IF EXISTS idx_trades_status_entry_time;
+
+-- Signals: pending signals (idx_signals_active may already exist from 002)
+CREATE INDEX IF NOT EXISTS idx_signals_active
+ON signals(created_at DESC)
+WHERE executed = false;
+
+DROP INDEX IF EXISTS ix_signals_executed;
+DROP INDEX IF EXISTS idx_signals_executed;
+
+-- Economic events: upcoming events by date
+CREATE INDEX IF NOT EXISTS idx_economic_events_pending_date
+ON economic_events(event_date)
+WHERE is_completed = false;
+
+DROP INDEX IF EXISTS ix_economic_events_is_completed;
+DROP INDEX IF EXISTS idx_economic_events_completed;
+
+ANALYZE trades;
+ANALYZE signals;
+ANALYZE economic_events;
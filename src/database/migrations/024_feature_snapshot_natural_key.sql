@@ -0,0 +1,20 @@
+-- Feature snapshot natural key migration
+-- Nothing references feature_snapshots.id; every read and the upsert go through
+-- (market_id, snapshot_time). Promote that key to the primary key and drop the
+-- surrogate id, so each insert maintains one btree instead of three.
+
+-- Dropping id also drops its primary key, ix_feature_snapshots_id and the sequence
+ALTER TABLE feature_snapshots DROP COLUMN IF EXISTS id;
+
+-- The unique constraint is named by the ORM or by schema.sql, depending on setup
+ALTER TABLE feature_snapshots DROP CONSTRAINT IF EXISTS uq_feature_snapshot;
+ALTER TABLE feature_snapshots DROP CONSTRAINT IF EXISTS feature_snapshots_market_id_snapshot_time_key;
+
+ALTER TABLE feature_snapshots
+ADD CONSTRAINT feature_snapshots_pkey PRIMARY KEY (market_id, snapshot_time);
+
+-- Covered by the primary key's leading column(s)
+DROP INDEX IF EXISTS idx_features_market_time;
+DROP INDEX IF EXISTS ix_feature_snapshots_market_id;
+
+ANALYZE feature_snapshots;
@@ -0,0 +1,29 @@
+-- Server-side zero defaults migration
+-- Counters and running totals default to 0 in the database, so inserts can
+-- leave them out of the column list instead of sending an explicit 0.
+-- Backfill any NULLs left from the original nullable columns (004 / alerts).
+
+UPDATE alerts SET trigger_count = 0 WHERE trigger_count IS NULL;
+ALTER TABLE alerts
+    ALTER COLUMN trigger_count SET DEFAULT 0,
+    ALTER COLUMN trigger_count SET NOT NULL;
+
+UPDATE whale_wallets
+SET total_volume = COALESCE(total_volume, 0),
+    total_trades = COALESCE(total_trades, 0),
+    win_rate = COALESCE(win_rate, 0),
+    total_profit = COALESCE(total_profit, 0)
+WHERE total_volume IS NULL
+   OR total_trades IS NULL
+   OR win_rate IS NULL
+   OR total_profit IS NULL;
+
+ALTER TABLE whale_wallets
+    ALTER COLUMN total_volume SET DEFAULT 0,
+    ALTER COLUMN total_volume SET NOT NULL,
+    ALTER COLUMN total_trades SET DEFAULT 0,
+    ALTER COLUMN total_trades SET NOT NULL,
+    ALTER COLUMN win_rate SET DEFAULT 0,
+    ALTER COLUMN win_rate SET NOT NULL,
+    ALTER COLUMN total_profit SET DEFAULT 0,
+    ALTER COLUMN total_profit SET NOT NULL;
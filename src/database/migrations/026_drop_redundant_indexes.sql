@@ -0,0 +1,43 @@
+-- Redundant index cleanup migration
+-- Drop single-column indexes whose column is already the primary key or the
+-- leading column of a composite/unique index. Lookups on that column use the
+-- wider index, and every insert stops paying for a second btree.
+-- Check pg_stat_user_indexes (idx_scan) on production before running.
+-- CONCURRENTLY cannot run inside a transaction block: run with plain psql -f.
+
+-- ix_<table>_id duplicates of each primary key (from index=True on id)
+DROP INDEX CONCURRENTLY IF EXISTS ix_markets_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_predictions_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_signals_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_trades_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_model_performance_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_portfolio_snapshots_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_alerts_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_alert_history_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_analytics_cache_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_whale_wallets_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_whale_trades_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_whale_alerts_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_economic_events_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_market_events_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_event_alerts_id;
+DROP INDEX CONCURRENTLY IF EXISTS ix_event_market_impact_id;
+
+-- predictions(market_id): covered by idx_predictions_market_time_cover
+DROP INDEX CONCURRENTLY IF EXISTS ix_predictions_market_id;
+
+-- signals(market_id): covered by idx_signals_market_executed_time_cover
+DROP INDEX CONCURRENTLY IF EXISTS ix_signals_market_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_signals_market;
+
+-- trades(market_id): covered by idx_trades_market_id_entry_time / idx_trades_market_status_time
+DROP INDEX CONCURRENTLY IF EXISTS ix_trades_market_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_trades_market;
+
+-- whale_trades(whale_id): covered by idx_whale_trades_whale_time
+DROP INDEX CONCURRENTLY IF EXISTS ix_whale_trades_whale_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_whale_trades_whale_id;
+
+-- market_events(market_id): covered by the uq_market_event (market_id, event_id) unique
+DROP INDEX CONCURRENTLY IF EXISTS ix_market_events_market_id;
+DROP INDEX CONCURRENTLY IF EXISTS idx_market_events_market_id;
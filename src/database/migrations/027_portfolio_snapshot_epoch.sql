@@ -0,0 +1,9 @@
+-- Portfolio snapshot epoch migration
+-- Daily-close fallbacks read snapshot times only to bucket them by UTC day.
+-- A stored BIGINT epoch copy lets that run as integer math in NumPy instead of
+-- decoding a datetime per row. Generated columns need PostgreSQL 12+.
+-- Adding a stored generated column rewrites the table: run off-peak.
+
+ALTER TABLE portfolio_snapshots
+ADD COLUMN IF NOT EXISTS ts_epoch BIGINT
+GENERATED ALWAYS AS (extract(epoch FROM snapshot_time)::bigint) STORED;
@@ -0,0 +1,18 @@
+-- Binary on-chain ids migration
+-- Wallet addresses (0x + 40 hex) and transaction hashes (0x + 64 hex) are stored
+-- as raw BYTEA (20 / 32 bytes) instead of hex text: about half the size in the
+-- table and in every index on them. The ORM (HexBytes) still reads and writes
+-- 0x-prefixed hex strings. Values that are not valid hex make this migration fail:
+-- check first with
+--   SELECT wallet_address FROM whale_wallets WHERE wallet_address !~* '^0x[0-9a-f]{40}$';
+--   SELECT transaction_hash FROM whale_trades WHERE transaction_hash !~* '^0x[0-9a-f]{64}$';
+-- The type change rewrites both tables: run off-peak.
+
+-- Plain index duplicated the UNIQUE constraint's index (see 004_whale_tracking.sql)
+DROP INDEX IF EXISTS idx_whale_wallets_address;
+
+ALTER TABLE whale_wallets
+    ALTER COLUMN wallet_address TYPE bytea USING decode(substr(wallet_address, 3), 'hex');
+
+ALTER TABLE whale_trades
+    ALTER COLUMN transaction_hash TYPE bytea USING decode(substr(transaction_hash, 3), 'hex');
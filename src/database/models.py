@@ -1,34 +1,185 @@
 """SQLAlchemy models for database tables."""
 
 from datetime import datetime, timezone
-from decimal import Decimal
-from typing import Optional
+from decimal import ROUND_HALF_UP, Decimal
+from enum import IntEnum
+from typing import Optional, Type, Union
 
-from sqlalchemy import JSON, Boolean, Column, Date, DateTime, ForeignKey, Integer, Numeric, String, Text, UniqueConstraint, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import BigInteger, Boolean, Column, Computed, Date, DateTime, Float, ForeignKey, Index, Integer, LargeBinary, Numeric, SmallInteger, String, Table, Text, UniqueConstraint, cast, event, func, literal, text
+from sqlalchemy.types import TypeDecorator
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import deferred, relationship
 
 from .connection import Base
 
+# Trade prices are stored as BIGINT micro-units (price * 1e6, the old NUMERIC(10, 6) precision)
+PRICE_SCALE = 1_000_000
+
+
+def _to_price_units(value: Optional[Union[Decimal, float, str]]) -> Optional[int]:
+    """Convert a price to integer micro-units (None passes through)."""
+    if value is None:
+        return None
+    return int((Decimal(str(value)) * PRICE_SCALE).to_integral_value(rounding=ROUND_HALF_UP))
+
+
+def _from_price_units(units: Optional[int]) -> Optional[Decimal]:
+    """Convert integer micro-units back to a Decimal price (None passes through)."""
+    if units is None:
+        return None
+    return Decimal(units) / PRICE_SCALE
+
+
+# Short code columns are stored as SMALLINT (see migrations/019_smallint_codes.sql).
+# Numbers are persisted: append new members, never renumber.
+class Side(IntEnum):
+    """Binary outcome / position side."""
+
+    YES = 1
+    NO = 2
+
+
+class SignalStrength(IntEnum):
+    """Signal strength, ordered weakest to strongest."""
+
+    WEAK = 1
+    MEDIUM = 2
+    STRONG = 3
+
+
+class TradeStatus(IntEnum):
+    """Trade lifecycle status."""
+
+    OPEN = 1
+    CLOSED = 2
+    CANCELLED = 3
+
+
+class TradeType(IntEnum):
+    """Whale trade direction."""
+
+    BUY = 1
+    SELL = 2
+
+
+class SmallIntCode(TypeDecorator):
+    """
+    SMALLINT column holding an IntEnum, read and written as the member name.
+
+    Accepts names (any case), members or their integer values; anything else
+    raises ValueError at bind time. Results come back as the upper-case name,
+    so code comparing against "YES"/"OPEN" strings is unaffected.
+    """
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, enum: Type[IntEnum]):
+        super().__init__()
+        self.enum = enum
+
+    def process_bind_param(self, value, dialect) -> Optional[int]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                return int(self.enum[value.upper()])
+            except KeyError:
+                raise ValueError(f"Invalid {self.enum.__name__}: {value!r}") from None
+        return int(self.enum(value))
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return self.enum(value).name
+
+
+class HexBytes(TypeDecorator):
+    """
+    BYTEA column holding a fixed-length on-chain id (address, tx hash), read and
+    written as a 0x-prefixed hex string.
+
+    Stores the raw bytes (20 for an address, 32 for a tx hash) instead of the
+    hex text, so values and their indexes are about half the size. Hex input is
+    case-insensitive; results come back lower-case with the 0x prefix.
+    """
+
+    impl = LargeBinary
+    cache_ok = True
+
+    def __init__(self, length: int):
+        super().__init__(length)
+        self.length = length
+
+    def process_bind_param(self, value, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        if isinstance(value, str):
+            try:
+                value = bytes.fromhex(value[2:] if value[:2].lower() == "0x" else value)
+            except ValueError:
+                raise ValueError(f"Invalid hex value: {value!r}") from None
+        if len(value) != self.length:
+            raise ValueError(f"Expected {self.length} bytes, got {len(value)}")
+        return bytes(value)
+
+    def process_result_value(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return "0x" + bytes(value).hex()
+
+
+# Column.info marker for LZ4 TOAST compression (faster to decompress than the pglz default)
+LZ4 = {"compression": "lz4"}
+
+
+@event.listens_for(Table, "after_create")
+def _set_column_compression(table: Table, connection, **kw) -> None:
+    """Apply Column.info["compression"] after CREATE TABLE (PostgreSQL 14+)."""
+    if connection.dialect.name != "postgresql" or (connection.dialect.server_version_info or (0,)) < (14,):
+        return
+    preparer = connection.dialect.identifier_preparer
+    for column in table.columns:
+        method = column.info.get("compression")
+        if method:
+            connection.execute(
+                text(
+                    f"ALTER TABLE {preparer.format_table(table)} "
+                    f"ALTER COLUMN {preparer.quote(column.name)} SET COMPRESSION {method}"
+                )
+            )
+
 
 class Market(Base):
     """Market model."""
 
     __tablename__ = "markets"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     market_id = Column(String(66), unique=True, nullable=False, index=True)
     condition_id = Column(String(66), nullable=False)
-    question = Column(Text, nullable=False)
+    question = Column(Text, nullable=False, info=LZ4)
     category = Column(String(50), nullable=True)
     resolution_date = Column(DateTime, nullable=True, index=True)
-    outcome = Column(String(3), nullable=True, index=True)  # YES/NO/NULL
+    outcome = Column(SmallIntCode(Side), nullable=True, index=True)  # YES/NO/NULL
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     resolved_at = Column(DateTime, nullable=True)
+    # Keyword search: search_tsv.match(text, postgresql_regconfig="english"); never loaded
+    search_tsv = deferred(
+        Column(TSVECTOR, Computed("to_tsvector('english', coalesce(question, ''))", persisted=True)),
+        raiseload=True,
+    )
 
-    # Relationships
-    feature_snapshots = relationship("FeatureSnapshot", back_populates="market", cascade="all, delete-orphan")
-    predictions = relationship("Prediction", back_populates="market", cascade="all, delete-orphan")
-    signals = relationship("Signal", back_populates="market")
+    # Relationships raise on lazy access: load them in the query (selectinload/joinedload).
+    # Collections never delete children in the ORM (no delete/delete-orphan cascade):
+    # deleting a parent is one DELETE and the foreign keys' ON DELETE rules do the rest.
+    feature_snapshots = relationship("FeatureSnapshot", back_populates="market", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+    predictions = relationship("Prediction", back_populates="market", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+    signals = relationship("Signal", back_populates="market", lazy="raise", passive_deletes=True)
+
+    # Full-text search index (see migrations/021_full_text_search.sql)
+    __table_args__ = (Index("idx_markets_search_gin", "search_tsv", postgresql_using="gin"),)
 
 
 class FeatureSnapshot(Base):
@@ -36,17 +187,35 @@ class FeatureSnapshot(Base):
 
     __tablename__ = "feature_snapshots"
 
-    id = Column(Integer, primary_key=True, index=True)
-    market_id = Column(String(66), ForeignKey("markets.market_id", ondelete="CASCADE"), nullable=False, index=True)
-    snapshot_time = Column(DateTime, nullable=False, index=True)
-    features = Column(JSON, nullable=False)
+    # Natural key: one snapshot per market and time (see migrations/024_feature_snapshot_natural_key.sql)
+    market_id = Column(String(66), ForeignKey("markets.market_id", ondelete="CASCADE"), primary_key=True)
+    snapshot_time = Column(DateTime, primary_key=True)
+    features = Column(JSONB, nullable=False)
     embeddings_path = Column(String(255), nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    market = relationship("Market", back_populates="feature_snapshots")
-
-    __table_args__ = (UniqueConstraint("market_id", "snapshot_time", name="uq_feature_snapshot"),)
+    market = relationship("Market", back_populates="feature_snapshots", lazy="raise")
+
+    # The primary key doubles as the (market_id, snapshot_time) range index;
+    # GIN (jsonb_path_ops: containment only, smaller) serves features @> '{...}' lookups
+    # (see migrations/007_jsonb_columns.sql, 011_jsonb_alerts_analytics.sql).
+    # Snapshots are append-only in time order and never sorted by time alone, so a
+    # BRIN index covers cross-market time ranges (see migrations/009_bigint_keys_brin.sql)
+    __table_args__ = (
+        Index(
+            "idx_feature_snapshots_features_gin",
+            "features",
+            postgresql_using="gin",
+            postgresql_ops={"features": "jsonb_path_ops"},
+        ),
+        Index(
+            "idx_feature_snapshots_snapshot_time_brin",
+            "snapshot_time",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class Prediction(Base):
@@ -54,20 +223,32 @@ class Prediction(Base):
 
     __tablename__ = "predictions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    market_id = Column(String(66), ForeignKey("markets.market_id", ondelete="CASCADE"), nullable=False, index=True)
+    id = Column(BigInteger, primary_key=True)
+    market_id = Column(String(66), ForeignKey("markets.market_id", ondelete="CASCADE"), nullable=False)
     prediction_time = Column(DateTime, nullable=False, index=True)
-    model_probability = Column(Numeric(10, 6), nullable=False)
+    # Model outputs are analytical scores: DOUBLE PRECISION; market_price stays NUMERIC
+    model_probability = Column(Float, nullable=False)
     market_price = Column(Numeric(10, 6), nullable=False)
-    edge = Column(Numeric(10, 6), nullable=False)
-    confidence = Column(Numeric(10, 6), nullable=False)
+    edge = Column(Float, nullable=False)
+    confidence = Column(Float, nullable=False)
     model_version = Column(String(50), nullable=False)
-    model_predictions = Column(JSON, nullable=True)  # Individual model outputs
+    model_predictions = Column(JSONB, nullable=True)  # Individual model outputs
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    market = relationship("Market", back_populates="predictions")
-    signals = relationship("Signal", back_populates="prediction")
+    market = relationship("Market", back_populates="predictions", lazy="raise")
+    signals = relationship("Signal", back_populates="prediction", lazy="raise", passive_deletes=True)
+
+    # Per-market time-range scans (and market_id lookups); INCLUDE makes dashboard
+    # reads of the numeric columns index-only (see migrations/020_covering_indexes.sql)
+    __table_args__ = (
+        Index(
+            "idx_predictions_market_time_cover",
+            "market_id",
+            prediction_time.desc(),
+            postgresql_include=["model_probability", "market_price", "edge", "confidence"],
+        ),
+    )
 
 
 class Signal(Base):
@@ -75,19 +256,33 @@ class Signal(Base):
 
     __tablename__ = "signals"
 
-    id = Column(Integer, primary_key=True, index=True)
-    prediction_id = Column(Integer, ForeignKey("predictions.id", ondelete="SET NULL"), nullable=True)
-    market_id = Column(String(66), ForeignKey("markets.market_id"), nullable=False, index=True)
-    side = Column(String(3), nullable=False)  # YES/NO
-    signal_strength = Column(String(10), nullable=False)  # STRONG/MEDIUM/WEAK
+    id = Column(BigInteger, primary_key=True)
+    prediction_id = Column(BigInteger, ForeignKey("predictions.id", ondelete="SET NULL"), nullable=True)
+    market_id = Column(String(66), ForeignKey("markets.market_id"), nullable=False)
+    side = Column(SmallIntCode(Side), nullable=False)  # YES/NO
+    signal_strength = Column(SmallIntCode(SignalStrength), nullable=False)  # STRONG/MEDIUM/WEAK
     suggested_size = Column(Numeric(20, 8), nullable=True)
-    executed = Column(Boolean, default=False, nullable=False, index=True)
+    executed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    prediction = relationship("Prediction", back_populates="signals")
-    market = relationship("Market", back_populates="signals")
-    trades = relationship("Trade", back_populates="signal")
+    prediction = relationship("Prediction", back_populates="signals", lazy="selectin")
+    market = relationship("Market", back_populates="signals", lazy="raise")
+    trades = relationship("Trade", back_populates="signal", lazy="raise", passive_deletes=True)
+
+    # Per-market signal feed (and market_id lookups), optionally filtered by executed;
+    # covers the signal fields too (see migrations/010_composite_indexes.sql, 020_covering_indexes.sql)
+    __table_args__ = (
+        Index(
+            "idx_signals_market_executed_time_cover",
+            "market_id",
+            "executed",
+            created_at.desc(),
+            postgresql_include=["side", "signal_strength", "suggested_size"],
+        ),
+        # Pending (unexecuted) signals only (see migrations/023_partial_status_indexes.sql)
+        Index("idx_signals_active", created_at.desc(), postgresql_where=text("executed = false")),
+    )
 
 
 class Trade(Base):
@@ -95,22 +290,64 @@ class Trade(Base):
 
     __tablename__ = "trades"
 
-    id = Column(Integer, primary_key=True, index=True)
-    signal_id = Column(Integer, ForeignKey("signals.id", ondelete="SET NULL"), nullable=True)
-    market_id = Column(String(66), nullable=False, index=True)
-    side = Column(String(3), nullable=False)  # YES/NO
-    entry_price = Column(Numeric(10, 6), nullable=False)
-    size = Column(Numeric(20, 8), nullable=False)
-    exit_price = Column(Numeric(10, 6), nullable=True)
-    pnl = Column(Numeric(20, 8), nullable=True)
-    status = Column(String(20), nullable=False, index=True)  # OPEN/CLOSED/CANCELLED
+    id = Column(BigInteger, primary_key=True)
+    signal_id = Column(BigInteger, ForeignKey("signals.id", ondelete="SET NULL"), nullable=True)
+    market_id = Column(String(66), nullable=False)
+    side = Column(SmallIntCode(Side), nullable=False)  # YES/NO
+    # Prices in micro-units; use entry_price/exit_price (see migrations/013_trade_price_units.sql)
+    entry_price_units = Column("entry_price", BigInteger, nullable=False)
+    # Size/PnL are aggregated in analytics queries: DOUBLE PRECISION, not NUMERIC
+    size = Column(Float, nullable=False)
+    exit_price_units = Column("exit_price", BigInteger, nullable=True)
+    pnl = Column(Float, nullable=True)
+    status = Column(SmallIntCode(TradeStatus), nullable=False)  # OPEN/CLOSED/CANCELLED
     paper_trading = Column(Boolean, default=False, nullable=False, index=True)
     entry_time = Column(DateTime, nullable=False, index=True)
     exit_time = Column(DateTime, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    signal = relationship("Signal", back_populates="trades")
+    signal = relationship("Signal", back_populates="trades", lazy="raise")
+
+    @hybrid_property
+    def entry_price(self) -> Decimal:
+        """Entry price as a Decimal."""
+        return _from_price_units(self.entry_price_units)
+
+    @entry_price.inplace.setter
+    def _entry_price_setter(self, value: Union[Decimal, float, str]) -> None:
+        self.entry_price_units = _to_price_units(value)
+
+    @entry_price.inplace.expression
+    @classmethod
+    def _entry_price_expression(cls):
+        return cast(cls.entry_price_units / literal(Decimal(PRICE_SCALE)), Numeric(10, 6))
+
+    @hybrid_property
+    def exit_price(self) -> Optional[Decimal]:
+        """Exit price as a Decimal (None while open)."""
+        return _from_price_units(self.exit_price_units)
+
+    @exit_price.inplace.setter
+    def _exit_price_setter(self, value: Optional[Union[Decimal, float, str]]) -> None:
+        self.exit_price_units = _to_price_units(value)
+
+    @exit_price.inplace.expression
+    @classmethod
+    def _exit_price_expression(cls):
+        return cast(cls.exit_price_units / literal(Decimal(PRICE_SCALE)), Numeric(10, 6))
+
+    # Per-market time-range scans (see migrations/006_time_range_indexes.sql); per-market
+    # status filters and open positions by mode (see migrations/010_composite_indexes.sql).
+    # Status is only filtered alone for open trades, so no full status index
+    # (see migrations/023_partial_status_indexes.sql). market_id lookups use the
+    # composites' leading column (see migrations/026_drop_redundant_indexes.sql)
+    __table_args__ = (
+        Index("idx_trades_market_id_entry_time", "market_id", entry_time.desc()),
+        Index("idx_trades_market_status_time", "market_id", "status", entry_time.desc()),
+        Index("idx_trades_paper_open", "paper_trading", "status", postgresql_where=text(f"status = {int(TradeStatus.OPEN)}")),
+        Index("idx_trades_open_entry_time", entry_time.desc(), postgresql_where=text(f"status = {int(TradeStatus.OPEN)}")),
+    )
 
 
 class ModelPerformance(Base):
@@ -118,14 +355,14 @@ class ModelPerformance(Base):
 
     __tablename__ = "model_performance"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     model_name = Column(String(50), nullable=False)
     model_version = Column(String(50), nullable=False)
     evaluation_date = Column(Date, nullable=False, index=True)
-    accuracy = Column(Numeric(10, 6), nullable=True)
-    brier_score = Column(Numeric(10, 6), nullable=True)
-    log_loss = Column(Numeric(10, 6), nullable=True)
-    auc_roc = Column(Numeric(10, 6), nullable=True)
+    accuracy = Column(Float, nullable=True)
+    brier_score = Column(Float, nullable=True)
+    log_loss = Column(Float, nullable=True)
+    auc_roc = Column(Float, nullable=True)
     sample_count = Column(Integer, nullable=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
@@ -137,38 +374,62 @@ class PortfolioSnapshot(Base):
 
     __tablename__ = "portfolio_snapshots"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(BigInteger, primary_key=True)
     snapshot_time = Column(DateTime, nullable=False, index=True)
-    total_value = Column(Numeric(20, 8), nullable=False)
-    cash = Column(Numeric(20, 8), nullable=False)
-    positions_value = Column(Numeric(20, 8), nullable=False)
-    total_exposure = Column(Numeric(20, 8), nullable=False)
-    daily_pnl = Column(Numeric(20, 8), nullable=True)
-    unrealized_pnl = Column(Numeric(20, 8), nullable=True)
-    realized_pnl = Column(Numeric(20, 8), nullable=True)
+    # snapshot_time as UTC epoch seconds, for time-series reads that bucket in NumPy
+    # without building datetime objects; never loaded by default
+    ts_epoch = deferred(
+        Column(BigInteger, Computed("extract(epoch FROM snapshot_time)::bigint", persisted=True)),
+        raiseload=True,
+    )
+    # Portfolio values feed time-series aggregates: DOUBLE PRECISION, not NUMERIC
+    total_value = Column(Float, nullable=False)
+    cash = Column(Float, nullable=False)
+    positions_value = Column(Float, nullable=False)
+    total_exposure = Column(Float, nullable=False)
+    daily_pnl = Column(Float, nullable=True)
+    unrealized_pnl = Column(Float, nullable=True)
+    realized_pnl = Column(Float, nullable=True)
     paper_trading = Column(Boolean, default=False, nullable=False, index=True)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
+    # Latest paper-trading snapshots (see migrations/006_time_range_indexes.sql)
+    __table_args__ = (
+        Index(
+            "idx_portfolio_paper_snapshot",
+            "paper_trading",
+            snapshot_time.desc(),
+            postgresql_where=text("paper_trading = true"),
+        ),
+    )
+
 
 class Alert(Base):
     """Alert configuration."""
 
     __tablename__ = "alerts"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(String(100), default="default", nullable=False, index=True)
     alert_type = Column(String(50), nullable=False, index=True)  # SIGNAL, PORTFOLIO, PREDICTION, CUSTOM
-    alert_rule = Column(JSON, nullable=False)  # Flexible rule configuration
+    alert_rule = Column(JSONB, nullable=False)  # Flexible rule configuration
     notification_method = Column(String(50), nullable=False)  # EMAIL, WEBHOOK, TELEGRAM, SMS
-    notification_target = Column(Text, nullable=False)  # Email, webhook URL, etc.
-    enabled = Column(Boolean, default=True, nullable=False, index=True)
+    notification_target = Column(Text, nullable=False, info=LZ4)  # Email, webhook URL, etc.
+    enabled = Column(Boolean, default=True, nullable=False)
     last_triggered = Column(DateTime, nullable=True)
-    trigger_count = Column(Integer, default=0, nullable=False)
+    trigger_count = Column(Integer, server_default=text("0"), nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
-    history = relationship("AlertHistory", back_populates="alert", cascade="all, delete-orphan")
+    history = relationship("AlertHistory", back_populates="alert", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+
+    # Rule key/containment lookups (see migrations/011_jsonb_alerts_analytics.sql);
+    # dispatch only reads enabled alerts of one type (see migrations/016_partial_alert_indexes.sql)
+    __table_args__ = (
+        Index("idx_alerts_rule_gin", "alert_rule", postgresql_using="gin"),
+        Index("idx_alerts_enabled_type_user", "alert_type", "user_id", postgresql_where=text("enabled = true")),
+    )
 
 
 class AlertHistory(Base):
@@ -176,18 +437,28 @@ class AlertHistory(Base):
 
     __tablename__ = "alert_history"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     alert_id = Column(Integer, ForeignKey("alerts.id", ondelete="CASCADE"), nullable=False, index=True)
-    signal_id = Column(Integer, ForeignKey("signals.id", ondelete="SET NULL"), nullable=True)
+    signal_id = Column(BigInteger, ForeignKey("signals.id", ondelete="SET NULL"), nullable=True)
     market_id = Column(String(66), nullable=True)
-    message = Column(Text, nullable=False)
-    sent_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
+    message = Column(Text, nullable=False, info=LZ4)
+    sent_at = Column(DateTime, server_default=func.now(), nullable=False)
     success = Column(Boolean, default=True, nullable=False)
     error_message = Column(Text, nullable=True)
 
     # Relationships
-    alert = relationship("Alert", back_populates="history")
-    signal = relationship("Signal")
+    alert = relationship("Alert", back_populates="history", lazy="raise")
+    signal = relationship("Signal", lazy="raise")
+
+    # Append-only in sent_at order: BRIN for time ranges (see migrations/014_brin_time_indexes.sql)
+    __table_args__ = (
+        Index(
+            "idx_alert_history_sent_at_brin",
+            "sent_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class AnalyticsCache(Base):
@@ -195,25 +466,30 @@ class AnalyticsCache(Base):
 
     __tablename__ = "analytics_cache"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     cache_key = Column(String(255), unique=True, nullable=False, index=True)
-    cache_data = Column(JSON, nullable=False)
-    expires_at = Column(DateTime, nullable=False, index=True)
+    cache_data = Column(JSONB, nullable=False)
+    expires_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
+    # Expiry sweep reads (expires_at, id) index-only (see migrations/018_analytics_cache_sweep.sql)
+    __table_args__ = (
+        Index("idx_analytics_cache_expires_id", "expires_at", postgresql_include=["id"]),
+    )
+
 
 class WhaleWallet(Base):
     """Whale wallet model for tracking top traders."""
 
     __tablename__ = "whale_wallets"
 
-    id = Column(Integer, primary_key=True, index=True)
-    wallet_address = Column(String(42), unique=True, nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    wallet_address = Column(HexBytes(20), unique=True, nullable=False, index=True)
     nickname = Column(String(100), nullable=True)
-    total_volume = Column(Numeric(20, 2), default=0, nullable=False)
-    total_trades = Column(Integer, default=0, nullable=False)
-    win_rate = Column(Numeric(5, 4), default=0, nullable=False)
-    total_profit = Column(Numeric(20, 2), default=0, nullable=False)
+    total_volume = Column(Numeric(20, 2), server_default=text("0"), nullable=False)
+    total_trades = Column(Integer, server_default=text("0"), nullable=False)
+    win_rate = Column(Float, server_default=text("0"), nullable=False)
+    total_profit = Column(Numeric(20, 2), server_default=text("0"), nullable=False)
     rank = Column(Integer, nullable=True, index=True)
     is_active = Column(Boolean, default=True, nullable=False, index=True)
     first_seen_at = Column(DateTime, server_default=func.now(), nullable=False)
@@ -222,8 +498,8 @@ class WhaleWallet(Base):
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
 
     # Relationships
-    trades = relationship("WhaleTrade", back_populates="whale", cascade="all, delete-orphan")
-    alerts = relationship("WhaleAlert", back_populates="whale", cascade="all, delete-orphan")
+    trades = relationship("WhaleTrade", back_populates="whale", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+    alerts = relationship("WhaleAlert", back_populates="whale", cascade="save-update, merge", lazy="raise", passive_deletes=True)
 
 
 class WhaleTrade(Base):
@@ -231,24 +507,36 @@ class WhaleTrade(Base):
 
     __tablename__ = "whale_trades"
 
-    id = Column(Integer, primary_key=True, index=True)
-    whale_id = Column(Integer, ForeignKey("whale_wallets.id", ondelete="CASCADE"), nullable=False, index=True)
-    wallet_address = Column(String(42), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    whale_id = Column(Integer, ForeignKey("whale_wallets.id", ondelete="CASCADE"), nullable=False)
     market_id = Column(String(100), nullable=False, index=True)
-    market_question = Column(Text, nullable=True)
-    trade_type = Column(String(10), nullable=False)  # BUY/SELL
-    outcome = Column(String(10), nullable=False)  # YES/NO
+    market_question = Column(Text, nullable=True, info=LZ4)
+    trade_type = Column(SmallIntCode(TradeType), nullable=False)  # BUY/SELL
+    outcome = Column(SmallIntCode(Side), nullable=False)  # YES/NO
     amount = Column(Numeric(20, 2), nullable=False)
     price = Column(Numeric(10, 8), nullable=False)
     trade_value = Column(Numeric(20, 2), nullable=False, index=True)
-    transaction_hash = Column(String(66), nullable=True)
+    transaction_hash = Column(HexBytes(32), nullable=True)
     block_number = Column(Integer, nullable=True)
-    trade_time = Column(DateTime, nullable=False, index=True)
+    trade_time = Column(DateTime, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    whale = relationship("WhaleWallet", back_populates="trades")
-    alerts = relationship("WhaleAlert", back_populates="trade", cascade="all, delete-orphan")
+    whale = relationship("WhaleWallet", back_populates="trades", lazy="raise")
+    alerts = relationship("WhaleAlert", back_populates="trade", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+
+    # Per-whale trade history, newest first, also serving whale_id lookups
+    # (see migrations/010_composite_indexes.sql, 026_drop_redundant_indexes.sql);
+    # recent-activity windows use BRIN (see migrations/014_brin_time_indexes.sql)
+    __table_args__ = (
+        Index("idx_whale_trades_whale_time", "whale_id", trade_time.desc()),
+        Index(
+            "idx_whale_trades_trade_time_brin",
+            "trade_time",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
 
 class WhaleAlert(Base):
@@ -256,17 +544,22 @@ class WhaleAlert(Base):
 
     __tablename__ = "whale_alerts"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1, nullable=False, index=True)
     whale_id = Column(Integer, ForeignKey("whale_wallets.id", ondelete="CASCADE"), nullable=False, index=True)
     trade_id = Column(Integer, ForeignKey("whale_trades.id", ondelete="CASCADE"), nullable=False, index=True)
     alert_type = Column(String(50), default="large_trade", nullable=False)
-    is_read = Column(Boolean, default=False, nullable=False, index=True)
+    is_read = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False, index=True)
 
     # Relationships
-    whale = relationship("WhaleWallet", back_populates="alerts")
-    trade = relationship("WhaleTrade", back_populates="alerts")
+    whale = relationship("WhaleWallet", back_populates="alerts", lazy="selectin")
+    trade = relationship("WhaleTrade", back_populates="alerts", lazy="selectin")
+
+    # Unread feed per user, newest first (see migrations/016_partial_alert_indexes.sql)
+    __table_args__ = (
+        Index("idx_whale_alerts_unread", "user_id", created_at.desc(), postgresql_where=text("is_read = false")),
+    )
 
 
 class EconomicEvent(Base):
@@ -274,7 +567,7 @@ class EconomicEvent(Base):
 
     __tablename__ = "economic_events"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     event_type = Column(String(50), nullable=False, index=True)  # FOMC, CPI, NFP, GDP
     event_name = Column(String(200), nullable=False)
     event_date = Column(DateTime, nullable=False, index=True)
@@ -286,16 +579,34 @@ class EconomicEvent(Base):
     actual_value = Column(Numeric(10, 4), nullable=True)
     currency = Column(String(10), default="USD", nullable=False)
     source = Column(String(100), default="Federal Reserve", nullable=False)
-    description = Column(Text, nullable=True)
+    description = Column(Text, nullable=True, info=LZ4)
     external_url = Column(String(500), nullable=True)
-    is_completed = Column(Boolean, default=False, nullable=False, index=True)
+    is_completed = Column(Boolean, default=False, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
     updated_at = Column(DateTime, server_default=func.now(), onupdate=func.now(), nullable=False)
+    # Keyword search over name and description; never loaded
+    search_tsv = deferred(
+        Column(
+            TSVECTOR,
+            Computed(
+                "to_tsvector('english', coalesce(event_name, '') || ' ' || coalesce(description, ''))",
+                persisted=True,
+            ),
+        ),
+        raiseload=True,
+    )
 
     # Relationships
-    market_relationships = relationship("MarketEvent", back_populates="event", cascade="all, delete-orphan")
-    alerts = relationship("EventAlert", back_populates="event", cascade="all, delete-orphan")
-    impact_history = relationship("EventMarketImpact", back_populates="event", cascade="all, delete-orphan")
+    market_relationships = relationship("MarketEvent", back_populates="event", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+    alerts = relationship("EventAlert", back_populates="event", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+    impact_history = relationship("EventMarketImpact", back_populates="event", cascade="save-update, merge", lazy="raise", passive_deletes=True)
+
+    # Full-text search index (see migrations/021_full_text_search.sql); upcoming
+    # (not completed) events by date (see migrations/023_partial_status_indexes.sql)
+    __table_args__ = (
+        Index("idx_economic_events_search_gin", "search_tsv", postgresql_using="gin"),
+        Index("idx_economic_events_pending_date", "event_date", postgresql_where=text("is_completed = false")),
+    )
 
 
 class MarketEvent(Base):
@@ -303,10 +614,10 @@ class MarketEvent(Base):
 
     __tablename__ = "market_events"
 
-    id = Column(Integer, primary_key=True, index=True)
-    market_id = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    market_id = Column(String(100), nullable=False)
     event_id = Column(Integer, ForeignKey("economic_events.id", ondelete="CASCADE"), nullable=False, index=True)
-    relevance_score = Column(Numeric(3, 2), default=0.5, nullable=False, index=True)
+    relevance_score = Column(Float, default=0.5, nullable=False, index=True)
     impact_prediction = Column(Text, nullable=True)
     price_before = Column(Numeric(10, 8), nullable=True)
     price_after = Column(Numeric(10, 8), nullable=True)
@@ -314,8 +625,9 @@ class MarketEvent(Base):
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    event = relationship("EconomicEvent", back_populates="market_relationships")
+    event = relationship("EconomicEvent", back_populates="market_relationships", lazy="raise")
 
+    # uq_market_event also serves market_id lookups (see migrations/026_drop_redundant_indexes.sql)
     __table_args__ = (UniqueConstraint("market_id", "event_id", name="uq_market_event"),)
 
 
@@ -324,7 +636,7 @@ class EventAlert(Base):
 
     __tablename__ = "event_alerts"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(Integer, default=1, nullable=False, index=True)
     event_id = Column(Integer, ForeignKey("economic_events.id", ondelete="CASCADE"), nullable=False, index=True)
     alert_time = Column(DateTime, nullable=False, index=True)
@@ -334,7 +646,12 @@ class EventAlert(Base):
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    event = relationship("EconomicEvent", back_populates="alerts")
+    event = relationship("EconomicEvent", back_populates="alerts", lazy="selectin")
+
+    # Pending notifications by due time (see migrations/016_partial_alert_indexes.sql)
+    __table_args__ = (
+        Index("idx_event_alerts_pending", "alert_time", postgresql_where=text("notification_sent = false")),
+    )
 
 
 class EventMarketImpact(Base):
@@ -342,18 +659,28 @@ class EventMarketImpact(Base):
 
     __tablename__ = "event_market_impact"
 
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     event_id = Column(Integer, ForeignKey("economic_events.id", ondelete="CASCADE"), nullable=False, index=True)
     market_id = Column(String(100), nullable=True, index=True)
     price_before = Column(Numeric(10, 8), nullable=True)
     price_after = Column(Numeric(10, 8), nullable=True)
-    price_change_pct = Column(Numeric(10, 4), nullable=True)
+    price_change_pct = Column(Float, nullable=True)
     volume_before = Column(Numeric(20, 2), nullable=True)
     volume_after = Column(Numeric(20, 2), nullable=True)
-    volume_change_pct = Column(Numeric(10, 4), nullable=True)
-    measured_at = Column(DateTime, nullable=False, index=True)
+    volume_change_pct = Column(Float, nullable=True)
+    measured_at = Column(DateTime, nullable=False)
     created_at = Column(DateTime, server_default=func.now(), nullable=False)
 
     # Relationships
-    event = relationship("EconomicEvent", back_populates="impact_history")
+    event = relationship("EconomicEvent", back_populates="impact_history", lazy="raise")
+
+    # Append-only in measured_at order: BRIN for time ranges (see migrations/014_brin_time_indexes.sql)
+    __table_args__ = (
+        Index(
+            "idx_event_market_impact_measured_at_brin",
+            "measured_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
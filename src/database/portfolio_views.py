@@ -0,0 +1,81 @@
+"""Daily portfolio materialized view and its debounced refresh."""
+
+import asyncio
+from typing import Optional
+
+from sqlalchemy import column, event, table, text
+
+from ..utils.logging import get_logger
+from .connection import engine
+from .models import PortfolioSnapshot
+
+logger = get_logger(__name__)
+
+# Lightweight handle for queries; the view itself is created by
+# migrations/012_portfolio_daily_mv.sql (not by Base.metadata.create_all)
+mv_portfolio_daily = table(
+    "mv_portfolio_daily",
+    column("day"),
+    column("paper_trading"),
+    column("open_value"),
+    column("close_value"),
+    column("avg_value"),
+    column("min_value"),
+    column("max_value"),
+    column("realized_pnl"),
+    column("snapshot_count"),
+)
+
+# Snapshot writes within this window share one refresh
+_REFRESH_DELAY = 30.0
+_refresh_task: Optional[asyncio.Task] = None
+
+
+async def refresh_portfolio_daily() -> None:
+    """Refresh mv_portfolio_daily without blocking readers."""
+    if not engine:
+        return
+    try:
+        async with engine.begin() as conn:
+            await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY mv_portfolio_daily"))
+        logger.debug("Refreshed mv_portfolio_daily")
+    except Exception as e:
+        logger.warning("Failed to refresh mv_portfolio_daily", error=str(e))
+
+
+async def _delayed_refresh() -> None:
+    """Wait out the debounce window, then refresh."""
+    global _refresh_task
+    try:
+        await asyncio.sleep(_REFRESH_DELAY)
+    finally:
+        _refresh_task = None
+    await refresh_portfolio_daily()
+
+
+def schedule_portfolio_daily_refresh() -> None:
+    """
+    Schedule a refresh of mv_portfolio_daily after the debounce window.
+
+    No-op if one is already pending or no event loop is running. Short-lived
+    scripts exit before the window ends: they await refresh_portfolio_daily()
+    themselves after their last snapshot write.
+    """
+    global _refresh_task
+    if _refresh_task is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return
+    _refresh_task = loop.create_task(_delayed_refresh())
+
+
+def _on_snapshot_write(mapper, connection, target: PortfolioSnapshot) -> None:
+    """Queue a view refresh; it runs after the writing transaction commits."""
+    schedule_portfolio_daily_refresh()
+
+
+# Inserts, and in-place updates of the latest snapshot (see update_portfolio_snapshot)
+for _event_name in ("after_insert", "after_update"):
+    event.listen(PortfolioSnapshot, _event_name, _on_snapshot_write)
@@ -6,81 +6,87 @@ CREATE TABLE IF NOT EXISTS markets (
     question TEXT NOT NULL,
     category VARCHAR(50),
     resolution_date TIMESTAMP,
-    outcome VARCHAR(3),  -- YES/NO/NULL
+    outcome SMALLINT,  -- 1=YES, 2=NO, NULL
     created_at TIMESTAMP DEFAULT NOW(),
-    resolved_at TIMESTAMP
+    resolved_at TIMESTAMP,
+    search_tsv TSVECTOR GENERATED ALWAYS AS (to_tsvector('english', coalesce(question, ''))) STORED
 );
 
 CREATE INDEX IF NOT EXISTS idx_markets_resolution_date ON markets(resolution_date);
 CREATE INDEX IF NOT EXISTS idx_markets_outcome ON markets(outcome);
+CREATE INDEX IF NOT EXISTS idx_markets_search_gin ON markets USING gin(search_tsv);
 
 -- Feature snapshots (for training and inference)
 CREATE TABLE IF NOT EXISTS feature_snapshots (
-    id SERIAL PRIMARY KEY,
     market_id VARCHAR(66) NOT NULL,
     snapshot_time TIMESTAMP NOT NULL,
     features JSONB NOT NULL,
     embeddings_path VARCHAR(255),  -- Path to embedding file
     created_at TIMESTAMP DEFAULT NOW(),
-    UNIQUE(market_id, snapshot_time),
+    PRIMARY KEY (market_id, snapshot_time),
     FOREIGN KEY (market_id) REFERENCES markets(market_id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_features_market_time ON feature_snapshots(market_id, snapshot_time);
+CREATE INDEX IF NOT EXISTS idx_feature_snapshots_features_gin ON feature_snapshots USING gin (features jsonb_path_ops);
+CREATE INDEX IF NOT EXISTS idx_feature_snapshots_snapshot_time_brin ON feature_snapshots USING brin (snapshot_time) WITH (pages_per_range = 32);
 
 -- Model predictions
 CREATE TABLE IF NOT EXISTS predictions (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL PRIMARY KEY,
     market_id VARCHAR(66) NOT NULL,
     prediction_time TIMESTAMP NOT NULL,
-    model_probability DECIMAL(10, 6) NOT NULL,
+    model_probability DOUBLE PRECISION NOT NULL,
     market_price DECIMAL(10, 6) NOT NULL,
-    edge DECIMAL(10, 6) NOT NULL,
-    confidence DECIMAL(10, 6) NOT NULL,
+    edge DOUBLE PRECISION NOT NULL,
+    confidence DOUBLE PRECISION NOT NULL,
     model_version VARCHAR(50) NOT NULL,
     model_predictions JSONB,  -- Individual model outputs
     created_at TIMESTAMP DEFAULT NOW(),
     FOREIGN KEY (market_id) REFERENCES markets(market_id) ON DELETE CASCADE
 );
 
-CREATE INDEX IF NOT EXISTS idx_predictions_market_time ON predictions(market_id, prediction_time);
+CREATE INDEX IF NOT EXISTS idx_predictions_market_time_cover ON predictions(market_id, prediction_time DESC)
+    INCLUDE (model_probability, market_price, edge, confidence);
 
 -- Trading signals
 CREATE TABLE IF NOT EXISTS signals (
-    id SERIAL PRIMARY KEY,
-    prediction_id INTEGER,
+    id BIGSERIAL PRIMARY KEY,
+    prediction_id BIGINT,
     market_id VARCHAR(66) NOT NULL,
-    side VARCHAR(3) NOT NULL,
-    signal_strength VARCHAR(10) NOT NULL,
+    side SMALLINT NOT NULL,  -- 1=YES, 2=NO
+    signal_strength SMALLINT NOT NULL,  -- 1=WEAK, 2=MEDIUM, 3=STRONG
     suggested_size DECIMAL(20, 8),
     executed BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT NOW(),
     FOREIGN KEY (prediction_id) REFERENCES predictions(id) ON DELETE SET NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_signals_market ON signals(market_id);
-CREATE INDEX IF NOT EXISTS idx_signals_executed ON signals(executed);
+CREATE INDEX IF NOT EXISTS idx_signals_active ON signals(created_at DESC) WHERE executed = false;
+CREATE INDEX IF NOT EXISTS idx_signals_market_executed_time_cover ON signals(market_id, executed, created_at DESC)
+    INCLUDE (side, signal_strength, suggested_size);
 
 -- Trades
 CREATE TABLE IF NOT EXISTS trades (
-    id SERIAL PRIMARY KEY,
-    signal_id INTEGER,
+    id BIGSERIAL PRIMARY KEY,
+    signal_id BIGINT,
     market_id VARCHAR(66) NOT NULL,
-    side VARCHAR(3) NOT NULL,
-    entry_price DECIMAL(10, 6) NOT NULL,
-    size DECIMAL(20, 8) NOT NULL,
-    exit_price DECIMAL(10, 6),
-    pnl DECIMAL(20, 8),
-    status VARCHAR(20) NOT NULL,  -- OPEN, CLOSED, CANCELLED
+    side SMALLINT NOT NULL,  -- 1=YES, 2=NO
+    entry_price BIGINT NOT NULL,  -- Micro-units (price * 1e6)
+    size DOUBLE PRECISION NOT NULL,
+    exit_price BIGINT,  -- Micro-units (price * 1e6)
+    pnl DOUBLE PRECISION,
+    status SMALLINT NOT NULL,  -- 1=OPEN, 2=CLOSED, 3=CANCELLED
+    paper_trading BOOLEAN DEFAULT FALSE,
     entry_time TIMESTAMP NOT NULL,
     exit_time TIMESTAMP,
     created_at TIMESTAMP DEFAULT NOW(),
     FOREIGN KEY (signal_id) REFERENCES signals(id) ON DELETE SET NULL
 );
 
-CREATE INDEX IF NOT EXISTS idx_trades_status ON trades(status);
-CREATE INDEX IF NOT EXISTS idx_trades_market ON trades(market_id);
 CREATE INDEX IF NOT EXISTS idx_trades_entry_time ON trades(entry_time);
+CREATE INDEX IF NOT EXISTS idx_trades_market_status_time ON trades(market_id, status, entry_time DESC);
+CREATE INDEX IF NOT EXISTS idx_trades_paper_open ON trades(paper_trading, status) WHERE status = 1;
+CREATE INDEX IF NOT EXISTS idx_trades_open_entry_time ON trades(entry_time DESC) WHERE status = 1;
 
 -- Model performance tracking
 CREATE TABLE IF NOT EXISTS model_performance (
@@ -88,10 +94,10 @@ CREATE TABLE IF NOT EXISTS model_performance (
     model_name VARCHAR(50) NOT NULL,
     model_version VARCHAR(50) NOT NULL,
     evaluation_date DATE NOT NULL,
-    accuracy DECIMAL(10, 6),
-    brier_score DECIMAL(10, 6),
-    log_loss DECIMAL(10, 6),
-    auc_roc DECIMAL(10, 6),
+    accuracy DOUBLE PRECISION,
+    brier_score DOUBLE PRECISION,
+    log_loss DOUBLE PRECISION,
+    auc_roc DOUBLE PRECISION,
     sample_count INTEGER,
     created_at TIMESTAMP DEFAULT NOW(),
     UNIQUE(model_name, model_version, evaluation_date)
@@ -101,15 +107,17 @@ CREATE INDEX IF NOT EXISTS idx_model_perf_date ON model_performance(evaluation_d
 
 -- Portfolio snapshots (for tracking)
 CREATE TABLE IF NOT EXISTS portfolio_snapshots (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL PRIMARY KEY,
     snapshot_time TIMESTAMP NOT NULL,
-    total_value DECIMAL(20, 8) NOT NULL,
-    cash DECIMAL(20, 8) NOT NULL,
-    positions_value DECIMAL(20, 8) NOT NULL,
-    total_exposure DECIMAL(20, 8) NOT NULL,
-    daily_pnl DECIMAL(20, 8),
-    unrealized_pnl DECIMAL(20, 8),
-    realized_pnl DECIMAL(20, 8),
+    ts_epoch BIGINT GENERATED ALWAYS AS (extract(epoch FROM snapshot_time)::bigint) STORED,
+    total_value DOUBLE PRECISION NOT NULL,
+    cash DOUBLE PRECISION NOT NULL,
+    positions_value DOUBLE PRECISION NOT NULL,
+    total_exposure DOUBLE PRECISION NOT NULL,
+    daily_pnl DOUBLE PRECISION,
+    unrealized_pnl DOUBLE PRECISION,
+    realized_pnl DOUBLE PRECISION,
+    paper_trading BOOLEAN DEFAULT FALSE,
     created_at TIMESTAMP DEFAULT NOW()
 );
 
@@ -1,7 +1,7 @@
 """Feature engineering modules."""
 
 from .pipeline import FeaturePipeline, FeatureVector
-from .market_features import MarketFeatureExtractor
+from .market_features import MarketFeatureExtractor, MarketFeatures
 from .sentiment_features import SentimentFeatureExtractor
 from .temporal_features import TemporalFeatureExtractor
 
@@ -9,6 +9,7 @@ __all__ = [
     "FeaturePipeline",
     "FeatureVector",
     "MarketFeatureExtractor",
+    "MarketFeatures",
     "SentimentFeatureExtractor",
     "TemporalFeatureExtractor",
 ]
@@ -1,12 +1,32 @@
 """Market feature extraction."""
 
-from typing import Dict
+from collections import namedtuple
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
 
 from ..data.models import Market, MarketData
 from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Column order of extract_batch() matrices
+FEATURE_NAMES = [
+    "current_price",
+    "no_price",
+    "price_sum",
+    "bid_ask_spread",
+    "volume_24h",
+    "liquidity",
+    "volume_liquidity_ratio",
+    "price_extremity",
+    "price_confidence",
+    "orderbook_depth",
+]
+
+# Positional per-market result (field order == FEATURE_NAMES); distinct from data.models.FeatureVector
+MarketFeatures = namedtuple("MarketFeatures", FEATURE_NAMES)
+
 
 class MarketFeatureExtractor:
     """Extract market-based features."""
@@ -21,37 +41,71 @@ class MarketFeatureExtractor:
         Returns:
             Dictionary of feature names to values
         """
+        return self.extract_tuple(market_data)._asdict()
+
+    def extract_tuple(self, market_data: MarketData) -> MarketFeatures:
+        """
+        Extract market features as a positional tuple (no per-market dict).
+
+        Args:
+            market_data: MarketData object
+
+        Returns:
+            MarketFeatures tuple in FEATURE_NAMES order
+        """
         market = market_data.market
-        features = {}
-
-        # Price features
-        features["current_price"] = market.yes_price
-        features["no_price"] = market.no_price
-        features["price_sum"] = market.yes_price + market.no_price  # Should be close to 1.0
-
-        # Spread features
-        if market_data.spread is not None:
-            features["bid_ask_spread"] = market_data.spread
-        else:
-            features["bid_ask_spread"] = abs(market.yes_price - market.no_price)
-
-        # Volume and liquidity features
-        features["volume_24h"] = market.volume_24h
-        features["liquidity"] = market.liquidity
-        features["volume_liquidity_ratio"] = (
-            market.volume_24h / market.liquidity if market.liquidity > 0 else 0.0
+        yes = float(market.yes_price)
+        no = float(market.no_price)
+        volume = float(market.volume_24h)
+        liquidity = float(market.liquidity)
+        spread = market_data.spread
+        depth = market_data.orderbook_depth
+
+        return MarketFeatures(
+            # Price features
+            yes,
+            no,
+            yes + no,  # Should be close to 1.0
+            # Spread (falls back to |yes - no| when the orderbook spread is unknown)
+            abs(yes - no) if spread is None else float(spread),
+            # Volume and liquidity features
+            volume,
+            liquidity,
+            volume / liquidity if liquidity > 0 else 0.0,
+            # Price momentum would need historical data; for now, a heuristic
+            # based on price proximity to 0 or 1
+            abs(yes - 0.5) * 2,  # 0 to 1
+            max(yes, no),  # Higher = more confident
+            # Orderbook depth (falls back to liquidity when unavailable)
+            liquidity if depth is None else float(depth),
         )
 
-        # Price momentum (would need historical data for proper calculation)
-        # For now, use simple heuristic based on price proximity to 0 or 1
-        features["price_extremity"] = abs(market.yes_price - 0.5) * 2  # 0 to 1
-        features["price_confidence"] = max(market.yes_price, market.no_price)  # Higher = more confident
+    def extract_into(self, i: int, out: np.ndarray, market_data: MarketData) -> None:
+        """
+        Write one market's features into row i of a preallocated matrix.
 
-        # Orderbook depth (if available)
-        if market_data.orderbook_depth is not None:
-            features["orderbook_depth"] = market_data.orderbook_depth
-        else:
-            features["orderbook_depth"] = market.liquidity
+        Args:
+            i: Row index
+            out: Array of shape (N, len(FEATURE_NAMES))
+            market_data: MarketData object
+        """
+        out[i] = self.extract_tuple(market_data)
 
-        return features
+    def extract_batch(self, market_datas: Sequence[MarketData]) -> Tuple[np.ndarray, List[str]]:
+        """
+        Extract market features for many markets at once.
 
+        Rows are written in place into one preallocated matrix through
+        extract_into(), so the feature formulas live only in extract_tuple().
+
+        Args:
+            market_datas: MarketData objects
+
+        Returns:
+            Tuple of (feature matrix of shape (len(market_datas), len(FEATURE_NAMES)),
+            feature names in column order)
+        """
+        features = np.empty((len(market_datas), len(FEATURE_NAMES)), dtype=np.float64)
+        for i, market_data in enumerate(market_datas):
+            self.extract_into(i, features, market_data)
+        return features, list(FEATURE_NAMES)
@@ -64,7 +64,7 @@ async def main():
     logger.info("Initialization complete")
 
     # Start background tasks
-    async with polymarket:
+    async with polymarket, data_aggregator:
         try:
             await run_prediction_engine(
                 polymarket,
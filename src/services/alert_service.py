@@ -8,6 +8,7 @@ import aiohttp
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..database.connection import bulk_insert
 from ..database.models import Alert, AlertHistory, Signal
 from ..utils.logging import get_logger
 
@@ -45,6 +46,7 @@ class AlertService:
                 return []
             
             results = []
+            history = []
             for alert in alerts:
                 try:
                     # Check if alert rule matches
@@ -52,13 +54,12 @@ class AlertService:
                         # Send notification
                         success = await self._send_notification(alert, signal, market_data)
                         
-                        # Record in history
-                        await self._record_alert_history(alert, signal, success)
+                        # Record in history (written in one batch below)
+                        history.append(self._history_record(alert, signal, success))
                         
                         # Update alert stats
                         alert.last_triggered = datetime.now(timezone.utc).replace(tzinfo=None)
                         alert.trigger_count += 1
-                        await self.db.commit()
                         
                         results.append({
                             "alert_id": alert.id,
@@ -73,6 +74,20 @@ class AlertService:
                         "error": str(e)
                     })
             
+            # One batch (COPY for large fan-outs) for the history rows, in a savepoint:
+            # a failed insert loses only the history, not the stats of sent alerts
+            try:
+                async with self.db.begin_nested():
+                    await bulk_insert(self.db, AlertHistory, history)
+            except Exception as e:
+                logger.error("Failed to record alert history", error=str(e))
+            
+            try:
+                await self.db.commit()
+            except Exception as e:
+                logger.error("Failed to update alert stats", error=str(e))
+                await self.db.rollback()
+            
             return results
         except Exception as e:
             logger.error("Failed to check alerts", error=str(e))
@@ -140,7 +155,8 @@ class AlertService:
         confidence = float(signal.prediction.confidence) if signal.prediction else 0.0
         
         message = f"🚨 New Trading Signal\n\n"
-        message += f"Market: {signal.market.market.question[:100] if signal.market else 'Unknown'}\n"
+        question = market_data.get("question") if market_data else None
+        message += f"Market: {question[:100] if question else signal.market_id}\n"
         message += f"Side: {signal.side}\n"
         message += f"Signal Strength: {signal.signal_strength}\n"
         message += f"Edge: {edge:.2%}\n"
@@ -186,22 +202,15 @@ class AlertService:
         logger.info("Telegram notification (not implemented)", chat_id=chat_id, signal_id=signal.id)
         return False
 
-    async def _record_alert_history(self, alert: Alert, signal: Signal, success: bool, error: Optional[str] = None):
-        """Record alert in history."""
-        try:
-            message = self._build_alert_message(alert, signal, None)
-            history = AlertHistory(
-                alert_id=alert.id,
-                signal_id=signal.id,
-                market_id=signal.market_id,
-                message=message,
-                success=success,
-                error_message=error
-            )
-            self.db.add(history)
-            await self.db.commit()
-        except Exception as e:
-            logger.error("Failed to record alert history", error=str(e))
-            await self.db.rollback()
+    def _history_record(self, alert: Alert, signal: Signal, success: bool, error: Optional[str] = None) -> Dict:
+        """Build an alert_history row; sent_at takes its server default."""
+        return {
+            "alert_id": alert.id,
+            "signal_id": signal.id,
+            "market_id": signal.market_id,
+            "message": self._build_alert_message(alert, signal, None),
+            "success": success,
+            "error_message": error,
+        }
 
 
@@ -6,9 +6,12 @@ from typing import Dict, List, Optional
 
 import numpy as np
 from sqlalchemy import select, func, and_, or_
+from sqlalchemy.exc import ProgrammingError
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import contains_eager, selectinload
 
 from ..database.models import Prediction, Signal, Trade, PortfolioSnapshot
+from ..database.portfolio_views import mv_portfolio_daily
 from ..utils.logging import get_logger
 from ..utils.datetime_utils import make_naive_utc, now_naive_utc
 
@@ -46,7 +49,7 @@ class AnalyticsService:
                     Prediction.prediction_time >= cutoff_date,
                     DBMarket.outcome.isnot(None)
                 )
-            )
+            ).options(contains_eager(Prediction.market))
             
             result = await self.db.execute(query)
             predictions = result.scalars().all()
@@ -189,7 +192,7 @@ class AnalyticsService:
                 Signal.prediction
             ).where(
                 Signal.created_at >= cutoff_date
-            )
+            ).options(contains_eager(Signal.prediction))
             
             result = await self.db.execute(query)
             signals = result.scalars().all()
@@ -236,19 +239,9 @@ class AnalyticsService:
         try:
             cutoff_date = make_naive_utc(datetime.now(timezone.utc) - timedelta(days=days))
             
-            query = select(PortfolioSnapshot).where(
-                and_(
-                    PortfolioSnapshot.snapshot_time >= cutoff_date,
-                    PortfolioSnapshot.paper_trading == paper_trading
-                )
-            ).order_by(
-                PortfolioSnapshot.snapshot_time
-            )
-            
-            result = await self.db.execute(query)
-            snapshots = result.scalars().all()
+            values = await self._daily_portfolio_values(cutoff_date, paper_trading)
             
-            if not snapshots or len(snapshots) < 2:
+            if len(values) < 2:
                 return {
                     "total_return": 0.0,
                     "daily_returns": [],
@@ -257,7 +250,6 @@ class AnalyticsService:
                 }
             
             # Calculate returns
-            values = [float(s.total_value) for s in snapshots]
             initial_value = values[0]
             final_value = values[-1]
             total_return = ((final_value - initial_value) / initial_value) if initial_value > 0 else 0.0
@@ -300,6 +292,49 @@ class AnalyticsService:
             logger.error("Failed to calculate portfolio metrics", error=str(e))
             return {"total_return": 0.0, "sharpe_ratio": 0.0, "max_drawdown": 0.0}
 
+    async def _daily_portfolio_values(self, cutoff_date: datetime, paper_trading: bool) -> List[float]:
+        """
+        Get end-of-day portfolio values since cutoff_date, oldest first.
+
+        Reads mv_portfolio_daily; falls back to bucketing raw snapshots if the
+        view has not been created (migrations/012_portfolio_daily_mv.sql).
+        """
+        try:
+            result = await self.db.execute(
+                select(mv_portfolio_daily.c.close_value)
+                .where(
+                    and_(
+                        mv_portfolio_daily.c.day >= func.date_trunc("day", cutoff_date),
+                        mv_portfolio_daily.c.paper_trading == paper_trading,
+                    )
+                )
+                .order_by(mv_portfolio_daily.c.day)
+            )
+            return [float(value) for value in result.scalars().all()]
+        except ProgrammingError as e:
+            logger.debug("mv_portfolio_daily unavailable, using raw snapshots", error=str(e))
+            await self.db.rollback()
+
+        result = await self.db.execute(
+            # Epoch computed inline: this fallback must not need migration 027's ts_epoch column
+            select(func.extract("epoch", PortfolioSnapshot.snapshot_time), PortfolioSnapshot.total_value)
+            .where(
+                and_(
+                    PortfolioSnapshot.snapshot_time >= cutoff_date,
+                    PortfolioSnapshot.paper_trading == paper_trading
+                )
+            )
+            .order_by(PortfolioSnapshot.snapshot_time)
+        )
+        rows = result.all()
+        if not rows:
+            return []
+        epochs, values = np.array(rows, dtype=np.float64).T
+        # Last snapshot of each UTC day wins
+        days = epochs.astype(np.int64) // 86400
+        last_of_day = np.append(days[1:] != days[:-1], True)
+        return values[last_of_day].tolist()
+
     async def get_signal_strength_performance(self, days: int = 30) -> Dict:
         """
         Get performance by signal strength.
@@ -315,7 +350,7 @@ class AnalyticsService:
             
             query = select(Signal).where(
                 Signal.created_at >= cutoff_date
-            )
+            ).options(selectinload(Signal.trades))
             
             result = await self.db.execute(query)
             signals = result.scalars().all()
@@ -6,12 +6,12 @@ Fetches and matches economic events to Polymarket markets.
 import re
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from decimal import Decimal
 from sqlalchemy import select, update, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..utils.logging import get_logger
 from ..utils.datetime_utils import now_naive_utc
+from ..database.connection import bulk_insert
 from ..database.models import EconomicEvent, MarketEvent, EventAlert, EventMarketImpact, Market
 
 logger = get_logger(__name__)
@@ -227,62 +227,61 @@ class EconomicCalendar:
         )
         events = result.scalars().all()
         
-        # Get active markets
+        # Get active markets (only the columns used for matching)
         markets_result = await self.db.execute(
-            select(Market).where(
+            select(Market.market_id, Market.question, Market.category).where(
                 Market.resolution_date.is_(None)
             )
         )
-        markets = markets_result.scalars().all()
-        
-        matched_count = 0
+        # Combine question and category for matching
+        market_texts = {
+            row.market_id: ((row.question or '') + ' ' + (row.category or '')).lower()
+            for row in markets_result
+        }
         
+        # Existing relationships for these events, fetched once instead of per pair
+        existing_result = await self.db.execute(
+            select(MarketEvent.market_id, MarketEvent.event_id).where(
+                MarketEvent.event_id.in_([event.id for event in events])
+            )
+        )
+        existing = {tuple(row) for row in existing_result}
+        
+        # Relevance depends only on the event type's keywords: score each market once per type
+        relevant_by_type: Dict[str, Dict[str, float]] = {}
+        for event_type in {event.event_type for event in events}:
+            event_keywords = self.EVENT_KEYWORDS.get(event_type, [])
+            relevant_by_type[event_type] = {
+                market_id: relevance
+                for market_id, market_text in market_texts.items()
+                if (relevance := self._calculate_relevance(market_text, event_keywords)) >= 0.3  # 30% relevance threshold
+            }
+        
+        rows = []
         for event in events:
-            event_keywords = self.EVENT_KEYWORDS.get(event.event_type, [])
-            
-            for market in markets:
-                # Combine question and category for matching
-                market_text = (
-                    (market.question or '') + ' ' + 
-                    (market.category or '')
-                ).lower()
-                
-                # Calculate relevance score
-                relevance = self._calculate_relevance(market_text, event_keywords)
+            for market_id, relevance in relevant_by_type[event.event_type].items():
+                if (market_id, event.id) in existing:
+                    continue  # Relationship already exists
                 
-                if relevance >= 0.3:  # 30% relevance threshold
-                    try:
-                        # Check if relationship already exists
-                        existing = await self.db.execute(
-                            select(MarketEvent).where(
-                                MarketEvent.market_id == market.market_id,
-                                MarketEvent.event_id == event.id
-                            )
-                        )
-                        if existing.scalar_one_or_none():
-                            continue  # Relationship already exists
-                        
-                        # Generate impact prediction
-                        impact = self._predict_impact(event.event_type, market_text)
-                        
-                        # Create market-event relationship
-                        market_event = MarketEvent(
-                            market_id=market.market_id,
-                            event_id=event.id,
-                            relevance_score=Decimal(str(relevance)),
-                            impact_prediction=impact
-                        )
-                        self.db.add(market_event)
-                        matched_count += 1
-                    except Exception as e:
-                        logger.error(f"Failed to match market to event: {e}", exc_info=True)
-        
+                # Generate impact prediction
+                impact = self._predict_impact(event.event_type, market_texts[market_id])
+                rows.append({
+                    "market_id": market_id,
+                    "event_id": event.id,
+                    "relevance_score": relevance,
+                    "impact_prediction": impact,
+                })
+        
+        matched_count = len(rows)
         try:
+            # One multi-row insert; pairs created concurrently are skipped
+            await bulk_insert(self.db, MarketEvent, rows, conflict_cols=["market_id", "event_id"])
             await self.db.commit()
             logger.info(f"✅ Created {matched_count} market-event relationships")
         except Exception as e:
             logger.error(f"Failed to commit market-event relationships: {e}")
             await self.db.rollback()
+            matched_count = 0
         
         return matched_count
     
@@ -318,9 +317,10 @@ class EconomicCalendar:
     async def get_upcoming_events(
         self,
         days: int = 30,
-        event_types: Optional[List[str]] = None
+        event_types: Optional[List[str]] = None,
+        search: Optional[str] = None
     ) -> List[Dict]:
-        """Get upcoming economic events within next N days"""
+        """Get upcoming economic events within next N days, optionally matching search keywords"""
         cutoff_date = now_naive_utc() + timedelta(days=days)
         
         # MarketEvent is already imported at top of file
@@ -344,6 +344,8 @@ class EconomicCalendar:
         
         if event_types:
             query = query.where(EconomicEvent.event_type.in_(event_types))
+        if search:
+            query = query.where(EconomicEvent.search_tsv.match(search, postgresql_regconfig='english'))
         
         query = query.group_by(EconomicEvent.id).order_by(EconomicEvent.event_date.asc())
         
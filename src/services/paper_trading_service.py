@@ -13,6 +13,9 @@ from ..utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# pg_advisory_xact_lock key serializing paper portfolio snapshot writers
+_PAPER_PORTFOLIO_LOCK = 0x50415045
+
 
 class PaperTradingService:
     """Service for managing paper trading (virtual portfolio)."""
@@ -76,11 +79,12 @@ class PaperTradingService:
             )
             
             self.db.add(trade)
-            await self.db.commit()
-            await self.db.refresh(trade)
+            await self.db.flush()
             
-            # Update portfolio
+            # Update portfolio in the same transaction as the trade
             await self._update_paper_portfolio()
+            await self.db.commit()
+            await self.db.refresh(trade)
             
             logger.info("Paper trade created", trade_id=trade.id, market_id=signal.market_id, size=size)
             return trade
@@ -123,12 +127,13 @@ class PaperTradingService:
             trade.pnl = Decimal(str(pnl))
             trade.status = "CLOSED"
             trade.exit_time = datetime.now(timezone.utc).replace(tzinfo=None)
+            await self.db.flush()
             
+            # Update portfolio in the same transaction, so the close and its
+            # realized P&L are committed (or rolled back) together
+            await self._update_paper_portfolio(realized_delta=Decimal(str(pnl)))
             await self.db.commit()
             
-            # Update portfolio
-            await self._update_paper_portfolio()
-            
             logger.info("Paper trade closed", trade_id=trade.id, pnl=pnl)
             return True
         except Exception as e:
@@ -162,66 +167,85 @@ class PaperTradingService:
             await self.db.rollback()
             raise
 
-    async def _update_paper_portfolio(self):
-        """Update paper trading portfolio snapshot."""
-        try:
-            # Get all open paper trades
-            query = select(Trade).where(
-                Trade.paper_trading == True,
-                Trade.status == "OPEN"
-            )
-            result = await self.db.execute(query)
-            open_trades = result.scalars().all()
-            
-            # Get all closed paper trades
-            query = select(Trade).where(
+    async def _realized_pnl_total(self) -> Decimal:
+        """Sum realized P&L over all closed paper trades (ground truth, O(closed trades))."""
+        result = await self.db.execute(
+            select(func.coalesce(func.sum(Trade.pnl), 0)).where(
                 Trade.paper_trading == True,
                 Trade.status == "CLOSED"
             )
-            result = await self.db.execute(query)
-            closed_trades = result.scalars().all()
-            
-            # Calculate portfolio values
-            positions_value = Decimal("0")
-            unrealized_pnl = Decimal("0")
-            realized_pnl = sum(Decimal(str(t.pnl or 0)) for t in closed_trades)
-            
-            # For open trades, calculate unrealized P&L (simplified - would need current prices)
-            # For now, just use entry prices
-            for trade in open_trades:
-                positions_value += Decimal(str(trade.size))
-            
-            # Get latest portfolio or initialize
-            portfolio = await self.get_paper_portfolio()
-            if not portfolio:
-                portfolio = await self._initialize_paper_portfolio()
-            
-            # Calculate new values
-            initial_cash = self.initial_capital
-            cash_used = sum(Decimal(str(t.size)) for t in open_trades)
-            cash = initial_cash - cash_used + realized_pnl  # Simplified calculation
-            
-            total_value = cash + positions_value + unrealized_pnl
-            
-            # Create new snapshot
-            snapshot = PortfolioSnapshot(
-                snapshot_time=datetime.now(timezone.utc).replace(tzinfo=None),
-                total_value=total_value,
-                cash=cash,
-                positions_value=positions_value,
-                total_exposure=positions_value,
-                daily_pnl=total_value - portfolio.total_value if portfolio else Decimal("0"),
-                unrealized_pnl=unrealized_pnl,
-                realized_pnl=realized_pnl,
-                paper_trading=True
-            )
-            
-            self.db.add(snapshot)
-            await self.db.commit()
-            
-            logger.debug("Paper portfolio updated", total_value=float(total_value), cash=float(cash))
-        except Exception as e:
-            logger.error("Failed to update paper portfolio", error=str(e))
-            await self.db.rollback()
-
+        )
+        return Decimal(str(result.scalar_one()))
 
+    async def _update_paper_portfolio(self, realized_delta: Decimal = Decimal("0")) -> None:
+        """
+        Add a paper trading portfolio snapshot in the caller's transaction.
+        
+        Realized P&L is carried forward from the latest snapshot plus
+        realized_delta (the P&L of a trade just closed), so a close no longer
+        re-reads every closed trade. The first snapshot, and the first one of
+        each UTC day, is instead reset from the closed trades themselves, so
+        any drift in the carried total is corrected at least daily.
+        
+        Writers are serialized on a transaction-level advisory lock, so two
+        concurrent closes never carry forward from the same snapshot. The
+        caller commits, or rolls back on error.
+        
+        Args:
+            realized_delta: P&L realized since the latest snapshot
+        """
+        await self.db.execute(select(func.pg_advisory_xact_lock(_PAPER_PORTFOLIO_LOCK)))
+        
+        # Open paper positions, aggregated in the database
+        query = select(func.coalesce(func.sum(Trade.size), 0)).where(
+            Trade.paper_trading == True,
+            Trade.status == "OPEN"
+        )
+        result = await self.db.execute(query)
+        open_size = Decimal(str(result.scalar_one()))
+        
+        # For open trades, calculate unrealized P&L (simplified - would need current prices)
+        # For now, just use entry prices
+        positions_value = open_size
+        unrealized_pnl = Decimal("0")
+        
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+        portfolio = await self.get_paper_portfolio()
+        if portfolio and portfolio.snapshot_time.date() == now.date():
+            realized_pnl = Decimal(str(portfolio.realized_pnl or 0)) + realized_delta
+        else:
+            # Reconcile against ground truth (includes the trade just closed)
+            realized_pnl = await self._realized_pnl_total()
+            if portfolio:
+                carried = Decimal(str(portfolio.realized_pnl or 0)) + realized_delta
+                if abs(carried - realized_pnl) > Decimal("0.01"):
+                    logger.warning(
+                        "Paper realized P&L drifted, reset from closed trades",
+                        carried=float(carried),
+                        actual=float(realized_pnl),
+                    )
+        
+        # Calculate new values
+        initial_cash = self.initial_capital
+        cash_used = open_size
+        cash = initial_cash - cash_used + realized_pnl  # Simplified calculation
+        
+        total_value = cash + positions_value + unrealized_pnl
+        previous_value = Decimal(str(portfolio.total_value)) if portfolio else self.initial_capital
+        
+        # Create new snapshot
+        snapshot = PortfolioSnapshot(
+            snapshot_time=now,
+            total_value=total_value,
+            cash=cash,
+            positions_value=positions_value,
+            total_exposure=positions_value,
+            daily_pnl=total_value - previous_value,
+            unrealized_pnl=unrealized_pnl,
+            realized_pnl=realized_pnl,
+            paper_trading=True
+        )
+        
+        self.db.add(snapshot)
+        
+        logger.debug("Paper portfolio updated", total_value=float(total_value), cash=float(cash))
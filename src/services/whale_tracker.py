@@ -9,11 +9,12 @@ from datetime import datetime, timedelta
 from typing import List, Dict, Optional
 from decimal import Decimal
 import aiohttp
-from sqlalchemy import select, update
+from sqlalchemy import case, func, null, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..utils.logging import get_logger
 from ..utils.datetime_utils import now_naive_utc
+from ..database.connection import bulk_insert
 from ..database.models import WhaleWallet, WhaleTrade, WhaleAlert
 
 logger = get_logger(__name__)
@@ -195,11 +196,18 @@ class WhaleTracker:
         """Index discovered whales into database"""
         logger.info(f"💾 Indexing {len(whales)} whales...")
         
-        indexed_count = 0
+        # One upsert row per wallet; first (best-ranked) occurrence wins
+        rows: Dict[str, Dict] = {}
+        now = now_naive_utc()
         
         for rank, whale_data in enumerate(whales, start=1):
             try:
                 wallet_address = whale_data['id'].lower()
+                if wallet_address in rows:
+                    continue
+                # Stored as 20 raw bytes: reject malformed ids here, not in the batch insert
+                if len(bytes.fromhex(wallet_address.removeprefix('0x'))) != 20:
+                    raise ValueError(f"Not a wallet address: {wallet_address}")
                 
                 # Calculate win rate based on profit/volume
                 win_rate = Decimal('0.5')  # Default 50%
@@ -212,57 +220,79 @@ class WhaleTracker:
                     # Normalize to 0.45-0.75 range based on profit ratio
                     win_rate = min(Decimal('0.75'), Decimal('0.45') + (profit_ratio * Decimal('3')))
                 
-                # Get or create whale wallet
-                result = await self.db.execute(
-                    select(WhaleWallet).where(WhaleWallet.wallet_address == wallet_address)
-                )
-                whale = result.scalar_one_or_none()
-                
-                if whale:
-                    # Update existing whale
-                    await self.db.execute(
-                        update(WhaleWallet)
-                        .where(WhaleWallet.id == whale.id)
-                        .values(
-                            total_volume=Decimal(str(whale_data.get('volumeTraded', 0))),
-                            total_trades=int(whale_data.get('numTrades', 0)),
-                            total_profit=Decimal(str(whale_data.get('realizedProfit', 0))),
-                            win_rate=win_rate,
-                            rank=rank,
-                            last_activity_at=now_naive_utc(),
-                            updated_at=now_naive_utc(),
-                            is_active=True
-                        )
-                    )
-                else:
-                    # Create new whale
-                    whale = WhaleWallet(
-                        wallet_address=wallet_address,
-                        nickname=f"Whale #{rank}",
-                        total_volume=Decimal(str(whale_data.get('volumeTraded', 0))),
-                        total_trades=int(whale_data.get('numTrades', 0)),
-                        total_profit=Decimal(str(whale_data.get('realizedProfit', 0))),
-                        win_rate=win_rate,
-                        rank=rank,
-                        is_active=True,
-                        first_seen_at=now_naive_utc(),
-                        last_activity_at=now_naive_utc()
-                    )
-                    self.db.add(whale)
-                
-                indexed_count += 1
+                rows[wallet_address] = {
+                    "wallet_address": wallet_address,
+                    "nickname": f"Whale #{rank}",
+                    "total_volume": volume,
+                    "total_trades": int(whale_data.get('numTrades', 0)),
+                    "total_profit": profit,
+                    "win_rate": win_rate,
+                    "is_active": True,
+                    "first_seen_at": now,
+                    "last_activity_at": now,
+                    "updated_at": now,
+                }
                 
             except Exception as e:
-                logger.error(f"Failed to index whale {wallet_address}: {e}", exc_info=True)
+                logger.error(f"Failed to index whale {whale_data.get('id')}: {e}", exc_info=True)
+        
+        if not rows:
+            return 0
         
         try:
+            # Existing wallets keep their nickname and first_seen_at
+            await bulk_insert(
+                self.db,
+                WhaleWallet,
+                list(rows.values()),
+                conflict_cols=["wallet_address"],
+                update_cols=[
+                    "total_volume",
+                    "total_trades",
+                    "total_profit",
+                    "win_rate",
+                    "is_active",
+                    "last_activity_at",
+                    "updated_at",
+                ],
+            )
+            await self.reassign_ranks()
             await self.db.commit()
-            logger.info(f"✅ Indexed {indexed_count} whales")
+            logger.info(f"✅ Indexed {len(rows)} whales")
         except Exception as e:
             logger.error(f"Failed to commit whales: {e}")
             await self.db.rollback()
+            return 0
         
-        return indexed_count
+        return len(rows)
+    
+    async def reassign_ranks(self) -> None:
+        """
+        Re-rank all whales by total volume in one windowed UPDATE.
+
+        Active whales get dense ranks 1..n (volume descending); inactive whales
+        get NULL. Only rows whose rank changes are written. Caller commits.
+
+        Ranks follow total_volume, not total_profit, on purpose: rank has always
+        been the discovery leaderboard position, which is sorted by volume, and
+        get_whale_leaderboard() orders by it. Inactive whales are partitioned off
+        so they never take positions from active ones.
+        """
+        position = func.row_number().over(
+            partition_by=WhaleWallet.is_active,
+            order_by=(WhaleWallet.total_volume.desc(), WhaleWallet.id),
+        )
+        ranked = select(
+            WhaleWallet.id,
+            case((WhaleWallet.is_active, position), else_=null()).label("new_rank"),
+        ).subquery()
+        await self.db.execute(
+            update(WhaleWallet)
+            .where(WhaleWallet.id == ranked.c.id)
+            .where(WhaleWallet.rank.is_distinct_from(ranked.c.new_rank))
+            .values(rank=ranked.c.new_rank)
+            .execution_options(synchronize_session=False)
+        )
     
     async def monitor_whale_trades(self, whale_addresses: List[str]) -> List[Dict]:
         """
@@ -318,7 +348,6 @@ class WhaleTracker:
             # Insert trade
             trade = WhaleTrade(
                 whale_id=whale.id,
-                wallet_address=trade_data['user'].lower(),
                 market_id=trade_data['market']['id'],
                 market_question=trade_data['market'].get('question', ''),
                 trade_type=trade_data['type'],
@@ -3,6 +3,43 @@
 from datetime import datetime, timezone
 from typing import Optional
 
+# ciso8601 is a C ISO-8601 parser, much faster than datetime.fromisoformat
+try:
+    import ciso8601
+    CISO8601_AVAILABLE = True
+except ImportError:
+    CISO8601_AVAILABLE = False
+
+
+def parse_iso_datetime(value: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp, including a trailing "Z" for UTC.
+    
+    Uses ciso8601 when installed and falls back to datetime.fromisoformat.
+    Offset-less input yields a naive datetime, as with fromisoformat.
+    
+    Args:
+        value: ISO-8601 string
+        
+    Returns:
+        Parsed datetime
+        
+    Raises:
+        ValueError: If the string is not valid ISO-8601
+        TypeError: If value is not a string
+        
+    Examples:
+        >>> parse_iso_datetime("2024-11-05T00:00:00Z").tzinfo is not None
+        True
+    """
+    if CISO8601_AVAILABLE:
+        return ciso8601.parse_datetime(value)
+    if not isinstance(value, str):
+        raise TypeError(f"Expected ISO-8601 string, got {type(value).__name__}")
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
 
 def make_naive_utc(dt: Optional[datetime]) -> Optional[datetime]:
     """
@@ -41,4 +41,14 @@ def get_logger(name: str) -> Any:
     return structlog.get_logger(name)
 
 
+def is_debug_enabled() -> bool:
+    """Return True if DEBUG-level log calls will be emitted.
+
+    Use this to guard expensive debug payload construction in hot loops,
+    since structlog evaluates keyword arguments even when the call is filtered.
+    """
+    level = logging.getLevelName(get_settings().log_level.upper())
+    return isinstance(level, int) and level <= logging.DEBUG
+
+
 